@@ -1,20 +1,29 @@
 # ai.py
 from board import BLACK, WHITE
-import copy
-from board import BOARD_SIZE
+import math
+import time
+from board import (
+    BOARD_SIZE, FULL_MASK, POSITION_WEIGHTS, CORNER_SQUARES, INVERSE_SYMMETRY,
+    iter_squares, neighbour_mask, stable_discs, transform_move,
+)
+from transposition import EXACT, LOWER, UPPER
+from endgame import EndgameSolver
+from patterns import evaluate_pattern
 
 INF = float('inf')
 
-POSITION_WEIGHTS = [
-    [100, -20, 10,  5,  5, 10, -20, 100],
-    [-20, -50, -2, -2, -2, -2, -50, -20],
-    [ 10,  -2,  5,  1,  1,  5,  -2,  10],
-    [  5,  -2,  1,  0,  0,  1,  -2,   5],
-    [  5,  -2,  1,  0,  0,  1,  -2,   5],
-    [ 10,  -2,  5,  1,  1,  5,  -2,  10],
-    [-20, -50, -2, -2, -2, -2, -50, -20],
-    [100, -20, 10,  5,  5, 10, -20, 100],
-]
+# Bu kadar ya da daha az boş kare kaldığında kökte heuristic arama yerine kesin çözücü
+# kullanılır (None: kapalı). 12 boş kare Python'da genelde bir saniyenin altında çözülüyor.
+ENDGAME_EMPTIES = 12
+
+# Süreli aramada kesin çözücüden önce bu derinliğe kadar heuristic arama yapılır; çözüm süreye
+# sığmazsa bu sonuç döner
+ENDGAME_FALLBACK_DEPTH = 4
+
+
+class SearchTimeout(Exception):
+    """Arama süresi dolduğunda minimax içinden fırlatılır."""
+
 
 def evaluate_h1(board, player_tile):
     """Heuristic 1: Oyuncu Taşları - Rakip Taşları"""
@@ -37,30 +46,16 @@ def evaluate_h2(board, player_tile):
     Tahtadaki her taş için:
     - Benim taşım ise o karenin ağırlığını ekle,
     - Rakibin taşı ise o karenin ağırlığını çıkar.
+    Toplamlar Board tarafından hamle/geri alma sırasında artımlı tutuluyor.
     """
-    opponent_tile = WHITE if player_tile == BLACK else BLACK
-
-    score = 0
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            tile = board.grid[r][c]
-            if tile == player_tile:
-                score += POSITION_WEIGHTS[r][c]
-            elif tile == opponent_tile:
-                score -= POSITION_WEIGHTS[r][c]
-            # EMPTY ('.') ise 0 eklenir, yani etkisiz
-
-    return score
+    return positional_score(board, player_tile)
 
 def evaluate_h3(board, player_tile):
     """
     Heuristic 3: Hareketlilik (Mobility)
     = (Benim geçerli hamlelerim) - (Rakibin geçerli hamleleri), normalize edilmiş.
     """
-    opponent_tile = WHITE if player_tile == BLACK else BLACK
-
-    my_moves = len(board.get_valid_moves(player_tile))
-    opponent_moves = len(board.get_valid_moves(opponent_tile))
+    my_moves, opponent_moves = move_counts(board, player_tile)
 
     # İkimizin de hamlesi yoksa konum mobilite açısından nötr
     if my_moves + opponent_moves == 0:
@@ -87,7 +82,7 @@ def evaluate_hybrid(board, player_tile):
     total_discs = black + white
 
     # Bileşenler
-    parity = coin_parity(board, player_tile)
+    parity = disc_parity(black, white, player_tile)
     mob = mobility(board, player_tile)
     pos = positional_score(board, player_tile)
 
@@ -118,22 +113,18 @@ def evaluate_ultimate(board, player_tile):
     - Potential mobility (adjacent empties pressure)
     - Corner control
     - Corner danger (X/C squares when corner is empty)
-    - Stability (cheap corner/edge-anchored approximation)
+    - Stability (stable discs: edges exactly, interior via full lines + flood fill)
     - Frontier penalty (discs adjacent to empties are weak)
     - Positional weights (early/mid)
     - Coin parity / disc difference (late)
 
     Uses:
-      - board.grid (8x8)
-      - EMPTY = '.'
+      - board.black / board.white bitboards
+      - board.py square tables (CORNER_SQUARES) and stable_discs
       - BLACK/WHITE constants
       - BOARD_SIZE
     """
 
-    opponent_tile = WHITE if player_tile == BLACK else BLACK
-    grid = board.grid
-    EMPTY = '.'
-
     # -------------------- Phase detection --------------------
     black, white = board.get_score()
     total_discs = black + white
@@ -141,8 +132,7 @@ def evaluate_ultimate(board, player_tile):
 
     # -------------------- Core components --------------------
     # Mobility (normalized -100..100 like your evaluate_h3)
-    my_moves = len(board.get_valid_moves(player_tile))
-    opp_moves = len(board.get_valid_moves(opponent_tile))
+    my_moves, opp_moves = move_counts(board, player_tile)
     if my_moves + opp_moves == 0:
         M = 0.0
     else:
@@ -156,43 +146,21 @@ def evaluate_ultimate(board, player_tile):
     C = 25.0 * (my_corners - opp_corners)
 
     # Coin parity (your existing definition: disc diff normalized)
-    D = coin_parity(board, player_tile)
+    D = disc_parity(black, white, player_tile)
 
     # -------------------- Extra components (implemented here) --------------------
-    directions8 = [(-1,-1), (-1,0), (-1,1),
-                   ( 0,-1),         ( 0,1),
-                   ( 1,-1), ( 1,0), ( 1,1)]
-
-    def in_bounds(r, c):
-        return 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE
+    if player_tile == BLACK:
+        own, opp = board.black, board.white
+    else:
+        own, opp = board.white, board.black
+    empty = ~(own | opp) & FULL_MASK
 
     # Potential mobility:
     # We count empty squares adjacent to opponent discs minus empty squares adjacent to my discs,
     # then invert so "higher is better for us".
     def potential_mobility():
-        my_adj = 0
-        opp_adj = 0
-
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if grid[r][c] != EMPTY:
-                    continue
-
-                adj_my = False
-                adj_opp = False
-                for dr, dc in directions8:
-                    rr, cc = r + dr, c + dc
-                    if not in_bounds(rr, cc):
-                        continue
-                    if grid[rr][cc] == player_tile:
-                        adj_my = True
-                    elif grid[rr][cc] == opponent_tile:
-                        adj_opp = True
-
-                if adj_my:
-                    my_adj += 1
-                if adj_opp:
-                    opp_adj += 1
+        my_adj = (empty & neighbour_mask(own)).bit_count()
+        opp_adj = (empty & neighbour_mask(opp)).bit_count()
 
         # if opp has many adjacent empties, it's bad (they'll have mobility),
         # so return negative of that difference.
@@ -201,99 +169,43 @@ def evaluate_ultimate(board, player_tile):
     PM = potential_mobility()
 
     # Frontier: discs adjacent to empties are frontier (weak).
-    # We return (oppFrontier - myFrontier) so higher is better for us.
-    def frontier_score():
-        def is_frontier(r, c):
-            for dr, dc in directions8:
-                rr, cc = r + dr, c + dc
-                if in_bounds(rr, cc) and grid[rr][cc] == EMPTY:
-                    return True
-            return False
-
-        my_f = 0
-        opp_f = 0
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                if grid[r][c] == player_tile and is_frontier(r, c):
-                    my_f += 1
-                elif grid[r][c] == opponent_tile and is_frontier(r, c):
-                    opp_f += 1
-        return float(opp_f - my_f)
-
-    F = frontier_score()
+    # (oppFrontier - myFrontier) so higher is better for us.
+    my_f, opp_f = frontier_counts(board, player_tile)
+    F = float(opp_f - my_f)
 
     # Corner danger: X-square + C-squares penalties if corner is empty
     def corner_danger():
         score = 0.0
-        corner_specs = [
-            # corner, X, C-squares
-            ((0, 0), (1, 1), [(0, 1), (1, 0)]),
-            ((0, 7), (1, 6), [(0, 6), (1, 7)]),
-            ((7, 0), (6, 1), [(6, 0), (7, 1)]),
-            ((7, 7), (6, 6), [(6, 7), (7, 6)]),
-        ]
-
-        for (cr, cc), (xr, xc), cs in corner_specs:
-            if grid[cr][cc] != EMPTY:
+        for corner, x_square, c_squares in CORNER_SQUARES:
+            if not empty & corner:
                 continue  # corner taken -> danger mostly gone
 
             # X-square is very risky while corner is empty
-            if grid[xr][xc] == player_tile:
+            if own & x_square:
                 score -= 12.0
-            elif grid[xr][xc] == opponent_tile:
+            elif opp & x_square:
                 score += 12.0
 
             # C-squares are also risky
-            for rr, cc2 in cs:
-                if grid[rr][cc2] == player_tile:
-                    score -= 8.0
-                elif grid[rr][cc2] == opponent_tile:
-                    score += 8.0
+            score -= 8.0 * (own & c_squares).bit_count()
+            score += 8.0 * (opp & c_squares).bit_count()
 
         return score
 
     CD = corner_danger()
 
-    # Stability (cheap approximation):
-    # count discs that are continuous from owned corners along edges.
-    # returns normalized-ish [-100..100]
-    def stability_approx():
-        corners = [(0, 0), (0, 7), (7, 0), (7, 7)]
-
-        def stable_from_corner(cr, cc, who):
-            if grid[cr][cc] != who:
-                return 0
-
-            cnt = 1  # corner itself
-            if (cr, cc) == (0, 0):
-                edge_dirs = [(0, 1), (1, 0)]
-            elif (cr, cc) == (0, 7):
-                edge_dirs = [(0, -1), (1, 0)]
-            elif (cr, cc) == (7, 0):
-                edge_dirs = [(0, 1), (-1, 0)]
-            else:
-                edge_dirs = [(0, -1), (-1, 0)]
-
-            for dr, dc in edge_dirs:
-                r, c = cr + dr, cc + dc
-                while in_bounds(r, c) and grid[r][c] == who:
-                    cnt += 1
-                    r += dr
-                    c += dc
-            return cnt
-
-        my_s = 0
-        opp_s = 0
-        for cr, cc in corners:
-            my_s += stable_from_corner(cr, cc, player_tile)
-            opp_s += stable_from_corner(cr, cc, opponent_tile)
+    # Stability: discs that can never be flipped again (board.stable_discs).
+    # returns normalized-ish [-100..100]; opening weight is 0, so it is skipped there
+    def stability():
+        my_s = stable_discs(own, opp).bit_count()
+        opp_s = stable_discs(opp, own).bit_count()
 
         denom = my_s + opp_s
         if denom == 0:
             return 0.0
         return 100.0 * (my_s - opp_s) / (denom + 1.0)
 
-    S = stability_approx()
+    S = stability() if empties <= 44 else 0.0
 
     # -------------------- Phase-aware weights --------------------
     # Opening: empties > 44
@@ -321,6 +233,17 @@ def evaluate_ultimate(board, player_tile):
 
 
 
+# İsimle seçim için (main menüsü, turnuva ve benchmark scriptleri)
+HEURISTICS = {
+    'h1': evaluate_h1,
+    'h2': evaluate_h2,
+    'h3': evaluate_h3,
+    'hybrid': evaluate_hybrid,
+    'ultimate': evaluate_ultimate,
+    'pattern': evaluate_pattern,
+}
+
+
 # -------------- ESKİ HEURİSTİKLER --------------
 
 
@@ -386,32 +309,95 @@ def order_moves(board, moves, tile):
 
 
 
-def minimax(board, depth, alpha, beta, maximizing_player, player_tile, heuristic_func):
+def minimax(board, depth, alpha, beta, maximizing_player, player_tile, heuristic_func, tt=None,
+            stop=None, stats=None, first_move=None, unique_moves=False, orderer=None, ply=0):
+    # stop: True dönerse arama SearchTimeout ile kesilir (tahta yarım kalır, kopya üzerinde arayın)
+    # stats: isteğe bağlı SearchStats; None ise sayım yapılmaz
+    # first_move: varsa önce denenir (iterative deepening'de önceki iterasyonun en iyi hamlesi)
+    # unique_moves: kökte True verilir; pozisyon simetrikse birbirinin simetriği hamlelerden sadece ilki aranır
+    # orderer: isteğe bağlı ordering.py sıralayıcısı (None ise order_moves); ply: kökten uzaklık
     
     opponent_tile = WHITE if player_tile == BLACK else BLACK
     current_tile = player_tile if maximizing_player else opponent_tile
 
-    # Oyun bitmişse veya derinlik sıfırsa skor döndür
-    if depth == 0 or (not board.has_valid_move(BLACK) and not board.has_valid_move(WHITE)):
+    # Derinlik sıfırsa skor döndür
+    if depth == 0:
+        if stats is not None:
+            stats.nodes += 1
+            return _timed_eval(board, player_tile, heuristic_func, stats), None
         return heuristic_func(board, player_tile), None
 
-    valid_moves = board.get_valid_moves(current_tile)
+    if stop is not None and stop():
+        raise SearchTimeout()
+
+    if stats is not None:
+        stats.nodes += 1
+        start = time.perf_counter()
+
+    # İki tarafın hamleleri tek seferde; pas ve mobility heuristikleri aynı sonucu kullanır
+    black_moves, white_moves = board.get_moves_both()
+
+    if stats is not None:
+        stats.movegen_time += time.perf_counter() - start
+
+    # Oyun bitmişse skor döndür
+    if not black_moves and not white_moves:
+        if stats is not None:
+            return _timed_eval(board, player_tile, heuristic_func, stats), None
+        return heuristic_func(board, player_tile), None
+
+    # Transposition table: aynı pozisyon daha önce yeterli derinlikte arandıysa kullan
+    tt_move = None
+    if tt is not None:
+        # sym: simetrik tabloda tahtayı kanonik hale getiren simetri, hamleler tabloda o yönde durur
+        key, sym = tt.key(board, current_tile, player_tile)
+        entry = tt.probe(key)
+        if entry is not None:
+            _, entry_depth, flag, entry_score, tt_move, _ = entry
+            tt_move = transform_move(tt_move, INVERSE_SYMMETRY[sym])
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return entry_score, tt_move
+                if flag == LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if beta <= alpha:
+                    return entry_score, tt_move
+        # Bound tipi bu pencereye göre belirlenir
+        alpha_orig, beta_orig = alpha, beta
+
+    moves_mask = black_moves if current_tile == BLACK else white_moves
 
     # PAS DURUMU → sıra rakibe geçer, depth aynı kalır
-    if not valid_moves:
+    if not moves_mask:
+        if stats is not None:
+            stats.pass_nodes += 1
         eval_score, _ = minimax(
             board, depth, alpha, beta,
-            not maximizing_player, player_tile, heuristic_func
+            not maximizing_player, player_tile, heuristic_func, tt, stop, stats,
+            orderer=orderer, ply=ply + 1
         )
+        if tt is not None:
+            _tt_store(tt, key, depth, alpha_orig, beta_orig, eval_score, None)
         return eval_score, None
 
+    if stats is not None:
+        start = time.perf_counter()
+
+    valid_moves = _ordered_moves(board, moves_mask, current_tile, depth, ply, tt_move, first_move,
+                                 unique_moves, orderer)
+
+    if stats is not None:
+        stats.movegen_time += time.perf_counter() - start
+
     best_move = None
 
     # MAX PLAYER (AI kendi açısından en iyi skoru arıyor)
     if maximizing_player:
         max_eval = -INF
 
-        for r, c in order_moves(board, valid_moves, current_tile):
+        for index, (r, c) in enumerate(valid_moves):
 
             # Hamleyi uygula (flip edilenleri geri almak için liste döner)
             flipped = board.apply_move_and_get_flipped(r, c, current_tile)
@@ -419,7 +405,8 @@ def minimax(board, depth, alpha, beta, maximizing_player, player_tile, heuristic
             # Çocuk düğüm
             eval_score, _ = minimax(
                 board, depth - 1, alpha, beta,
-                False, player_tile, heuristic_func
+                False, player_tile, heuristic_func, tt, stop, stats,
+                orderer=orderer, ply=ply + 1
             )
 
             # UNDO
@@ -433,21 +420,28 @@ def minimax(board, depth, alpha, beta, maximizing_player, player_tile, heuristic
             # Alpha güncellenir
             alpha = max(alpha, eval_score)
             if beta <= alpha:
+                if stats is not None:
+                    stats.record_cutoff(index)
+                if orderer is not None:
+                    orderer.cutoff((r, c), current_tile, depth, ply)
                 break  # pruning
 
+        if tt is not None:
+            _tt_store(tt, key, depth, alpha_orig, beta_orig, max_eval, transform_move(best_move, sym))
         return max_eval, best_move
 
     # MIN PLAYER (rakip en kötü sonucu seçiyor)
     else:
         min_eval = INF
 
-        for r, c in order_moves(board, valid_moves, current_tile):
+        for index, (r, c) in enumerate(valid_moves):
 
             flipped = board.apply_move_and_get_flipped(r, c, current_tile)
 
             eval_score, _ = minimax(
                 board, depth - 1, alpha, beta,
-                True, player_tile, heuristic_func
+                True, player_tile, heuristic_func, tt, stop, stats,
+                orderer=orderer, ply=ply + 1
             )
 
             board.undo_move(r, c, current_tile, flipped)
@@ -459,37 +453,421 @@ def minimax(board, depth, alpha, beta, maximizing_player, player_tile, heuristic
             # Beta güncellenir
             beta = min(beta, eval_score)
             if beta <= alpha:
+                if stats is not None:
+                    stats.record_cutoff(index)
+                if orderer is not None:
+                    orderer.cutoff((r, c), current_tile, depth, ply)
                 break  # pruning
 
+        if tt is not None:
+            _tt_store(tt, key, depth, alpha_orig, beta_orig, min_eval, transform_move(best_move, sym))
         return min_eval, best_move
 
 
-def get_best_move(board, depth, player_tile, heuristic_func=evaluate_h1):
+def root_moves(board, player_tile, depth, tt=None, first_move=None, orderer=None):
+    """
+    Kökte aranacak hamleler, pvs/minimax'ın deneyeceği sırayla: tablodaki en iyi hamle önce,
+    simetrik pozisyonda eşdeğer hamlelerin sadece ilki (kökü kendisi bölen aramalar için, örn. parallel.py).
+    """
+    tt_move = None
+    if tt is not None:
+        key, sym = tt.key(board, player_tile, player_tile)
+        entry = tt.probe(key)
+        if entry is not None:
+            tt_move = transform_move(entry[4], INVERSE_SYMMETRY[sym])
+    moves_mask = board.get_valid_moves_mask(player_tile)
+    return _ordered_moves(board, moves_mask, player_tile, depth, 0, tt_move, first_move, True, orderer)
+
+
+def _ordered_moves(board, moves_mask, tile, depth, ply, tt_move, first_move, unique_moves, orderer):
+    valid_moves = [(sq >> 3, sq & 7) for sq in iter_squares(moves_mask)]
+    if orderer is not None:
+        valid_moves = orderer.order(board, valid_moves, tile, depth, ply)
+    else:
+        valid_moves = order_moves(board, valid_moves, tile)
+
+    # Tablodaki en iyi hamle önce denenir
+    if tt_move is not None and tt_move in valid_moves:
+        valid_moves.remove(tt_move)
+        valid_moves.insert(0, tt_move)
+
+    if first_move is not None and first_move in valid_moves:
+        valid_moves.remove(first_move)
+        valid_moves.insert(0, first_move)
+
+    if unique_moves:
+        valid_moves = symmetry_unique_moves(board, valid_moves)
+    return valid_moves
+
+
+def symmetry_unique_moves(board, moves):
+    # Simetrik pozisyonda eşdeğer hamlelerin skoru aynıdır; sıradaki ilk temsilci kalır
+    symmetries = board.symmetries()
+    if not symmetries:
+        return moves
+
+    seen = set()
+    unique = []
+    for move in moves:
+        if move in seen:
+            continue
+        unique.append(move)
+        seen.update(transform_move(move, k) for k in symmetries)
+    return unique
+
+
+def _timed_eval(board, player_tile, heuristic_func, stats):
+    stats.leaves += 1
+    start = time.perf_counter()
+    score = heuristic_func(board, player_tile)
+    stats.eval_time += time.perf_counter() - start
+    return score
+
+
+def _tt_store(tt, key, depth, alpha, beta, score, move):
+    # Skor arama penceresinin dışındaysa sadece bir sınırdır
+    if score <= alpha:
+        flag = UPPER
+    elif score >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    tt.store(key, depth, flag, score, move)
+
+
+def pvs(board, depth, alpha, beta, current_tile, player_tile, heuristic_func, tt=None,
+        stop=None, stats=None, first_move=None, unique_moves=False, orderer=None, ply=0, probcut=None):
+    """
+    Negamax + Principal Variation Search (NegaScout). Skor sıradaki tarafın açısındandır:
+    sign = 1 (current_tile == player_tile) ya da -1 iken pvs(...)[0] == sign * minimax(...)[0].
+    İlk hamle tam pencereyle, kalanlar boş pencereyle (alpha, nextafter(alpha)) aranır; alpha'yı
+    geçen hamle tam pencereyle yeniden aranır. Fail-soft; minimax ile aynı parametreler.
+    TT'ye skorlar minimax gibi player_tile açısından yazılır, iki arama aynı tabloyu kullanabilir.
+    probcut: isteğe bağlı probcut.ProbCut; kök dışındaki düğümlerde seçici kesme
+    (skor artık o derinliğin kesin minimax değeri değildir).
+    """
+    sign = 1 if current_tile == player_tile else -1
+    other_tile = WHITE if current_tile == BLACK else BLACK
+
+    if depth == 0:
+        if stats is not None:
+            stats.nodes += 1
+            return sign * _timed_eval(board, player_tile, heuristic_func, stats), None
+        return sign * heuristic_func(board, player_tile), None
+
+    if stop is not None and stop():
+        raise SearchTimeout()
+
+    if stats is not None:
+        stats.nodes += 1
+        start = time.perf_counter()
+
+    black_moves, white_moves = board.get_moves_both()
+
+    if stats is not None:
+        stats.movegen_time += time.perf_counter() - start
+
+    if not black_moves and not white_moves:
+        if stats is not None:
+            return sign * _timed_eval(board, player_tile, heuristic_func, stats), None
+        return sign * heuristic_func(board, player_tile), None
+
+    tt_move = None
+    if tt is not None:
+        key, sym = tt.key(board, current_tile, player_tile)
+        entry = tt.probe(key)
+        if entry is not None:
+            _, entry_depth, flag, entry_score, tt_move, _ = entry
+            tt_move = transform_move(tt_move, INVERSE_SYMMETRY[sym])
+            if entry_depth >= depth:
+                # Kayıt player_tile açısından; rakibin sırasıysa işaret ve sınır yönü ters
+                entry_score *= sign
+                if sign < 0 and flag != EXACT:
+                    flag = LOWER if flag == UPPER else UPPER
+                if flag == EXACT:
+                    return entry_score, tt_move
+                if flag == LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if beta <= alpha:
+                    return entry_score, tt_move
+        alpha_orig, beta_orig = alpha, beta
+
+    moves_mask = black_moves if current_tile == BLACK else white_moves
+
+    # Pas: sıra rakibe geçer, depth aynı kalır
+    if not moves_mask:
+        if stats is not None:
+            stats.pass_nodes += 1
+        score, _ = pvs(board, depth, -beta, -alpha, other_tile, player_tile, heuristic_func, tt, stop, stats,
+                       orderer=orderer, ply=ply + 1, probcut=probcut)
+        score = -score
+        if tt is not None:
+            _tt_store(tt, key, depth, *_player_view(alpha_orig, beta_orig, score, sign), None)
+        return score, None
+
+    # Multi-ProbCut: sığ arama alt ağacın pencere dışında kalacağını yüksek olasılıkla söylüyorsa kes
+    if probcut is not None and ply > 0:
+        score = probcut.cut(board, depth, alpha, beta, current_tile, player_tile, heuristic_func, stop, stats)
+        if score is not None:
+            if tt is not None:
+                _tt_store(tt, key, depth, *_player_view(alpha_orig, beta_orig, score, sign), None)
+            return score, None
+
+    if stats is not None:
+        start = time.perf_counter()
+
+    valid_moves = _ordered_moves(board, moves_mask, current_tile, depth, ply, tt_move, first_move,
+                                 unique_moves, orderer)
+
+    if stats is not None:
+        stats.movegen_time += time.perf_counter() - start
+
+    best_score = -INF
+    best_move = None
+
+    for index, (r, c) in enumerate(valid_moves):
+        flipped = board.apply_move_and_get_flipped(r, c, current_tile)
+
+        if index == 0:
+            score, _ = pvs(board, depth - 1, -beta, -alpha, other_tile, player_tile, heuristic_func, tt,
+                           stop, stats, orderer=orderer, ply=ply + 1, probcut=probcut)
+            score = -score
+        else:
+            # Boş pencere: sadece "alpha'dan iyi mi" sorusu
+            null_beta = math.nextafter(alpha, INF)
+            score, _ = pvs(board, depth - 1, -null_beta, -alpha, other_tile, player_tile, heuristic_func, tt,
+                           stop, stats, orderer=orderer, ply=ply + 1, probcut=probcut)
+            score = -score
+            # Yaprakta skor zaten kesin; daha derinde alt sınırdır, tam pencereyle tekrar aranır
+            if alpha < score < beta and depth > 1:
+                if stats is not None:
+                    stats.researches += 1
+                score, _ = pvs(board, depth - 1, -beta, -alpha, other_tile, player_tile, heuristic_func, tt,
+                               stop, stats, orderer=orderer, ply=ply + 1, probcut=probcut)
+                score = -score
+
+        board.undo_move(r, c, current_tile, flipped)
+
+        if score > best_score:
+            best_score = score
+            best_move = (r, c)
+
+        alpha = max(alpha, score)
+        if beta <= alpha:
+            if stats is not None:
+                stats.record_cutoff(index)
+            if orderer is not None:
+                orderer.cutoff((r, c), current_tile, depth, ply)
+            break
+
+    if tt is not None:
+        _tt_store(tt, key, depth, *_player_view(alpha_orig, beta_orig, best_score, sign),
+                  transform_move(best_move, sym))
+    return best_score, best_move
+
+
+def _player_view(alpha, beta, score, sign):
+    # Negamax penceresi ve skoru player_tile açısına çevrilir (rakip sırasında pencere ters döner)
+    if sign > 0:
+        return alpha, beta, score
+    return -beta, -alpha, -score
+
+
+def get_best_move(board, depth, player_tile, heuristic_func=evaluate_h1, tt=None, time_limit=None,
+                  endgame_empties=ENDGAME_EMPTIES, stats=None, book=None, orderer=None, algorithm='pvs',
+                  probcut=None, eval_cache=None, parallel=None):
+    # tt: isteğe bağlı TranspositionTable, aynı heuristic ile hamleler arasında tekrar kullanılabilir
+    # time_limit: saniye; verilirse depth üst sınır olur (None ise sınırsız) ve iterative deepening yapılır
+    # endgame_empties: boş kare sayısı bu değere inince kesin çözücüye geçilir
+    # stats: isteğe bağlı SearchStats, arama sayaçlarını toplar
+    # book: isteğe bağlı book.OpeningBook; pozisyon kitaptaysa arama yapılmaz
+    # orderer: isteğe bağlı hamle sıralayıcı (ordering.make_orderer), hamleler arasında tekrar kullanılabilir
+    # algorithm: 'pvs' (varsayılan) ya da referans 'minimax'; ikisi de aynı skoru ve hamleyi bulur
+    # probcut: isteğe bağlı probcut.ProbCut, seçici arama (sadece 'pvs')
+    # eval_cache: isteğe bağlı eval_cache.EvalCache, heuristic skorlarını hamleler arasında saklar
+    # parallel: isteğe bağlı parallel.ParallelSearcher; sabit derinlikte kök hamleleri işçi süreçlere
+    # dağıtılır (kitap ve kesin çözücü önce denenir; eval_cache ve stats işçilerde kullanılmaz)
+    if time_limit is not None:
+        best_move, _, _ = iterative_deepening(board, player_tile, heuristic_func, depth, time_limit, tt,
+                                              endgame_empties, stats, book, orderer, algorithm,
+                                              probcut=probcut, eval_cache=eval_cache)
+        return best_move
+
+    if book is not None:
+        book_entry = book.lookup(board, player_tile)
+        if book_entry is not None:
+            return book_entry[0]
+
+    if _use_endgame_solver(board, player_tile, endgame_empties):
+        _, best_move = EndgameSolver().solve(board, player_tile)
+        return best_move
+
+    if tt is not None:
+        tt.new_search()
+    if orderer is not None:
+        orderer.new_search()
+    if parallel is not None and algorithm == 'pvs':
+        _, best_move = parallel.search(board, depth, player_tile, heuristic_func, tt, probcut)
+        return best_move
+    if eval_cache is not None:
+        heuristic_func = eval_cache.wrap(heuristic_func)
+
+    if stats is not None:
+        stats.depth = depth
+
     # Kök çağrısında maximizing_player her zaman True
-    _, best_move = minimax(board, depth, -INF, INF, True, player_tile, heuristic_func)
+    _, best_move = _search_root(algorithm, board, depth, -INF, INF, player_tile, heuristic_func, tt, None, stats,
+                                None, orderer, probcut)
     return best_move
 
 
+def iterative_deepening(board, player_tile, heuristic_func=evaluate_h1, max_depth=None, time_limit=None, tt=None,
+                        endgame_empties=ENDGAME_EMPTIES, stats=None, book=None, orderer=None, algorithm='pvs',
+                        aspiration=None, probcut=None, eval_cache=None, cancel=None):
+    """
+    Derinlik 1, 2, 3 ... diye arar; her iterasyonun en iyi hamlesi bir sonrakinde önce denenir.
+    Süre dolunca tamamlanan en derin iterasyonun sonucunu döner: (hamle, skor, ulaşılan derinlik).
+    Derinlik 1 her zaman süre kontrolü olmadan tamamlanır.
+    Oyun sonunda kesin çözücü kullanılırsa skor taş farkıdır ve derinlik kalan boş kare sayısıdır.
+    Süre ya da cancel varsa çözücüden önce ENDGAME_FALLBACK_DEPTH'e kadar normal arama yapılır; çözücü
+    de süreye uyar ve yetişmezse bu aramanın sonucu döner.
+    Hamle açılış kitabından gelirse skor kitaptaki skordur ve derinlik 0'dır.
+    aspiration: verilirse (sadece 'pvs') her iterasyon önceki skorun +-aspiration penceresiyle
+    başlar; skor pencerenin dışına düşerse tam pencereyle tekrar aranır.
+    probcut: verilirse (sadece 'pvs') Multi-ProbCut ile seçici arama; aynı sürede daha derine iner.
+    eval_cache: verilirse heuristic skorları önbellekten okunur; iterasyonlar ve hamleler arası paylaşılır.
+    cancel: dışarıdan iptal (örn. threading.Event.is_set); True dönerse derinlik 1 ve kesin çözüm dahil
+    arama kesilir. Hiçbir iterasyon tamamlanmadıysa (None, None, 0) döner.
+    """
+    if max_depth is None and time_limit is None:
+        raise ValueError("max_depth veya time_limit verilmeli")
+
+    if book is not None:
+        book_entry = book.lookup(board, player_tile)
+        if book_entry is not None:
+            return book_entry[0], book_entry[1], 0
+
+    stop = None
+    if time_limit is not None:
+        deadline = time.monotonic() + time_limit
+        stop = lambda: time.monotonic() >= deadline
+    if cancel is not None:
+        timed = stop
+        stop = cancel if timed is None else lambda: cancel() or timed()
 
-def count_corners(board, player_tile):
-    opponent_tile = WHITE if player_tile == BLACK else BLACK
-    corners = [(0,0), (0,7), (7,0), (7,7)]
+    black, white = board.get_score()
+    empties = BOARD_SIZE * BOARD_SIZE - black - white
+    if _use_endgame_solver(board, player_tile, endgame_empties):
+        if stop is None:
+            score, best_move = EndgameSolver().solve(board, player_tile)
+            return best_move, score, empties
+        max_depth = ENDGAME_FALLBACK_DEPTH if max_depth is None else min(max_depth, ENDGAME_FALLBACK_DEPTH)
+        solve_endgame = True
+    else:
+        solve_endgame = False
+
+    if tt is not None:
+        tt.new_search()
+    if orderer is not None:
+        orderer.new_search()
+    if eval_cache is not None:
+        heuristic_func = eval_cache.wrap(heuristic_func)
+
+    # Boş kare sayısından derin aramanın anlamı yok
+    limit = empties
+    if max_depth is not None:
+        limit = min(limit, max_depth)
+    limit = max(limit, 1)
+
+    # Kesilen arama tahtayı yarım bırakabilir, bu yüzden kopya üzerinde çalışılır
+    search_board = board.copy()
+    best_move, best_score, reached = None, None, 0
+
+    for depth in range(1, limit + 1):
+        nodes_before = stats.nodes if stats is not None else 0
+        depth_stop = stop if depth > 1 else cancel
+        try:
+            if aspiration is not None and algorithm == 'pvs' and best_score is not None:
+                alpha, beta = best_score - aspiration, best_score + aspiration
+                score, move = _search_root(algorithm, search_board, depth, alpha, beta, player_tile, heuristic_func,
+                                           tt, depth_stop, stats, best_move, orderer, probcut)
+                if score <= alpha or score >= beta:
+                    if stats is not None:
+                        stats.researches += 1
+                    score, move = _search_root(algorithm, search_board, depth, -INF, INF, player_tile,
+                                               heuristic_func, tt, depth_stop, stats, best_move, orderer, probcut)
+            else:
+                score, move = _search_root(algorithm, search_board, depth, -INF, INF, player_tile, heuristic_func,
+                                           tt, depth_stop, stats, best_move, orderer, probcut)
+        except SearchTimeout:
+            break
+
+        best_move, best_score, reached = move, score, depth
+        if stats is not None:
+            stats.depth = depth
+            stats.iteration_nodes.append(stats.nodes - nodes_before)
+        if stop is not None and stop():
+            break
+
+    if solve_endgame and not stop():
+        score, move = EndgameSolver().solve(board, player_tile, stop=stop)
+        if score is not None:
+            best_move, best_score, reached = move, score, empties
+            if stats is not None:
+                stats.depth = empties
+    return best_move, best_score, reached
+
+
+def search_depth(board, depth, player_tile, heuristic_func=evaluate_h1, tt=None, stop=None, first_move=None,
+                 stats=None, orderer=None, algorithm='pvs', probcut=None):
+    """
+    iterative_deepening'in tek iterasyonu: tam pencereyle depth derinliğinde kök araması, (skor, hamle).
+    Derinlikleri kendisi sıralayan çağıranlar için (örn. ponder.py); tablo yaşlandırılmaz (new_search
+    çağrılmaz), kesin çözücü ve kitap kullanılmaz. first_move: önceki derinliğin hamlesi, önce denenir.
+    stop True dönerse SearchTimeout fırlatılır (tahta yarım kalır, kopya üzerinde arayın).
+    """
+    return _search_root(algorithm, board, depth, -INF, INF, player_tile, heuristic_func, tt, stop, stats,
+                        first_move, orderer, probcut)
+
+
+def _search_root(algorithm, board, depth, alpha, beta, player_tile, heuristic_func, tt, stop, stats, first_move,
+                 orderer, probcut=None):
+    # Kökte sıra player_tile'da; iki aramanın skoru da player_tile açısından
+    if algorithm == 'pvs':
+        return pvs(board, depth, alpha, beta, player_tile, player_tile, heuristic_func, tt, stop, stats,
+                   first_move, True, orderer, probcut=probcut)
+    if algorithm == 'minimax':
+        return minimax(board, depth, alpha, beta, True, player_tile, heuristic_func, tt, stop, stats,
+                       first_move, True, orderer)
+    raise ValueError(f"Bilinmeyen arama: {algorithm!r} (minimax, pvs)")
+
+
+def _use_endgame_solver(board, player_tile, endgame_empties):
+    if endgame_empties is None or not board.has_valid_move(player_tile):
+        return False
+    black, white = board.get_score()
+    return BOARD_SIZE * BOARD_SIZE - black - white <= endgame_empties
 
-    my_corners = 0
-    opp_corners = 0
 
-    for r, c in corners:
-        if board.grid[r][c] == player_tile:
-            my_corners += 1
-        elif board.grid[r][c] == opponent_tile:
-            opp_corners += 1
 
-    return my_corners, opp_corners
+
+def count_corners(board, player_tile):
+    black_corners, white_corners = board.get_corner_counts()
+
+    if player_tile == BLACK:
+        return black_corners, white_corners
+    return white_corners, black_corners
 
 
 def coin_parity(board, player_tile):
     black, white = board.get_score()
+    return disc_parity(black, white, player_tile)
+
 
+def disc_parity(black, white, player_tile):
+    # coin_parity'nin taş sayıları elde olduğunda kullanılan hali
     if black + white == 0:
         return 0
 
@@ -499,11 +877,28 @@ def coin_parity(board, player_tile):
         return 100 * (white - black) / (black + white)
 
 
-def mobility(board, player_tile):
-    opponent_tile = WHITE if player_tile == BLACK else BLACK
+def frontier_counts(board, player_tile):
+    # Boş kareye komşu taş sayısı (benim, rakibin)
+    black, white = board.black, board.white
+    near_empty = neighbour_mask(~(black | white) & FULL_MASK)
+    black_f = (black & near_empty).bit_count()
+    white_f = (white & near_empty).bit_count()
+
+    if player_tile == BLACK:
+        return black_f, white_f
+    return white_f, black_f
 
-    my_moves = len(board.get_valid_moves(player_tile))
-    opp_moves = len(board.get_valid_moves(opponent_tile))
+
+def move_counts(board, player_tile):
+    # İki tarafın hamle sayısı; board.get_moves_both düğüm başına bir kez hesaplanır
+    black_moves, white_moves = board.get_moves_both()
+    if player_tile == BLACK:
+        return black_moves.bit_count(), white_moves.bit_count()
+    return white_moves.bit_count(), black_moves.bit_count()
+
+
+def mobility(board, player_tile):
+    my_moves, opp_moves = move_counts(board, player_tile)
 
     if my_moves + opp_moves == 0:
         return 0
@@ -512,17 +907,11 @@ def mobility(board, player_tile):
 
 
 def positional_score(board, player_tile):
-    opponent_tile = WHITE if player_tile == BLACK else BLACK
-    score = 0
-
-    for r in range(BOARD_SIZE):
-        for c in range(BOARD_SIZE):
-            if board.grid[r][c] == player_tile:
-                score += POSITION_WEIGHTS[r][c]
-            elif board.grid[r][c] == opponent_tile:
-                score -= POSITION_WEIGHTS[r][c]
+    black_pos, white_pos = board.get_positional_sums()
 
-    return score
+    if player_tile == BLACK:
+        return black_pos - white_pos
+    return white_pos - black_pos
 
 
 
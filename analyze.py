@@ -0,0 +1,166 @@
+# analyze.py
+"""
+Toplu pozisyon analizi: satır başına bir pozisyon okur, ai.minimax ile her kök hamlesini ayrı ayrı
+(tam pencereyle, kesin skor) arar ve her satır için bir JSON satırı yazar.
+
+Girdi satırları (dosya ya da stdin; boş satırlar ve # ile başlayanlar atlanır):
+  - başlangıçtan hamle dizisi: "e6f6g6d6"  (positions.play_line; pas olan yerde hamle yazılmaz)
+  - Position.to_text biçimi: 64 karakter (X/O/.) + boşluk + sıradaki taraf
+
+Çıktı satırı: line (girdideki satır numarası), input, turn, depth, moves ([{move, score}], en iyi önce),
+best, score, pv (en iyi hamleden başlayan ana varyant; pas 'pas'). Skorlar sıradaki tarafın açısından.
+Hatalı satır için: {"line", "input", "error"}.
+
+Satırlar işçi süreçlere dağıtılır, sonuçlar girdi sırasıyla ve hazır oldukça yazılır; girdinin
+tamamı belleğe okunmaz (en fazla --window satır aynı anda işlenir).
+
+Kullanım:  python analyze.py games.txt --depth 4 --output analysis.jsonl
+           cat games.txt | python analyze.py --heuristic pattern
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import ai
+from ai import INF
+from board import BLACK, WHITE, EMPTY, BOARD_SIZE
+from position import Position
+from positions import play_line, format_move
+from transposition import TranspositionTable
+
+
+def parse_position(text):
+    """(board, sıradaki taş); sıradaki tarafın hamlesi yoksa ve oyun bitmediyse sıra rakibe geçer."""
+    # 32 hamlelik dizi de 64 karakterdir; tahta metninde sadece kare karakterleri bulunur
+    cells = text.split()[0]
+    if len(cells) == BOARD_SIZE * BOARD_SIZE and set(cells) <= {BLACK, WHITE, EMPTY}:
+        position = Position.from_text(text)
+        board, tile = position.to_board(), position.turn
+        other = WHITE if tile == BLACK else BLACK
+        if not board.has_valid_move(tile) and board.has_valid_move(other):
+            tile = other
+        return board, tile
+    return play_line(text)
+
+
+def principal_variation(board, tile, player_tile, depth, heuristic_func, tt):
+    """
+    board'da sıra tile'dayken ana varyant: her adımda kalan derinlikle minimax'ın seçtiği hamle
+    (skorlar player_tile açısından). Tablo kök aramasından dolu olduğu için adımlar çoğunlukla
+    tablodan gelir. Pas None olarak yazılır ve derinliği azaltmaz (minimax gibi).
+    """
+    board = board.copy()
+    pv = []
+    while depth > 0:
+        other = WHITE if tile == BLACK else BLACK
+        if not board.has_valid_move(tile):
+            if not board.has_valid_move(other):
+                break
+            pv.append(None)
+            tile = other
+            continue
+        _, move = ai.minimax(board, depth, -INF, INF, tile == player_tile, player_tile, heuristic_func, tt)
+        pv.append(move)
+        board.apply_move(move[0], move[1], tile)
+        tile = other
+        depth -= 1
+    return pv
+
+
+def analyze_position(board, tile, depth, heuristic_func):
+    """([(hamle, skor)] en iyi önce, en iyi skor, ana varyant). Oyun bittiyse hamle listesi boştur."""
+    if not board.has_valid_move(tile):
+        return [], heuristic_func(board, tile), []
+
+    # Her pozisyon kendi tablosuyla: sonuç işçi sayısına ve satır sırasına bağlı olmasın
+    tt = TranspositionTable(1 << 16)
+    other = WHITE if tile == BLACK else BLACK
+    scored = []
+    for move in board.get_valid_moves(tile):
+        child = board.copy()
+        child.apply_move(move[0], move[1], tile)
+        score, _ = ai.minimax(child, depth - 1, -INF, INF, False, tile, heuristic_func, tt)
+        scored.append((move, score))
+    scored.sort(key=lambda item: -item[1])
+
+    best_move, best_score = scored[0]
+    child = board.copy()
+    child.apply_move(best_move[0], best_move[1], tile)
+    pv = [best_move] + principal_variation(child, other, tile, depth - 1, heuristic_func, tt)
+    return scored, best_score, pv
+
+
+def analyze_line(number, text, depth, heuristic_name):
+    """İşçi süreçte çalışır: tek girdi satırının JSON nesnesi."""
+    text = text.strip()
+    try:
+        board, tile = parse_position(text)
+    except ValueError as e:
+        return {'line': number, 'input': text, 'error': str(e)}
+
+    scored, score, pv = analyze_position(board, tile, depth, ai.HEURISTICS[heuristic_name])
+    return {
+        'line': number,
+        'input': text,
+        'turn': tile,
+        'depth': depth,
+        'moves': [{'move': format_move(move), 'score': move_score} for move, move_score in scored],
+        'best': format_move(scored[0][0]) if scored else None,
+        'score': score,
+        'pv': [format_move(move) for move in pv],
+    }
+
+
+def analyze_stream(lines, depth=4, heuristic_name='ultimate', workers=None, window=None):
+    """
+    lines'ı süreç havuzunda analiz eder; sonuçları girdi sırasıyla, hazır oldukça üretir.
+    Aynı anda en fazla window satır havuzdadır (varsayılan işçi başına 4), girdi tembel okunur.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = window or 4 * workers
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for number, text in enumerate(lines, 1):
+            if not text.strip() or text.lstrip().startswith('#'):
+                continue
+            pending.append(executor.submit(analyze_line, number, text, depth, heuristic_name))
+            # En eski satır bitene kadar yeni satır okunmaz
+            while len(pending) >= window or (pending and pending[0].done()):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pozisyonları minimax ile analiz edip JSONL yazar")
+    parser.add_argument('input', nargs='?', default='-', help="girdi dosyası (varsayılan ya da '-': stdin)")
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--heuristic', choices=sorted(ai.HEURISTICS), default='ultimate')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--window', type=int, default=None, help="aynı anda işlenen en fazla satır")
+    parser.add_argument('--output', default=None, help="JSONL çıktı dosyası (varsayılan stdout)")
+    args = parser.parse_args()
+
+    if args.depth < 1:
+        parser.error("--depth en az 1 olmalı")
+
+    source = sys.stdin if args.input == '-' else open(args.input)
+    output = sys.stdout if args.output is None else open(args.output, 'w')
+    start = time.perf_counter()
+    count = errors = 0
+    try:
+        for result in analyze_stream(source, args.depth, args.heuristic, args.workers, args.window):
+            output.write(json.dumps(result) + '\n')
+            output.flush()
+            count += 1
+            errors += 'error' in result
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+    print(f"{count} pozisyon ({errors} hatalı), {time.perf_counter() - start:.1f} sn", file=sys.stderr)
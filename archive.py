@@ -0,0 +1,289 @@
+# archive.py
+"""
+Oyun arşivi: milyonlarca oyunu hamle başına bir byte ile tutan ikili dosya.
+
+Dosya biçimi (little-endian):
+  başlık : magic (8 byte), sürüm (uint16), boş (uint16), oyun sayısı (uint64), indeks ofseti (uint64)
+  veri   : oyunların hamleleri art arda, her hamle bir byte (kare = row * 8 + col)
+  indeks : oyun başına hamle verisinin ofseti (uint64), hamle sayısı (uint8), sonuç (int8, siyah - beyaz)
+Pas yazılmaz: hamlesi olmayan taraf tekrar oynanırken otomatik pas geçer (positions.play_line gibi).
+İndeks dosyanın sonundadır; yazıcı oyunları akış halinde ekler, indeksi kapanışta yazar.
+
+Okuyucu dosyayı mmap ile açar; N. oyuna indeksten doğrudan gidilir. Pozisyonlar Board kurulmadan
+bitboard'lar üzerinde tembel üretilir (iter_positions / iter_samples), eğitim girdisi olarak
+train_patterns.py --archive ile kullanılabilir.
+
+Kullanım:  python archive.py import games.txt games.oar   (satır başına "e6f6..." hamle dizisi)
+           python archive.py info games.oar
+           python archive.py verify games.oar
+           python archive.py show games.oar 12
+"""
+import argparse
+import mmap
+import struct
+import time
+
+from board import Board, BLACK, WHITE, BOARD_SIZE, get_flips_mask, get_moves_mask
+from positions import parse_move, format_move
+
+MAGIC = b'OTHARC1\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHQQ')
+INDEX = struct.Struct('<QBb')
+
+_start = Board()
+START_BLACK, START_WHITE = _start.black, _start.white
+
+
+def replay(moves):
+    """
+    Hamle byte'larını başlangıçtan oynar; her hamleden önce (benim, rakip, sıradaki taş, kare, çevrilenler)
+    üretir (benim: sıradaki tarafın taşları). Geçersiz hamlede ValueError. Board kullanılmaz.
+    """
+    own, opp, tile = START_BLACK, START_WHITE, BLACK
+    for index, sq in enumerate(moves):
+        bit = 1 << sq
+        flips = 0 if (own | opp) & bit else get_flips_mask(sq, own, opp)
+        if not flips:
+            # Sıradaki tarafın hamlesi yoksa pas; varsa hamle geçersiz
+            if get_moves_mask(own, opp):
+                raise ValueError(f"Geçersiz hamle: {format_move((sq >> 3, sq & 7))} ({index + 1}. hamle)")
+            own, opp, tile = opp, own, WHITE if tile == BLACK else BLACK
+            flips = 0 if (own | opp) & bit else get_flips_mask(sq, own, opp)
+            if not flips:
+                raise ValueError(f"Geçersiz hamle: {format_move((sq >> 3, sq & 7))} ({index + 1}. hamle)")
+        yield own, opp, tile, sq, flips
+        own, opp, tile = opp ^ flips, own | flips | bit, WHITE if tile == BLACK else BLACK
+
+
+def final_bitboards(moves):
+    """Oyun sonundaki (siyah, beyaz); geçersiz hamlede ValueError."""
+    black, white = START_BLACK, START_WHITE
+    for own, opp, tile, sq, flips in replay(moves):
+        own |= flips | (1 << sq)
+        opp ^= flips
+        black, white = (own, opp) if tile == BLACK else (opp, own)
+    return black, white
+
+
+def game_result(moves):
+    # Siyah - beyaz taş farkı (boş kareler kimseye verilmez, Board.get_score gibi)
+    black, white = final_bitboards(moves)
+    return black.bit_count() - white.bit_count()
+
+
+class ArchiveWriter:
+    """
+    Oyunları sırayla dosyaya ekler; close() (ya da with bloğunun sonu) indeksi ve başlığı yazar.
+    add_game her oyunu tekrar oynayarak doğrular ve sonucunu hesaplar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        self._offset = HEADER.size
+        self._index = bytearray()
+        self.count = 0
+
+    def add_game(self, moves):
+        """moves: [(row, col)] ya da kare byte'ları; pas yazılmaz. Oyunun indeksini döner."""
+        data = bytes(move if isinstance(move, int) else move[0] * BOARD_SIZE + move[1] for move in moves)
+        if len(data) > BOARD_SIZE * BOARD_SIZE - 4:
+            raise ValueError(f"Oyun çok uzun: {len(data)} hamle")
+        result = game_result(data)
+
+        self._file.write(data)
+        self._index += INDEX.pack(self._offset, len(data), result)
+        self._offset += len(data)
+        self.count += 1
+        return self.count - 1
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.write(self._index)
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, self.count, self._offset))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class GameArchive:
+    """
+    Arşivi ilk erişimde mmap ile açar; oyunlar indeksten rastgele erişilir, dosya belleğe okunmaz.
+    archive[n] n. oyunun hamle byte'larıdır.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._index_offset = 0
+        self._file = None
+        self._data = None
+
+    def _open(self):
+        if self._data is not None:
+            return
+        self._file = open(self.path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, self.count, self._index_offset = HEADER.unpack_from(self._data, 0)
+        if (magic != MAGIC or version != VERSION
+                or self._index_offset + self.count * INDEX.size != len(self._data)):
+            self.close()
+            raise ValueError(f"Geçersiz arşiv dosyası: {self.path}")
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._file.close()
+        self._data = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        self._open()
+        return self.count
+
+    def _entry(self, n):
+        self._open()
+        if not 0 <= n < self.count:
+            raise IndexError(f"Oyun yok: {n} (arşivde {self.count} oyun)")
+        return INDEX.unpack_from(self._data, self._index_offset + n * INDEX.size)
+
+    def __getitem__(self, n):
+        offset, length, _ = self._entry(n)
+        return self._data[offset:offset + length]
+
+    def result(self, n):
+        """n. oyunun sonucu: siyah - beyaz taş farkı."""
+        return self._entry(n)[2]
+
+    def moves(self, n):
+        """n. oyunun hamleleri: [(row, col)]."""
+        return [(sq >> 3, sq & 7) for sq in self[n]]
+
+    def positions(self, n):
+        """n. oyunda her hamleden önce (siyah, beyaz, sıradaki taş); Board.from_bitboards ile tahtaya çevrilir."""
+        for own, opp, tile, _, _ in replay(self[n]):
+            yield (own, opp, tile) if tile == BLACK else (opp, own, tile)
+
+    def board(self, n, ply):
+        """n. oyunda ply hamle oynandıktan sonraki (Board, sıradaki taş)."""
+        for index, (black, white, tile) in enumerate(self.positions(n)):
+            if index == ply:
+                return Board.from_bitboards(black, white), tile
+        black, white = final_bitboards(self[n])
+        return Board.from_bitboards(black, white), None
+
+    def iter_positions(self, with_result=False, start=0, stop=None):
+        """
+        start..stop oyunlarının tüm pozisyonları sırayla: (siyah, beyaz, sıradaki taş) ya da
+        with_result ise ((siyah, beyaz, sıradaki taş), sonuç).
+        """
+        self._open()
+        for n in range(start, self.count if stop is None else min(stop, self.count)):
+            if with_result:
+                result = self.result(n)
+                for position in self.positions(n):
+                    yield position, result
+            else:
+                yield from self.positions(n)
+
+    def iter_samples(self, start=0, stop=None):
+        """
+        Eğitim örnekleri, train_patterns.SAMPLE ile aynı biçim: (benim, rakip, boş kare, etiket).
+        Etiket sıradaki tarafın açısından oyunun son taş farkıdır.
+        """
+        self._open()
+        for n in range(start, self.count if stop is None else min(stop, self.count)):
+            result = self.result(n)
+            for own, opp, tile, _, _ in replay(self[n]):
+                yield (own, opp, BOARD_SIZE * BOARD_SIZE - (own | opp).bit_count(),
+                       result if tile == BLACK else -result)
+
+    def verify(self, n):
+        """n. oyunu tekrar oynar: hamleler geçerli ve kayıtlı sonuç doğru değilse ValueError."""
+        result = game_result(self[n])
+        if result != self.result(n):
+            raise ValueError(f"Oyun {n}: kayıtlı sonuç {self.result(n)}, tekrar oynanınca {result}")
+
+    def verify_all(self):
+        """Tüm oyunları doğrular; [(oyun, hata mesajı)] döner."""
+        errors = []
+        for n in range(len(self)):
+            try:
+                self.verify(n)
+            except ValueError as e:
+                errors.append((n, str(e)))
+        return errors
+
+
+def import_lines(lines, path):
+    """'e6f6...' hamle dizisi satırlarından arşiv yazar; (yazılan oyun, atlanan satır) döner."""
+    skipped = 0
+    with ArchiveWriter(path) as writer:
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                writer.add_game([parse_move(line[i:i + 2]) for i in range(0, len(line), 2)])
+            except ValueError:
+                skipped += 1
+        return writer.count, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="İkili oyun arşivi araçları")
+    commands = parser.add_subparsers(dest='command', required=True)
+    command = commands.add_parser('import', help="hamle dizisi satırlarından arşiv yaz")
+    command.add_argument('input')
+    command.add_argument('output')
+    command = commands.add_parser('info', help="oyun / pozisyon sayısı ve okuma hızı")
+    command.add_argument('path')
+    command = commands.add_parser('verify', help="tüm oyunları tekrar oynayarak doğrula")
+    command.add_argument('path')
+    command = commands.add_parser('show', help="tek oyunun hamleleri ve sonucu")
+    command.add_argument('path')
+    command.add_argument('game', type=int)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'import':
+        with open(args.input) as f:
+            count, skipped = import_lines(f, args.output)
+        print(f"{args.output}: {count} oyun yazıldı, {skipped} geçersiz satır atlandı "
+              f"({time.perf_counter() - start:.1f} sn)")
+
+    elif args.command == 'info':
+        with GameArchive(args.path) as archive:
+            positions = sum(1 for _ in archive.iter_positions())
+            elapsed = time.perf_counter() - start
+            print(f"{args.path}: {len(archive)} oyun, {positions} pozisyon "
+                  f"({positions / elapsed if elapsed > 0 else 0:.0f} pozisyon/sn)")
+
+    elif args.command == 'verify':
+        with GameArchive(args.path) as archive:
+            errors = archive.verify_all()
+            for n, message in errors:
+                print(message if message.startswith('Oyun') else f"Oyun {n}: {message}")
+            print(f"{len(archive)} oyun, {len(errors)} hatalı ({time.perf_counter() - start:.1f} sn)")
+
+    else:
+        with GameArchive(args.path) as archive:
+            print(''.join(format_move(move) for move in archive.moves(args.game)))
+            result = archive.result(args.game)
+            print(f"Sonuç: siyah - beyaz = {result:+d}")
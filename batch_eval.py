@@ -0,0 +1,147 @@
+# batch_eval.py
+"""
+Çok sayıda pozisyonu NumPy ile tek seferde değerlendirir (eğitim verisi / analiz için).
+Sonuçlar ai.py'deki tek tahta fonksiyonlarıyla birebir aynıdır.
+
+Girdi iki biçimden biri olabilir:
+  - (N, 8, 8) int8 dizi: 1 siyah (X), -1 beyaz (O), 0 boş
+  - (N, 2) uint64 dizi: [siyah bitboard, beyaz bitboard] (Board.black / Board.white ile aynı bit düzeni)
+"""
+import numpy as np
+
+from board import (
+    BLACK, FULL_MASK, CORNER_MASK, SQUARE_WEIGHTS, LEFT_SHIFTS, RIGHT_SHIFTS,
+)
+
+_LEFT = [(np.uint64(shift), np.uint64(mask)) for shift, mask in LEFT_SHIFTS]
+_RIGHT = [(np.uint64(shift), np.uint64(mask)) for shift, mask in RIGHT_SHIFTS]
+_FULL = np.uint64(FULL_MASK)
+_CORNERS = np.uint64(CORNER_MASK)
+_WEIGHTS = np.array(SQUARE_WEIGHTS, dtype=np.int64)
+
+
+def from_boards(boards):
+    """Board listesini (N, 2) uint64 diziye çevirir."""
+    return np.array([(board.black, board.white) for board in boards], dtype=np.uint64).reshape(-1, 2)
+
+
+def to_bitboards(positions):
+    """Her iki girdi biçimini (siyah, beyaz) uint64 dizilerine çevirir."""
+    positions = np.asarray(positions)
+
+    if positions.ndim == 2 and positions.shape[1] == 2:
+        positions = positions.astype(np.uint64, copy=False)
+        return positions[:, 0], positions[:, 1]
+
+    if positions.ndim == 3 and positions.shape[1:] == (8, 8):
+        flat = positions.reshape(-1, 64)
+        # sq = row * 8 + col; packbits(little) ile sq 8k..8k+7 k. bayta düşer
+        black = np.packbits(flat == 1, axis=1, bitorder='little').view('<u8').reshape(-1)
+        white = np.packbits(flat == -1, axis=1, bitorder='little').view('<u8').reshape(-1)
+        return black.astype(np.uint64), white.astype(np.uint64)
+
+    raise ValueError(f"Beklenmeyen şekil: {positions.shape} ((N, 8, 8) ya da (N, 2) olmalı)")
+
+
+def popcount(x):
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x).astype(np.int64)
+    bits = np.unpackbits(x.astype('<u8').view(np.uint8).reshape(-1, 8), axis=1)
+    return bits.sum(axis=1, dtype=np.int64)
+
+
+def _own_opp(black, white, player_tile):
+    if player_tile == BLACK:
+        return black, white
+    return white, black
+
+
+def moves_mask(own, opp):
+    # board.get_moves_mask'ın vektörel hali
+    empty = ~(own | opp) & _FULL
+    moves = np.zeros_like(own)
+
+    for shift, mask in _LEFT:
+        inner = opp & mask
+        x = (own << shift) & inner
+        for _ in range(5):
+            x |= (x << shift) & inner
+        moves |= (x << shift) & mask & empty
+
+    for shift, mask in _RIGHT:
+        inner = opp & mask
+        x = (own >> shift) & inner
+        for _ in range(5):
+            x |= (x >> shift) & inner
+        moves |= (x >> shift) & mask & empty
+
+    return moves
+
+
+def neighbour_mask(mask):
+    result = np.zeros_like(mask)
+    for shift, edge in _LEFT:
+        result |= (mask << shift) & edge
+    for shift, edge in _RIGHT:
+        result |= (mask >> shift) & edge
+    return result
+
+
+def disc_parity(positions, player_tile=BLACK):
+    """ai.coin_parity: 100 * (benim - rakip) / (toplam), taş yoksa 0."""
+    own, opp = _own_opp(*to_bitboards(positions), player_tile)
+    mine = popcount(own)
+    theirs = popcount(opp)
+    total = mine + theirs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        parity = 100 * (mine - theirs) / total
+    return np.where(total == 0, 0.0, parity)
+
+
+def positional(positions, player_tile=BLACK):
+    """ai.positional_score: POSITION_WEIGHTS ile benim taşlarım - rakibin taşları."""
+    own, opp = _own_opp(*to_bitboards(positions), player_tile)
+    own_bits = np.unpackbits(own.astype('<u8').view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    opp_bits = np.unpackbits(opp.astype('<u8').view(np.uint8).reshape(-1, 8), axis=1, bitorder='little')
+    return (own_bits.astype(np.int64) - opp_bits.astype(np.int64)) @ _WEIGHTS
+
+
+def corners(positions, player_tile=BLACK):
+    """ai.count_corners: (N, 2) dizi, [benim köşelerim, rakibin köşeleri]."""
+    own, opp = _own_opp(*to_bitboards(positions), player_tile)
+    return np.stack([popcount(own & _CORNERS), popcount(opp & _CORNERS)], axis=1)
+
+
+def frontier(positions, player_tile=BLACK):
+    """ai.frontier_counts: (N, 2) dizi, boş kareye komşu [benim, rakibin] taş sayısı."""
+    own, opp = _own_opp(*to_bitboards(positions), player_tile)
+    near_empty = neighbour_mask(~(own | opp) & _FULL)
+    return np.stack([popcount(own & near_empty), popcount(opp & near_empty)], axis=1)
+
+
+def move_counts(positions, player_tile=BLACK):
+    """ai.move_counts: (N, 2) dizi, [benim hamle sayım, rakibin hamle sayısı]."""
+    own, opp = _own_opp(*to_bitboards(positions), player_tile)
+    return np.stack([popcount(moves_mask(own, opp)), popcount(moves_mask(opp, own))], axis=1)
+
+
+def mobility(positions, player_tile=BLACK):
+    """ai.mobility: 100 * (benim - rakip) / (toplam) hamle sayısı, hamle yoksa 0."""
+    counts = move_counts(positions, player_tile)
+    mine, theirs = counts[:, 0], counts[:, 1]
+    total = mine + theirs
+    with np.errstate(divide='ignore', invalid='ignore'):
+        score = 100 * (mine - theirs) / total
+    return np.where(total == 0, 0.0, score)
+
+
+def evaluate_all(positions, player_tile=BLACK):
+    """Tüm bileşenler tek sözlükte; girdi bir kez bitboard'a çevrilir."""
+    bitboards = np.stack(to_bitboards(positions), axis=1)
+    return {
+        'disc_parity': disc_parity(bitboards, player_tile),
+        'positional': positional(bitboards, player_tile),
+        'corners': corners(bitboards, player_tile),
+        'frontier': frontier(bitboards, player_tile),
+        'mobility': mobility(bitboards, player_tile),
+    }
@@ -0,0 +1,258 @@
+# bench.py
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import ai
+from ordering import ORDERERS, make_orderer
+from search_stats import SearchStats
+from transposition import TranspositionTable
+from board import Board, BLACK, WHITE, BOARD_SIZE, EMPTY, iter_squares
+from positions import MIDGAME_LINES, midgame_positions
+
+# Başlangıç pozisyonundan perft yaprak sayıları (pas bir ply sayılır, oyun sonu tek yapraktır)
+PERFT_EXPECTED = {
+    1: 4,
+    2: 12,
+    3: 56,
+    4: 244,
+    5: 1396,
+    6: 8200,
+    7: 55092,
+    8: 390216,
+    9: 3005288,
+}
+
+
+def perft(board, depth, tile, passed=False):
+    if depth == 0:
+        return 1
+
+    other = WHITE if tile == BLACK else BLACK
+    moves = board.get_valid_moves_mask(tile)
+    if not moves:
+        if passed:
+            return 1  # iki taraf da oynayamıyor: oyun bitti
+        return perft(board, depth - 1, other, True)
+
+    nodes = 0
+    for sq in iter_squares(moves):
+        flips = board.make_move(sq, tile)
+        nodes += perft(board, depth - 1, other)
+        board.unmake_move(sq, tile, flips)
+    return nodes
+
+
+def bench_perft(max_depth):
+    results = []
+    for depth in range(1, max_depth + 1):
+        start = time.perf_counter()
+        nodes = perft(Board(), depth, BLACK)
+        elapsed = time.perf_counter() - start
+        expected = PERFT_EXPECTED.get(depth)
+        results.append({
+            'depth': depth,
+            'nodes': nodes,
+            'expected': expected,
+            'ok': expected is None or nodes == expected,
+            'seconds': elapsed,
+        })
+    return results
+
+
+def _time_per_call(func, calls, min_time=0.2):
+    # calls: func argüman tuple listesi; toplam süre min_time'ı geçene kadar tekrarlanır
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for call in calls:
+            func(*call)
+        count += len(calls)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / count
+
+
+def bench_calls(positions):
+    """get_valid_moves, get_tiles_to_flip ve her evaluate_* için çağrı başına süre (mikrosaniye)."""
+    results = {}
+
+    valid_calls = [(board.get_valid_moves, tile) for board, tile in positions]
+    results['get_valid_moves'] = _time_per_call(lambda f, t: f(t), valid_calls)
+
+    # Her pozisyondaki tüm boş kareler (geçerli ya da değil) denenir
+    flip_calls = []
+    for board, tile in positions:
+        grid = board.grid
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if grid[r][c] == EMPTY:
+                    flip_calls.append((board.get_tiles_to_flip, r, c, tile))
+    results['get_tiles_to_flip'] = _time_per_call(lambda f, r, c, t: f(r, c, t), flip_calls)
+
+    for name, heuristic_func in ai.HEURISTICS.items():
+        calls = [(board, tile) for board, tile in positions]
+        # Hamle önbelleği her çağrıda temizlenir; aramadaki yaprak maliyetine yakın ölçüm için
+        def run(board, tile, heuristic_func=heuristic_func):
+            board.invalidate_moves()
+            heuristic_func(board, tile)
+        results[f'evaluate_{name}'] = _time_per_call(run, calls)
+
+    return {name: seconds * 1e6 for name, seconds in results.items()}
+
+
+def bench_search(positions, depths, heuristic_names):
+    results = []
+    for name in heuristic_names:
+        heuristic_func = ai.HEURISTICS[name]
+        for depth in depths:
+            moves = []
+            start = time.perf_counter()
+            for board, tile in positions:
+                move = ai.get_best_move(board, depth, tile, heuristic_func)
+                moves.append(move)
+            elapsed = time.perf_counter() - start
+            results.append({
+                'heuristic': name,
+                'depth': depth,
+                'seconds': elapsed,
+                'moves': [list(move) if move is not None else None for move in moves],
+            })
+    return results
+
+
+def bench_ordering(positions, depth, heuristic_name, orderer_names=ORDERERS):
+    """
+    Her sıralama stratejisi için iterative deepening (TT ile) düğüm sayısı, ilk hamlede kesme
+    oranı ve süre. Sıralayıcı pozisyonlar boyunca korunur (oyundaki gibi).
+    """
+    heuristic_func = ai.HEURISTICS[heuristic_name]
+    results = []
+    for name in orderer_names:
+        orderer = make_orderer(name, heuristic_func)
+        stats = SearchStats()
+        moves = []
+        start = time.perf_counter()
+        for board, tile in positions:
+            move, _, _ = ai.iterative_deepening(board, tile, heuristic_func, depth, tt=TranspositionTable(1 << 16),
+                                                stats=stats, orderer=orderer)
+            moves.append(move)
+        elapsed = time.perf_counter() - start
+        results.append({
+            'orderer': name,
+            'heuristic': heuristic_name,
+            'depth': depth,
+            'nodes': stats.nodes,
+            'first_move_cutoff_rate': stats.first_move_cutoff_rate(),
+            'seconds': elapsed,
+            'moves': [list(move) if move is not None else None for move in moves],
+        })
+    return results
+
+
+def bench_algorithms(positions, depths, heuristic_name):
+    """minimax (referans) ve pvs: aynı hamleleri bulup bulmadıkları ve düğüm sayıları."""
+    heuristic_func = ai.HEURISTICS[heuristic_name]
+    results = []
+    for depth in depths:
+        row = {'heuristic': heuristic_name, 'depth': depth}
+        moves = {}
+        for algorithm in ('minimax', 'pvs'):
+            stats = SearchStats()
+            moves[algorithm] = [
+                ai.get_best_move(board, depth, tile, heuristic_func, tt=TranspositionTable(1 << 16), stats=stats,
+                                 algorithm=algorithm)
+                for board, tile in positions
+            ]
+            row[f'{algorithm}_nodes'] = stats.nodes
+        row['same_moves'] = moves['minimax'] == moves['pvs']
+        results.append(row)
+    return results
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(perft_depth=7, depths=(2, 3, 4), heuristic_names=None, ordering_depth=4):
+    if heuristic_names is None:
+        heuristic_names = sorted(ai.HEURISTICS)
+    positions = [(Board(), BLACK)] + midgame_positions()
+
+    return {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'positions': ['start'] + MIDGAME_LINES,
+        'perft': bench_perft(perft_depth),
+        'calls_us': bench_calls(positions),
+        'search': bench_search(positions, depths, heuristic_names),
+        'ordering': bench_ordering(positions, ordering_depth, heuristic_names[0]),
+        'algorithms': bench_algorithms(positions, depths, heuristic_names[0]),
+    }
+
+
+def compare(old, new):
+    # Önceki bir sonuç dosyasıyla karşılaştırma: >1 daha yavaş demek
+    print(f"{'ölçüm':<28} {'eski':>10} {'yeni':>10} {'oran':>7}")
+    for name, value in new['calls_us'].items():
+        if name in old.get('calls_us', {}):
+            print(f"{name:<28} {old['calls_us'][name]:>9.1f}µ {value:>9.1f}µ {value / old['calls_us'][name]:>6.2f}x")
+
+    old_search = {(row['heuristic'], row['depth']): row for row in old.get('search', [])}
+    for row in new['search']:
+        prev = old_search.get((row['heuristic'], row['depth']))
+        if prev is None:
+            continue
+        label = f"search {row['heuristic']} d{row['depth']}"
+        changed = '' if prev['moves'] == row['moves'] else '  (hamleler farklı)'
+        print(f"{label:<28} {prev['seconds']:>9.2f}s {row['seconds']:>9.2f}s "
+              f"{row['seconds'] / prev['seconds']:>6.2f}x{changed}")
+
+    old_ordering = {row['orderer']: row for row in old.get('ordering', [])}
+    for row in new.get('ordering', []):
+        prev = old_ordering.get(row['orderer'])
+        if prev is None or prev['depth'] != row['depth']:
+            continue
+        label = f"ordering {row['orderer']} d{row['depth']}"
+        print(f"{label:<28} {prev['nodes']:>10} {row['nodes']:>10} {row['nodes'] / prev['nodes']:>6.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Hamle üretimi, değerlendirme ve arama benchmark'ı")
+    parser.add_argument('--perft', type=int, default=7, help="perft derinliği (başlangıç pozisyonu)")
+    parser.add_argument('--depths', type=int, nargs='+', default=[2, 3, 4])
+    parser.add_argument('--heuristics', nargs='+', choices=sorted(ai.HEURISTICS), default=None)
+    parser.add_argument('--ordering-depth', type=int, default=4, help="sıralama karşılaştırması derinliği")
+    parser.add_argument('--output', default=None, help="JSON sonuç dosyası (yoksa stdout)")
+    parser.add_argument('--compare', default=None, help="karşılaştırılacak önceki JSON sonuç")
+    args = parser.parse_args()
+
+    results = run(args.perft, args.depths, args.heuristics, args.ordering_depth)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+    failed = [row for row in results['perft'] if not row['ok']]
+    for row in failed:
+        print(f"PERFT HATASI: derinlik {row['depth']}: {row['nodes']} (beklenen {row['expected']})", file=sys.stderr)
+    for row in results['algorithms']:
+        if not row['same_moves']:
+            print(f"PVS HATASI: derinlik {row['depth']}: minimax ile farklı hamleler", file=sys.stderr)
+            failed.append(row)
+    sys.exit(1 if failed else 0)
@@ -1,11 +1,648 @@
 # board.py
+import random
 
 EMPTY = '.'
 BLACK = 'X'
 WHITE = 'O'
 BOARD_SIZE = 8
 
+# -------------- BITBOARD YARDIMCILARI --------------
+# Kare indeksi: sq = row * 8 + col, karenin biti: 1 << sq
+
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE  # a sütunu (col 0) hariç
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F  # h sütunu (col 7) hariç
+
+# (kaydırma miktarı, taşmayı engelleyen maske)
+# Sola kaydırma: +1 doğu, +7 güneybatı, +8 güney, +9 güneydoğu
+LEFT_SHIFTS = ((1, NOT_A_FILE), (7, NOT_H_FILE), (8, FULL_MASK), (9, NOT_A_FILE))
+# Sağa kaydırma: -1 batı, -7 kuzeydoğu, -8 kuzey, -9 kuzeybatı
+RIGHT_SHIFTS = ((1, NOT_H_FILE), (7, NOT_A_FILE), (8, FULL_MASK), (9, NOT_H_FILE))
+
+
+# Kare ağırlıkları (heuristic'ler ve Board'un artımlı positional toplamı kullanır)
+POSITION_WEIGHTS = [
+    [100, -20, 10,  5,  5, 10, -20, 100],
+    [-20, -50, -2, -2, -2, -2, -50, -20],
+    [ 10,  -2,  5,  1,  1,  5,  -2,  10],
+    [  5,  -2,  1,  0,  0,  1,  -2,   5],
+    [  5,  -2,  1,  0,  0,  1,  -2,   5],
+    [ 10,  -2,  5,  1,  1,  5,  -2,  10],
+    [-20, -50, -2, -2, -2, -2, -50, -20],
+    [100, -20, 10,  5,  5, 10, -20, 100],
+]
+# Aynı tablo kare indeksiyle (sq = row * 8 + col)
+SQUARE_WEIGHTS = [w for row in POSITION_WEIGHTS for w in row]
+
+CORNER_MASK = 0x8100000000000081
+
+# -------------- KARE TABLOLARI --------------
+# Her kare için bir kez hesaplanır; sıcak döngüler sınır kontrolü yapmadan bunları gezer.
+
+DIRECTIONS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    ( 0, -1),          ( 0, 1),
+    ( 1, -1), ( 1, 0), ( 1, 1),
+)
+
+
+def _ray(row, col, dr, dc):
+    # (row, col)'dan (dr, dc) yönünde tahta kenarına kadar olan kareler (başlangıç hariç)
+    cells = []
+    r, c = row + dr, col + dc
+    while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
+        cells.append((r, c))
+        r += dr
+        c += dc
+    return tuple(cells)
+
+
+# RAY_CELLS[sq]: 8 yöndeki ışınlar (row, col) listesi olarak, boş ışınlar atlanır
+RAY_CELLS = [
+    tuple(ray for ray in (_ray(sq >> 3, sq & 7, dr, dc) for dr, dc in DIRECTIONS) if ray)
+    for sq in range(BOARD_SIZE * BOARD_SIZE)
+]
+# FLIP_RAYS[sq]: aynı ışınlar bit olarak; 2 kareden kısa ışında taş çevrilemeyeceği için bunlar atlanır
+FLIP_RAYS = [
+    tuple(tuple(1 << (r * BOARD_SIZE + c) for r, c in ray) for ray in rays if len(ray) >= 2)
+    for rays in RAY_CELLS
+]
+# NEIGHBOURS[sq]: komşu kareler (row, col), NEIGHBOUR_MASKS[sq]: aynı kareler maske olarak
+NEIGHBOURS = [tuple(ray[0] for ray in rays) for rays in RAY_CELLS]
+NEIGHBOUR_MASKS = [sum(1 << (r * BOARD_SIZE + c) for r, c in cells) for cells in NEIGHBOURS]
+
+# Stabil taş hesabı için dört eksen, LEFT_SHIFTS / RIGHT_SHIFTS ile aynı sırada:
+# yatay (1), ters köşegen (7), dikey (8), köşegen (9)
+AXES = ((0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _full_line_steps(dr, dc):
+    """
+    (dr, dc) ekseninde dolu doğruları bulmak için ikiye katlama adımları: [(kaydırma, ileri, geri)].
+    g &= (g >> kaydırma) | ileri adımlarıyla g, (dr, dc) yönünde tahta kenarına kadar dolu kareler olur;
+    ileri maskesi o yönde kenara uzaklığı kaydırmadan kısa (zaten kapsanmış) karelerdir. Geri yön aynı.
+    """
+    steps = []
+    for k in range(3):
+        span = 1 << k
+        forward = sum(1 << sq for sq in range(BOARD_SIZE * BOARD_SIZE)
+                      if len(_ray(sq >> 3, sq & 7, dr, dc)) < span)
+        backward = sum(1 << sq for sq in range(BOARD_SIZE * BOARD_SIZE)
+                       if len(_ray(sq >> 3, sq & 7, -dr, -dc)) < span)
+        steps.append(((dr * BOARD_SIZE + dc) * span, forward, backward))
+    return tuple(steps)
+
+
+# Köşegen eksenler için (eksen indeksi, adımlar); satır ve sütunlar stable_discs içinde ayrıca bulunur
+DIAGONAL_STEPS = ((1, _full_line_steps(*AXES[1])), (3, _full_line_steps(*AXES[3])))
+# AXIS_BORDERS[i]: i. eksende en az bir yanı tahta dışında olan kareler; bu eksende çevrilemezler
+AXIS_BORDERS = [
+    sum(1 << sq for sq in range(BOARD_SIZE * BOARD_SIZE)
+        if not _ray(sq >> 3, sq & 7, dr, dc) or not _ray(sq >> 3, sq & 7, -dr, -dc))
+    for dr, dc in AXES
+]
+
+# (köşe biti, X karesi biti, C karelerinin maskesi); köşe boşken bu kareler risklidir
+CORNER_SQUARES = (
+    (1 << 0, 1 << 9, (1 << 1) | (1 << 8)),
+    (1 << 7, 1 << 14, (1 << 6) | (1 << 15)),
+    (1 << 56, 1 << 49, (1 << 48) | (1 << 57)),
+    (1 << 63, 1 << 54, (1 << 55) | (1 << 62)),
+)
+
+# -------------- ZOBRIST --------------
+# Sabit tohum: aynı pozisyon her çalıştırmada (ve her işçi süreçte) aynı hash'i alır
+_zobrist_rng = random.Random(0x0E110)
+ZOBRIST_BLACK = [_zobrist_rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)]
+ZOBRIST_WHITE = [_zobrist_rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)]
+# Bir taş çevrildiğinde hash'e iki rengin anahtarı birlikte XOR'lanır
+ZOBRIST_FLIP = [b ^ w for b, w in zip(ZOBRIST_BLACK, ZOBRIST_WHITE)]
+# Sıra beyazdaysa arama anahtarına eklenir (tahta sırayı bilmiyor)
+ZOBRIST_WHITE_TO_MOVE = _zobrist_rng.getrandbits(64)
+
+
+def zobrist_hash(black, white):
+    h = 0
+    for sq in iter_squares(black):
+        h ^= ZOBRIST_BLACK[sq]
+    for sq in iter_squares(white):
+        h ^= ZOBRIST_WHITE[sq]
+    return h
+
+
+def square_bit(row, col):
+    return 1 << (row * BOARD_SIZE + col)
+
+
+def iter_squares(mask):
+    # Maskedeki dolu bitleri küçükten büyüğe (satır satır) döndürür
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def get_moves_mask(own, opp):
+    """own tarafının tüm geçerli hamlelerini tek geçişte maske olarak döndürür."""
+    empty = ~(own | opp) & FULL_MASK
+    moves = 0
+
+    for shift, mask in LEFT_SHIFTS:
+        inner = opp & mask
+        x = (own << shift) & inner
+        x |= (x << shift) & inner
+        x |= (x << shift) & inner
+        x |= (x << shift) & inner
+        x |= (x << shift) & inner
+        x |= (x << shift) & inner
+        moves |= (x << shift) & mask & empty
+
+    for shift, mask in RIGHT_SHIFTS:
+        inner = opp & mask
+        x = (own >> shift) & inner
+        x |= (x >> shift) & inner
+        x |= (x >> shift) & inner
+        x |= (x >> shift) & inner
+        x |= (x >> shift) & inner
+        x |= (x >> shift) & inner
+        moves |= (x >> shift) & mask & empty
+
+    return moves
+
+
+def neighbour_mask(mask):
+    # mask'taki karelerin 8 yöndeki komşuları
+    result = 0
+    for shift, edge in LEFT_SHIFTS:
+        result |= (mask << shift) & edge
+    for shift, edge in RIGHT_SHIFTS:
+        result |= (mask >> shift) & edge
+    return result
+
+
+def get_flips_mask(sq, own, opp):
+    """sq karesine own oynarsa çevrilecek rakip taşların maskesi (geçersizse 0)."""
+    if not NEIGHBOUR_MASKS[sq] & opp:
+        return 0
+
+    flips = 0
+    for ray in FLIP_RAYS[sq]:
+        line = 0
+        for bit in ray:
+            if opp & bit:
+                line |= bit
+                continue
+            # Rakip zinciri kendi taşımızla kapanıyorsa bu yön geçerli
+            if own & bit:
+                flips |= line
+            break
+    return flips
+
+
+def _line_flips(x, own, opp):
+    # 8 karelik tek bir doğruda own x'e oynarsa çevrilen taşlar (bit 0..7)
+    flips = 0
+    for step in (1, -1):
+        line = 0
+        i = x + step
+        while 0 <= i < BOARD_SIZE and opp >> i & 1:
+            line |= 1 << i
+            i += step
+        if 0 <= i < BOARD_SIZE and own >> i & 1:
+            flips |= line
+    return flips
+
+
+def _edge_stability():
+    """
+    EDGE_STABILITY[own << 8 | opp]: bir kenardaki (8 kare) own taşlarından kesin stabil olanlar.
+    Kenar taşları sadece kenar boyunca çevrilebildiği için bu kesindir: her boş kareye iki taraf da
+    (tahtanın geri kalanı hamleyi geçerli kılabileceğinden çevirmesiz bile) oynayabilir varsayılır.
+    """
+    table = [0] * (1 << 16)
+    done = [False] * (1 << 16)
+
+    def solve(own, opp):
+        index = own << 8 | opp
+        if done[index]:
+            return table[index]
+        stable = own
+        empty = ~(own | opp) & 0xFF
+        while empty and stable:
+            low = empty & -empty
+            empty ^= low
+            x = low.bit_length() - 1
+            flips = _line_flips(x, own, opp)
+            stable &= solve(own | flips | low, opp ^ flips)
+            flips = _line_flips(x, opp, own)
+            stable &= solve(own ^ flips, opp | flips | low)
+        table[index] = stable
+        done[index] = True
+        return stable
+
+    for own in range(256):
+        for opp in range(256):
+            if not own & opp:
+                solve(own, opp)
+    return table
+
+
+EDGE_STABILITY = _edge_stability()
+
+# Sütun 0'ı bir byte'a (bit r = satır r) toplayan çarpan ve geri açan tablo
+COLUMN_GATHER = 0x0102040810204080
+COLUMN_BITS = [sum(1 << (r * BOARD_SIZE) for r in range(BOARD_SIZE) if byte >> r & 1) for byte in range(256)]
+FILE_A = 0x0101010101010101
+
+
+def stable_discs(own, opp):
+    """
+    own'ın stabil taşlarının maskesi: oyunun geri kalanında hiçbir hamleyle çevrilemeyen taşlar.
+    Kenarlar EDGE_STABILITY ile kesin bulunur. İç kareler için dört eksenin her birinde doğru tamamen
+    doluysa ya da o eksendeki komşulardan biri tahta dışı veya stabil kendi taşıysa taş stabildir;
+    kenarlardan başlayıp sabit noktaya kadar genişletilir (flood fill). Bulunan her taş kesin
+    stabildir; iç karelerde sayım bir alt sınırdır.
+    """
+    stable = (
+        EDGE_STABILITY[(own & 0xFF) << 8 | (opp & 0xFF)]
+        | EDGE_STABILITY[(own >> 56) << 8 | (opp >> 56)] << 56
+        | COLUMN_BITS[EDGE_STABILITY[((own & FILE_A) * COLUMN_GATHER >> 56 & 0xFF) << 8
+                                     | ((opp & FILE_A) * COLUMN_GATHER >> 56 & 0xFF)]]
+        | COLUMN_BITS[EDGE_STABILITY[((own >> 7 & FILE_A) * COLUMN_GATHER >> 56 & 0xFF) << 8
+                                     | ((opp >> 7 & FILE_A) * COLUMN_GATHER >> 56 & 0xFF)]] << 7
+    )
+
+    filled = own | opp
+    # Dolu doğrular: boş karesi kalmadığı için o eksende hiç taş çevrilemez.
+    # Satır: 8 bitin AND'i satırın ilk bitinde toplanır; sütun: 8 satırın AND'i ilk satırda.
+    rows = filled & (filled >> 4)
+    rows &= rows >> 2
+    rows &= rows >> 1
+    full_rows = (rows & FILE_A) * 0xFF
+    columns = filled & (filled >> 32)
+    columns &= columns >> 16
+    columns &= columns >> 8
+    full_columns = (columns & 0xFF) * FILE_A
+    if not stable and not (full_rows and full_columns):
+        return 0  # kenarda stabil taş yok, iç karelerde de yatay ve dikey güvenli kare olamaz
+
+    safe = [full_rows | AXIS_BORDERS[0], AXIS_BORDERS[1], full_columns | AXIS_BORDERS[2], AXIS_BORDERS[3]]
+    for axis, steps in DIAGONAL_STEPS:
+        forward = backward = filled
+        for shift, forward_done, backward_done in steps:
+            forward &= (forward >> shift) | forward_done
+            backward &= (backward << shift) | backward_done
+        safe[axis] |= forward & backward
+
+    while True:
+        grown = own
+        for (left, left_edge), (right, right_edge), axis_safe in zip(LEFT_SHIFTS, RIGHT_SHIFTS, safe):
+            grown &= axis_safe | ((stable << left) & left_edge) | ((stable >> right) & right_edge)
+        grown |= stable
+        if grown == stable:
+            return stable
+        stable = grown
+
+
+def score_upper_bound(own, opp):
+    # Oyun sonu taş farkının (own - opp) üst sınırı: rakibin stabil taşları onun kalır
+    return BOARD_SIZE * BOARD_SIZE - 2 * stable_discs(opp, own).bit_count()
+
+
+# -------------- SİMETRİ --------------
+# Tahtanın 8 simetrisi, k indeksinin bitleriyle: önce (bit 2) a1-h8 köşegenine göre yansıma,
+# sonra (bit 1) dikey çevirme (satır -> 7 - satır), sonra (bit 0) yatay ayna (sütun -> 7 - sütun).
+# k = 0 özdeşlik, 3 yarım tur dönme, 5 ve 6 çeyrek dönmeler (birbirinin tersi).
+
+INVERSE_SYMMETRY = (0, 1, 2, 3, 4, 6, 5, 7)
+
+
+def flip_vertical(x):
+    # Her satır bir byte: satır sırasını ters çevirmek byte sırasını ters çevirmek demek
+    return int.from_bytes(x.to_bytes(8, 'little'), 'big')
+
+
+def mirror_horizontal(x):
+    # Her byte içinde bit sırasını ters çevirir
+    x = ((x >> 1) & 0x5555555555555555) | ((x & 0x5555555555555555) << 1)
+    x = ((x >> 2) & 0x3333333333333333) | ((x & 0x3333333333333333) << 2)
+    return ((x >> 4) & 0x0F0F0F0F0F0F0F0F) | ((x & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def flip_diagonal(x):
+    # Satır ve sütunu yer değiştirir (delta swap); maskeler taşan bitleri zaten keser
+    t = 0x0F0F0F0F00000000 & (x ^ (x << 28))
+    x ^= t ^ (t >> 28)
+    t = 0x3333000033330000 & (x ^ (x << 14))
+    x ^= t ^ (t >> 14)
+    t = 0x5500550055005500 & (x ^ (x << 7))
+    return x ^ t ^ (t >> 7)
+
+
+def transform_mask(mask, k):
+    if k & 4:
+        mask = flip_diagonal(mask)
+    if k & 2:
+        mask = flip_vertical(mask)
+    if k & 1:
+        mask = mirror_horizontal(mask)
+    return mask
+
+
+# SYMMETRY_SQUARES[k][sq]: sq karesinin k simetrisi altındaki karşılığı
+SYMMETRY_SQUARES = [
+    [transform_mask(1 << sq, k).bit_length() - 1 for sq in range(BOARD_SIZE * BOARD_SIZE)]
+    for k in range(8)
+]
+
+
+def transform_move(move, k):
+    # (row, col) hamlesini k simetrisiyle çevirir; pas (None) olduğu gibi kalır
+    if move is None or not k:
+        return move
+    sq = SYMMETRY_SQUARES[k][move[0] * BOARD_SIZE + move[1]]
+    return sq >> 3, sq & 7
+
+
+def symmetric_variants(a, b):
+    # (k, a', b') üçlüleri, k = 0..7 sırasıyla; iki maske aynı simetriyle çevrilir
+    for base, x, y in ((0, a, b), (4, flip_diagonal(a), flip_diagonal(b))):
+        mx, my = mirror_horizontal(x), mirror_horizontal(y)
+        yield base, x, y
+        yield base | 1, mx, my
+        yield base | 2, flip_vertical(x), flip_vertical(y)
+        yield base | 3, flip_vertical(mx), flip_vertical(my)
+
+
+def canonical(a, b):
+    """
+    (a', b', k): 8 simetri içinde (a', b') çifti en küçük olan hal ve onu veren k.
+    Simetrik pozisyonlar aynı kanonik hali paylaşır; eşitlikte en küçük k seçilir.
+    """
+    best_a, best_b, best_k = a, b, 0
+    for k, x, y in symmetric_variants(a, b):
+        if x < best_a or (x == best_a and y < best_b):
+            best_a, best_b, best_k = x, y, k
+    return best_a, best_b, best_k
+
+
+
 class Board:
+    """
+    Bitboard tabanlı tahta: siyah ve beyaz taşlar iki adet 64 bitlik int içinde tutulur.
+    Dışarıya eski grid tabanlı sınıfla aynı metotları verir (referans için GridBoard).
+    """
+
+    def __init__(self):
+        self.black = 0
+        self.white = 0
+        # Aşağıdakiler make_move / unmake_move içinde artımlı güncellenir
+        self.hash = 0  # Zobrist hash
+        self.black_count = 0
+        self.white_count = 0
+        self.black_pos = 0  # POSITION_WEIGHTS toplamı
+        self.white_pos = 0
+        self.black_corners = 0
+        self.white_corners = 0
+        # get_moves_both sonucu: hangi pozisyon için hesaplandığıyla birlikte saklanır
+        self._moves_key = None
+        self._moves_both = (0, 0)
+        self.reset_board()
+
+    def reset_board(self):
+        # Başlangıç taşları
+        self.black = square_bit(3, 4) | square_bit(4, 3)
+        self.white = square_bit(3, 3) | square_bit(4, 4)
+        self._sync_state()
+
+    def _sync_state(self):
+        # Artımlı tutulan değerleri bitboard'lardan baştan hesaplar
+        self.hash = zobrist_hash(self.black, self.white)
+        self.black_count = self.black.bit_count()
+        self.white_count = self.white.bit_count()
+        self.black_pos = sum(SQUARE_WEIGHTS[sq] for sq in iter_squares(self.black))
+        self.white_pos = sum(SQUARE_WEIGHTS[sq] for sq in iter_squares(self.white))
+        self.black_corners = (self.black & CORNER_MASK).bit_count()
+        self.white_corners = (self.white & CORNER_MASK).bit_count()
+
+    @classmethod
+    def from_bitboards(cls, black, white):
+        board = cls.__new__(cls)
+        board.black = black
+        board.white = white
+        board._moves_key = None
+        board._moves_both = (0, 0)
+        board._sync_state()
+        return board
+
+    @classmethod
+    def from_grid(cls, grid):
+        board = cls()
+        board.black = 0
+        board.white = 0
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if grid[r][c] == BLACK:
+                    board.black |= square_bit(r, c)
+                elif grid[r][c] == WHITE:
+                    board.white |= square_bit(r, c)
+        board._sync_state()
+        return board
+
+    def copy(self):
+        board = Board.__new__(Board)
+        board.black = self.black
+        board.white = self.white
+        board.hash = self.hash
+        board.black_count = self.black_count
+        board.white_count = self.white_count
+        board.black_pos = self.black_pos
+        board.white_pos = self.white_pos
+        board.black_corners = self.black_corners
+        board.white_corners = self.white_corners
+        board._moves_key = self._moves_key
+        board._moves_both = self._moves_both
+        return board
+
+    @property
+    def grid(self):
+        # Eski kodla uyumluluk için 8x8 görüntüyü her seferinde yeniden üretir (yavaş, döngü içinde kullanmayın).
+        # Sadece okunur: satırlar tuple, tahta bitboard'lardan değiştirilir (apply_move, make_move, from_grid)
+        grid = [[EMPTY] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+        for sq in iter_squares(self.black):
+            grid[sq >> 3][sq & 7] = BLACK
+        for sq in iter_squares(self.white):
+            grid[sq >> 3][sq & 7] = WHITE
+        return tuple(tuple(row) for row in grid)
+
+    def _own_opp(self, tile):
+        if tile == BLACK:
+            return self.black, self.white
+        return self.white, self.black
+
+    def display(self):
+        grid = self.grid
+        for r in range(BOARD_SIZE):
+            # Satır numarası
+            print(f"{r+1}", end=" ")
+            for c in range(BOARD_SIZE):
+                print(grid[r][c], end=" ")
+            print() # Satır sonu
+
+        print("  a b c d e f g h")
+
+    def is_on_board(self, x, y):
+        return 0 <= x < BOARD_SIZE and 0 <= y < BOARD_SIZE
+
+    def get_valid_moves(self, tile):
+        return [(sq >> 3, sq & 7) for sq in iter_squares(self.get_valid_moves_mask(tile))]
+
+    def get_valid_moves_mask(self, tile):
+        if self._moves_key == (self.black, self.white):
+            black_moves, white_moves = self._moves_both
+            return black_moves if tile == BLACK else white_moves
+        own, opp = self._own_opp(tile)
+        return get_moves_mask(own, opp)
+
+    def get_moves_both(self):
+        """
+        (siyah hamle maskesi, beyaz hamle maskesi).
+        Aynı pozisyon için tekrar çağrılırsa hesaplanmış sonucu döner; böylece
+        minimax'taki bitiş/pas kontrolü ve mobility heuristikleri tek sonucu paylaşır.
+        """
+        key = (self.black, self.white)
+        if self._moves_key != key:
+            self._moves_both = (get_moves_mask(self.black, self.white),
+                                get_moves_mask(self.white, self.black))
+            self._moves_key = key
+        return self._moves_both
+
+    def invalidate_moves(self):
+        # get_moves_both önbelleğini boşaltır; bir sonraki çağrı hamleleri baştan hesaplar
+        # (ölçümler için: aramada önbellek pozisyon değişince kendiliğinden geçersiz olur)
+        self._moves_key = None
+
+    def is_valid_move(self, start_row, start_col, tile):
+        if not self.is_on_board(start_row, start_col):
+            return False
+        sq = start_row * BOARD_SIZE + start_col
+        if (self.black | self.white) >> sq & 1:
+            return False
+        own, opp = self._own_opp(tile)
+        return get_flips_mask(sq, own, opp) != 0
+
+    def apply_move(self, start_row, start_col, tile):
+        # Hamle geçersizse hiçbir şey yapmaz ve False döner
+        if not self.is_on_board(start_row, start_col):
+            return False
+        return self.make_move(start_row * BOARD_SIZE + start_col, tile) != 0
+
+    def has_valid_move(self, tile):
+        return self.get_valid_moves_mask(tile) != 0
+
+    def get_score(self):
+        return self.black_count, self.white_count
+
+    def get_positional_sums(self):
+        # (siyahın POSITION_WEIGHTS toplamı, beyazınki)
+        return self.black_pos, self.white_pos
+
+    def get_corner_counts(self):
+        return self.black_corners, self.white_corners
+
+    def is_full(self):
+        return (self.black | self.white) == FULL_MASK
+
+    def symmetries(self):
+        # Pozisyonu değiştirmeyen simetriler (özdeşlik hariç); çoğu pozisyonda boş liste
+        return [k for k, black, white in symmetric_variants(self.black, self.white)
+                if k and black == self.black and white == self.white]
+
+    def get_tiles_to_flip(self, row, col, tile):
+        if not self.is_on_board(row, col):
+            return []
+        sq = row * BOARD_SIZE + col
+        if (self.black | self.white) >> sq & 1:
+            return []
+        own, opp = self._own_opp(tile)
+        return [(s >> 3, s & 7) for s in iter_squares(get_flips_mask(sq, own, opp))]
+
+    def apply_move_and_get_flipped(self, row, col, tile):
+        flips = self.make_move(row * BOARD_SIZE + col, tile)
+        return [(s >> 3, s & 7) for s in iter_squares(flips)]
+
+    def undo_move(self, row, col, tile, flipped_tiles):
+        flips = 0
+        for r, c in flipped_tiles:
+            flips |= square_bit(r, c)
+        self.unmake_move(row * BOARD_SIZE + col, tile, flips)
+
+    # -------------- Maske tabanlı hızlı yol --------------
+
+    def make_move(self, sq, tile):
+        """Hamleyi uygular ve çevrilen taşların maskesini döner. Geçersizse tahtaya dokunmaz, 0 döner."""
+        move = 1 << sq
+        if (self.black | self.white) & move:
+            return 0
+
+        own, opp = self._own_opp(tile)
+        flips = get_flips_mask(sq, own, opp)
+        if not flips:
+            return 0
+
+        if tile == BLACK:
+            self.black |= move | flips
+            self.white ^= flips
+        else:
+            self.white |= move | flips
+            self.black ^= flips
+        self._update_state(sq, tile, flips, 1)
+        return flips
+
+    def unmake_move(self, sq, tile, flips):
+        move = 1 << sq
+        if tile == BLACK:
+            self.black &= ~(move | flips)
+            self.white |= flips
+        else:
+            self.white &= ~(move | flips)
+            self.black |= flips
+        self._update_state(sq, tile, flips, -1)
+
+    def _update_state(self, sq, tile, flips, sign):
+        # sign = 1 hamle, -1 geri alma. Hash XOR olduğu için iki yönde de aynı güncellenir.
+        count = flips.bit_count()
+        h = self.hash
+        flipped_weight = 0
+        while flips:
+            low = flips & -flips
+            s = low.bit_length() - 1
+            h ^= ZOBRIST_FLIP[s]
+            flipped_weight += SQUARE_WEIGHTS[s]
+            flips ^= low
+
+        # Köşedeki taş hiçbir zaman çevrilemez; köşe sahipliği sadece konan taşla değişir
+        corner = 1 if (1 << sq) & CORNER_MASK else 0
+
+        if tile == BLACK:
+            self.hash = h ^ ZOBRIST_BLACK[sq]
+            self.black_count += sign * (count + 1)
+            self.white_count -= sign * count
+            self.black_pos += sign * (SQUARE_WEIGHTS[sq] + flipped_weight)
+            self.white_pos -= sign * flipped_weight
+            self.black_corners += sign * corner
+        else:
+            self.hash = h ^ ZOBRIST_WHITE[sq]
+            self.white_count += sign * (count + 1)
+            self.black_count -= sign * count
+            self.white_pos += sign * (SQUARE_WEIGHTS[sq] + flipped_weight)
+            self.black_pos -= sign * flipped_weight
+            self.white_corners += sign * corner
+
+
+class GridBoard:
+    """Eski 8x8 liste tabanlı tahta. Bitboard sürümünü çapraz kontrol için referans olarak tutuluyor."""
+
     def __init__(self):
         self.grid = []
         self.reset_board()
@@ -49,63 +686,92 @@ class Board:
             return False
 
         other_tile = WHITE if tile == BLACK else BLACK
-        
-        # Yönler: (x, y değişimi)
-        directions = [ (0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-        for row_step, col_step in directions:
-            # İncelemeye hemen yanındaki kareden başla
-            current_row = start_row + row_step
-            current_col = start_col + col_step
-            
+        grid = self.grid
+
+        # Her yönün kareleri RAY_CELLS'te hazır, sınır kontrolü gerekmiyor
+        for ray in RAY_CELLS[start_row * BOARD_SIZE + start_col]:
             found_opponent = False
-            
-            # Bu yönde rakip taş olduğu sürece ilerle (adım adım git)
-            while self.is_on_board(current_row, current_col) and self.grid[current_row][current_col] == other_tile:
-                current_row += row_step
-                current_col += col_step
-                found_opponent = True
-            
-            # Zincirin sonunda kendi taşımızı bulduysak bu yön geçerlidir
-            if found_opponent and self.is_on_board(current_row, current_col) and self.grid[current_row][current_col] == tile:
-                return True
-                
+            for r, c in ray:
+                cell = grid[r][c]
+                if cell == other_tile:
+                    found_opponent = True
+                    continue
+                # Zincirin sonunda kendi taşımızı bulduysak bu yön geçerlidir
+                if found_opponent and cell == tile:
+                    return True
+                break
+
         return False
     
     # Verilen koordinata taşı koyar ve Othello kurallarına göre arada kalan rakip taşlarını çevirir. Hamle geçersizse hiçbir şey yapmaz ve False döner.
     def apply_move(self, start_row, start_col, tile):
-
-        #is_valid_move
-        if not self.is_valid_move(start_row, start_col, tile):
+        tiles_to_flip = self.get_tiles_to_flip(start_row, start_col, tile)
+        if not tiles_to_flip:
             return False
-            
-        # Geçerliyse yerleştir, güncellemeleri yap.
+
+        # Geçerliyse yerleştir ve taşları çevir
         self.grid[start_row][start_col] = tile
-        
-        other_tile = WHITE if tile == BLACK else BLACK
-        
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
-
-        #Taşları dönüştür
-        for row_step, col_step in directions:
-            current_row = start_row + row_step
-            current_col = start_col + col_step
-            
-            tiles_to_flip = [] # Çevrilebilecek taşlar listesi
-
-            # Rakip taşları gördükçe listeye ekle ve yenisine geç
-            while self.is_on_board(current_row, current_col) and self.grid[current_row][current_col] == other_tile:
-                tiles_to_flip.append((current_row, current_col))
-                current_row += row_step
-                current_col += col_step
-            
-            # Eğer kendi taşımızı bulduysak, listedeki taşları çevir
-            if tiles_to_flip and self.is_on_board(current_row, current_col) and self.grid[current_row][current_col] == tile:
-                for flip_row, flip_col in tiles_to_flip:
-                    self.grid[flip_row][flip_col] = tile
-                    
+        for flip_row, flip_col in tiles_to_flip:
+            self.grid[flip_row][flip_col] = tile
+
         return True
 
+    @property
+    def black(self):
+        return self._tile_mask(BLACK)
+
+    @property
+    def white(self):
+        return self._tile_mask(WHITE)
+
+    def _tile_mask(self, tile):
+        mask = 0
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if self.grid[r][c] == tile:
+                    mask |= square_bit(r, c)
+        return mask
+
+    def get_valid_moves_mask(self, tile):
+        mask = 0
+        for r, c in self.get_valid_moves(tile):
+            mask |= square_bit(r, c)
+        return mask
+
+    def get_moves_both(self):
+        return self.get_valid_moves_mask(BLACK), self.get_valid_moves_mask(WHITE)
+
+    def get_positional_sums(self):
+        black_pos = 0
+        white_pos = 0
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if self.grid[r][c] == BLACK:
+                    black_pos += POSITION_WEIGHTS[r][c]
+                elif self.grid[r][c] == WHITE:
+                    white_pos += POSITION_WEIGHTS[r][c]
+        return black_pos, white_pos
+
+    def get_corner_counts(self):
+        corners = [self.grid[r][c] for r, c in ((0, 0), (0, 7), (7, 0), (7, 7))]
+        return corners.count(BLACK), corners.count(WHITE)
+
+    def symmetries(self):
+        black, white = self.black, self.white
+        return [k for k, b, w in symmetric_variants(black, white) if k and b == black and w == white]
+
+    @property
+    def hash(self):
+        # Referans tahta hash'i her seferinde baştan hesaplar
+        h = 0
+        for r in range(BOARD_SIZE):
+            for c in range(BOARD_SIZE):
+                if self.grid[r][c] == BLACK:
+                    h ^= ZOBRIST_BLACK[r * BOARD_SIZE + c]
+                elif self.grid[r][c] == WHITE:
+                    h ^= ZOBRIST_WHITE[r * BOARD_SIZE + c]
+        return h
+
     def has_valid_move(self, tile):
         for r in range(BOARD_SIZE):
             for c in range(BOARD_SIZE):
@@ -132,39 +798,23 @@ class Board:
         return True
     
     def get_tiles_to_flip(self, row, col, tile):
-        if self.grid[row][col] != '.' or not self.is_on_board(row, col):
+        if not self.is_on_board(row, col) or self.grid[row][col] != EMPTY:
             return []
 
         opponent = WHITE if tile == BLACK else BLACK
+        grid = self.grid
         tiles_to_flip = []
 
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            ( 0, -1),         ( 0, 1),
-            ( 1, -1), ( 1, 0), ( 1, 1)
-        ]
-
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
+        for ray in RAY_CELLS[row * BOARD_SIZE + col]:
             line = []
-
-            # İlk kare rakip olmalı
-            if not self.is_on_board(r, c) or self.grid[r][c] != opponent:
-                continue
-
-            # Rakip taşları topla
-            while True:
-                r += dr
-                c += dc
-                if not self.is_on_board(r, c):
-                    break
-
-                if self.grid[r][c] == opponent:
+            for r, c in ray:
+                cell = grid[r][c]
+                # Rakip taşları topla
+                if cell == opponent:
                     line.append((r, c))
                     continue
-
                 # Kendi taşımız ise bu yön geçerli
-                if self.grid[r][c] == tile:
+                if cell == tile:
                     tiles_to_flip.extend(line)
                 break
 
@@ -192,9 +842,16 @@ class Board:
         for r, c in flipped_tiles:
             self.grid[r][c] = opponent
 
+    @classmethod
+    def from_grid(cls, grid):
+        board = cls()
+        board.grid = [list(row) for row in grid]
+        return board
 
+    def copy(self):
+        return GridBoard.from_grid(self.grid)
 
 
 if __name__ == "__main__":
     b = Board()
-    b.display()
\ No newline at end of file
+    b.display()
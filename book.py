@@ -0,0 +1,226 @@
+# book.py
+"""
+Açılış kitabı: başlangıçtan ilk birkaç hamlenin derin arama skorları önceden hesaplanıp
+küçük bir ikili dosyada tutulur; get_best_move / iterative_deepening aramadan önce kitaba bakar.
+
+Dosya biçimi (little-endian):
+  başlık : magic (8 byte), sürüm (uint16), kitap derinliği / ply (uint16), kayıt sayısı (uint32)
+  kayıt  : anahtar (uint64), kare (uint8), skor (float32)
+Kayıtlar anahtara göre sıralıdır, aynı anahtarın hamleleri skora göre azalan sırada art arda durur.
+Anahtar, pozisyonun 8 simetrisi içinden seçilen kanonik halinin (sıradaki taraf, rakip) Zobrist
+hash'idir; kare de bu kanonik yöndedir. Böylece simetrik pozisyonlar tek kayıt paylaşır.
+"""
+import argparse
+import mmap
+import random
+import struct
+import time
+
+import ai
+from ai import INF
+from board import (
+    Board, BLACK, WHITE, INVERSE_SYMMETRY, SYMMETRY_SQUARES, canonical, iter_squares, zobrist_hash,
+)
+from positions import format_move
+from transposition import TranspositionTable
+
+MAGIC = b'OTHBOOK\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHI')
+RECORD = struct.Struct('<QBf')
+
+DEFAULT_PLIES = 8
+
+
+def canonical_key(board, tile):
+    """(anahtar, simetri): simetri, pozisyonu kanonik hale getiren board.SYMMETRY_SQUARES indeksi."""
+    own, opp = (board.black, board.white) if tile == BLACK else (board.white, board.black)
+    own, opp, k = canonical(own, opp)
+    return zobrist_hash(own, opp), k
+
+
+def score_moves(board, tile, depth, heuristic_func, tt=None):
+    """Kökteki her hamlenin depth derinlikte skoru: [(kare, skor)], en iyi önce."""
+    scored = []
+    for sq in iter_squares(board.get_valid_moves_mask(tile)):
+        if tt is not None:
+            tt.new_search()
+        flips = board.make_move(sq, tile)
+        score, _ = ai.minimax(board, depth - 1, -INF, INF, False, tile, heuristic_func, tt)
+        board.unmake_move(sq, tile, flips)
+        scored.append((sq, score))
+    scored.sort(key=lambda item: -item[1])
+    return scored
+
+
+def build_book(plies=DEFAULT_PLIES, depth=4, heuristic_func=ai.evaluate_ultimate, width=2, margin=0.0,
+               progress=None):
+    """
+    Başlangıçtan plies hamle derinliğe kadar pozisyonları arar: {anahtar: [(kanonik kare, skor)]}.
+    Her pozisyonda en iyi width hamle ve en iyiye margin kadar yakın hamleler açılır;
+    rakibin kitap dışı bir hamlesi normal aramaya düşer.
+    progress: isteğe bağlı, (ply, pozisyon sayısı) ile çağrılır.
+    """
+    entries = {}
+    tt = TranspositionTable(1 << 16)
+    frontier = [(Board(), BLACK)]
+
+    for ply in range(plies):
+        next_frontier = []
+        for board, tile in frontier:
+            key, sym = canonical_key(board, tile)
+            if key in entries:
+                continue
+
+            scored = score_moves(board, tile, depth, heuristic_func, tt)
+            if not scored:
+                continue  # açılışta pas neredeyse hiç olmaz, kitaba alınmaz
+
+            perm = SYMMETRY_SQUARES[sym]
+            entries[key] = [(perm[sq], score) for sq, score in scored]
+
+            other = WHITE if tile == BLACK else BLACK
+            best = scored[0][1]
+            for index, (sq, score) in enumerate(scored):
+                if index >= width and score < best - margin:
+                    break
+                child = board.copy()
+                child.make_move(sq, tile)
+                next_frontier.append((child, other))
+
+        frontier = next_frontier
+        if progress is not None:
+            progress(ply + 1, len(entries))
+
+    return entries
+
+
+def write_book(path, entries, plies):
+    # Anahtara göre sıralı, aynı anahtar içinde en iyi skor önce
+    records = sorted(
+        ((key, sq, score) for key, moves in entries.items() for sq, score in moves),
+        key=lambda record: (record[0], -record[2]),
+    )
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, plies, len(records)))
+        for key, sq, score in records:
+            f.write(RECORD.pack(key, sq, score))
+    return len(records)
+
+
+class OpeningBook:
+    """
+    Kitap dosyasını ilk sorguda mmap ile açar; arama ikili aramadır, dosya belleğe okunmaz.
+    max_ply: bu kadar hamleden sonra kitaba bakılmaz (None ise dosyadaki kitap derinliği).
+    variation: en iyi skora bu kadar yakın hamleler arasından rastgele seçilir (0 ise hep en iyisi).
+    """
+
+    def __init__(self, path, max_ply=None, variation=0.0, rng=None):
+        self.path = path
+        self.max_ply = max_ply
+        self.variation = variation
+        self.rng = rng or random.Random()
+        self.plies = 0
+        self.count = 0
+        self._file = None
+        self._data = None
+
+    def _open(self):
+        if self._data is not None:
+            return
+        self._file = open(self.path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.plies, self.count = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Geçersiz kitap dosyası: {self.path}")
+        if self.max_ply is None:
+            self.max_ply = self.plies
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+            self._file.close()
+        self._data = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        self._open()
+        return self.count
+
+    def _records(self, key):
+        # key'in ilk kaydını ikili aramayla bulur, ardışık kayıtları döner
+        data = self._data
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if RECORD.unpack_from(data, HEADER.size + mid * RECORD.size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        records = []
+        while lo < self.count:
+            record_key, sq, score = RECORD.unpack_from(data, HEADER.size + lo * RECORD.size)
+            if record_key != key:
+                break
+            records.append((sq, score))
+            lo += 1
+        return records
+
+    def moves(self, board, tile):
+        """Kitaptaki hamleler: [((row, col), skor)], en iyi önce; pozisyon kitapta yoksa []."""
+        self._open()
+        black, white = board.get_score()
+        if black + white - 4 >= self.max_ply:
+            return []
+
+        key, sym = canonical_key(board, tile)
+        inverse = SYMMETRY_SQUARES[INVERSE_SYMMETRY[sym]]
+        moves = []
+        for sq, score in self._records(key):
+            sq = inverse[sq]
+            # Hash çakışmasına karşı: hamle bu tahtada geçerli olmalı
+            if not board.is_valid_move(sq >> 3, sq & 7, tile):
+                return []
+            moves.append(((sq >> 3, sq & 7), score))
+        return moves
+
+    def lookup(self, board, tile):
+        """Oynanacak kitap hamlesi ve skoru: ((row, col), skor); pozisyon kitapta yoksa None."""
+        moves = self.moves(board, tile)
+        if not moves:
+            return None
+        best = moves[0][1]
+        return self.rng.choice([(move, score) for move, score in moves if score >= best - self.variation])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Başlangıçtan derin aramayla açılış kitabı üretir")
+    parser.add_argument('--output', default='book.bin')
+    parser.add_argument('--plies', type=int, default=DEFAULT_PLIES, help="kitap derinliği (hamle)")
+    parser.add_argument('--depth', type=int, default=4, help="her pozisyondaki arama derinliği")
+    parser.add_argument('--heuristic', choices=sorted(ai.HEURISTICS), default='ultimate')
+    parser.add_argument('--width', type=int, default=2, help="her pozisyonda açılan en iyi hamle sayısı")
+    parser.add_argument('--margin', type=float, default=0.0, help="en iyiye bu kadar yakın hamleler de açılır")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entries = build_book(
+        args.plies, args.depth, ai.HEURISTICS[args.heuristic], args.width, args.margin,
+        progress=lambda ply, count: print(f"ply {ply}: {count} pozisyon ({time.perf_counter() - start:.1f} sn)"),
+    )
+    records = write_book(args.output, entries, args.plies)
+    print(f"{args.output}: {len(entries)} pozisyon, {records} hamle")
+
+    with OpeningBook(args.output) as book:
+        moves = book.moves(Board(), BLACK)
+        print("Başlangıç: " + ', '.join(f"{format_move(move)} {score:.1f}" for move, score in moves))
@@ -0,0 +1,271 @@
+# endgame.py
+import argparse
+import random
+import time
+
+from board import (
+    Board, BLACK, WHITE, BOARD_SIZE, FULL_MASK,
+    get_moves_mask, get_flips_mask, iter_squares, score_upper_bound,
+)
+
+# Bu kadar ya da daha az boş kare kalınca aramada hamle sıralaması için rakip hamle sayısı
+# (fastest-first) hesaplanır; altında sadece parite sıralaması yapılır.
+FASTEST_FIRST_EMPTIES = 7
+# Son 1-4 boş kare için liste/sıralama kullanmayan özel yol
+SMALL_EMPTIES = 4
+
+# Parite bölgeleri: tahtanın dört çeyreği
+QUADRANTS = (
+    0x000000000F0F0F0F,
+    0x00000000F0F0F0F0,
+    0x0F0F0F0F00000000,
+    0xF0F0F0F000000000,
+)
+
+LOSS = -BOARD_SIZE * BOARD_SIZE - 1  # her skordan küçük
+
+# stop bu kadar düğümde bir kontrol edilir (düğüm başına çağrı çözücüyü belirgin yavaşlatıyor)
+STOP_CHECK_NODES = 2048
+
+
+class SolverStopped(Exception):
+    """stop True döndüğünde _search içinden fırlatılır; solve yakalar."""
+
+
+def odd_regions(empty):
+    # Boş kare sayısı tek olan çeyreklerin maskesi; buralara önce oynamak pariteyi korur
+    odd = 0
+    for quadrant in QUADRANTS:
+        if (empty & quadrant).bit_count() & 1:
+            odd |= quadrant
+    return odd
+
+
+class EndgameSolver:
+    """
+    Son boş kareler için kesin negamax çözücü.
+    Skor: oyun sonunda (sıradaki taraf taşı - rakip taşı), Board.get_score ile aynı sayım
+    (boş kareler kimseye verilmez). Pencereyi (-1, 1) vermek sadece kazan/kaybet/berabere çözer.
+    """
+
+    def __init__(self):
+        self.nodes = 0
+        self.stability_cuts = 0
+        self.elapsed = 0.0
+        self._stop = None
+        self._next_check = 0
+
+    def nodes_per_second(self):
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def solve(self, board, tile, alpha=LOSS, beta=-LOSS, stop=None):
+        """
+        (skor, en iyi hamle) döner; hamle (row, col), pas ise None.
+        stop: kök hamleleri arasında ve aramada her STOP_CHECK_NODES düğümde bir kontrol edilir;
+        True dönerse çözüm yarıda bırakılır ve (None, None) döner.
+        """
+        if tile == BLACK:
+            own, opp = board.black, board.white
+        else:
+            own, opp = board.white, board.black
+
+        self._stop = stop
+        self._next_check = self.nodes + STOP_CHECK_NODES
+        start = time.perf_counter()
+        try:
+            score, sq = self._root(own, opp, alpha, beta, stop)
+        except SolverStopped:
+            score, sq = None, None
+        finally:
+            self.elapsed += time.perf_counter() - start
+            self._stop = None
+
+        if sq is None:
+            return score, None
+        return score, (sq >> 3, sq & 7)
+
+    def solve_win_loss(self, board, tile):
+        # 1: kazanç, 0: beraberlik, -1: kayıp
+        score, move = self.solve(board, tile, -1, 1)
+        return (score > 0) - (score < 0), move
+
+    def _root(self, own, opp, alpha, beta, stop=None):
+        moves = get_moves_mask(own, opp)
+        if not moves:
+            return self._search(own, opp, alpha, beta), None
+
+        best, best_sq = LOSS, None
+        for _, sq, flips in self._ordered_moves(own, opp, moves):
+            if stop is not None and stop():
+                return None, None
+            move = 1 << sq
+            score = -self._search(opp ^ flips, own | flips | move, -beta, -alpha)
+            if score > best:
+                best, best_sq = score, sq
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        return best, best_sq
+
+    def _ordered_moves(self, own, opp, moves):
+        # Fastest-first: rakibe en az hamle bırakan önce; eşitlikte tek paritede bölge önce
+        odd = odd_regions(~(own | opp) & FULL_MASK)
+        ordered = []
+        for sq in iter_squares(moves):
+            flips = get_flips_mask(sq, own, opp)
+            new_own = own | flips | (1 << sq)
+            replies = get_moves_mask(opp ^ flips, new_own).bit_count()
+            ordered.append((2 * replies + (0 if (1 << sq) & odd else 1), sq, flips))
+        ordered.sort()
+        return ordered
+
+    def _search(self, own, opp, alpha, beta):
+        empty = ~(own | opp) & FULL_MASK
+        n_empty = empty.bit_count()
+        if n_empty <= SMALL_EMPTIES:
+            return self._search_small(own, opp, alpha, beta, empty)
+
+        self.nodes += 1
+        if self._stop is not None and self.nodes >= self._next_check:
+            self._next_check = self.nodes + STOP_CHECK_NODES
+            if self._stop():
+                raise SolverStopped
+        # Stabil taş kesmesi: rakibin stabil taşları skoru yukarıdan sınırlar. Sınır en iyi ihtimalle
+        # 64 - 2 * (rakip taş sayısı) olduğu için alpha bunun altındaysa hesaplamaya gerek yok.
+        if alpha >= BOARD_SIZE * BOARD_SIZE - 2 * opp.bit_count():
+            upper = score_upper_bound(own, opp)
+            if upper <= alpha:
+                self.stability_cuts += 1
+                return upper
+
+        moves = get_moves_mask(own, opp)
+        if not moves:
+            if not get_moves_mask(opp, own):
+                return own.bit_count() - opp.bit_count()
+            return -self._search(opp, own, -beta, -alpha)
+
+        best = LOSS
+        if n_empty > FASTEST_FIRST_EMPTIES:
+            for _, sq, flips in self._ordered_moves(own, opp, moves):
+                score = -self._search(opp ^ flips, own | flips | (1 << sq), -beta, -alpha)
+                if score > best:
+                    best = score
+                    if score > alpha:
+                        alpha = score
+                        if alpha >= beta:
+                            return best
+            return best
+
+        # Parite sıralaması: önce tek bölgelerdeki hamleler, sonra diğerleri
+        odd = odd_regions(empty)
+        for group in (moves & odd, moves & ~odd):
+            while group:
+                low = group & -group
+                group ^= low
+                flips = get_flips_mask(low.bit_length() - 1, own, opp)
+                score = -self._search(opp ^ flips, own | flips | low, -beta, -alpha)
+                if score > best:
+                    best = score
+                    if score > alpha:
+                        alpha = score
+                        if alpha >= beta:
+                            return best
+        return best
+
+    def _search_small(self, own, opp, alpha, beta, empty):
+        # Son 1-4 boş kare: hamle listesi yok, boş kareler doğrudan bit bit denenir
+        self.nodes += 1
+        if not empty:
+            return own.bit_count() - opp.bit_count()
+        if not empty & (empty - 1):
+            return self._last_one(own, opp, empty.bit_length() - 1)
+
+        best = LOSS
+        remaining = empty
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            flips = get_flips_mask(low.bit_length() - 1, own, opp)
+            if not flips:
+                continue
+            score = -self._search_small(opp ^ flips, own | flips | low, -beta, -alpha, empty ^ low)
+            if score > best:
+                best = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        return best
+
+        if best != LOSS:
+            return best
+
+        # Hamle yok: rakip oynayabiliyorsa pas, yoksa oyun bitti
+        remaining = empty
+        while remaining:
+            low = remaining & -remaining
+            remaining ^= low
+            if get_flips_mask(low.bit_length() - 1, opp, own):
+                return -self._search_small(opp, own, -beta, -alpha, empty)
+        return own.bit_count() - opp.bit_count()
+
+    def _last_one(self, own, opp, sq):
+        # Tek boş kare: skor doğrudan hesaplanır
+        flips = get_flips_mask(sq, own, opp)
+        if flips:
+            n = flips.bit_count()
+            return own.bit_count() + n + 1 - (opp.bit_count() - n)
+
+        flips = get_flips_mask(sq, opp, own)
+        if flips:
+            n = flips.bit_count()
+            return own.bit_count() - n - (opp.bit_count() + n + 1)
+
+        return own.bit_count() - opp.bit_count()
+
+
+def solve(board, tile):
+    """(skor, en iyi hamle, çözücü) — çözücüde düğüm sayısı ve süre tutulur."""
+    solver = EndgameSolver()
+    score, move = solver.solve(board, tile)
+    return score, move, solver
+
+
+def random_endgame(empties, rng):
+    # Rastgele oynanmış bir oyundan istenen boş kare sayısına gelinceye kadar ilerler
+    while True:
+        board = Board()
+        tile = BLACK
+        while True:
+            black, white = board.get_score()
+            if BOARD_SIZE * BOARD_SIZE - black - white == empties:
+                if board.has_valid_move(tile):
+                    return board, tile
+                break
+            moves = board.get_valid_moves(tile)
+            if not moves:
+                tile = WHITE if tile == BLACK else BLACK
+                if not board.has_valid_move(tile):
+                    break
+                continue
+            row, col = rng.choice(moves)
+            board.apply_move(row, col, tile)
+            tile = WHITE if tile == BLACK else BLACK
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rastgele oyun sonlarını kesin çözer, düğüm/sn raporlar")
+    parser.add_argument('--empties', type=int, nargs='+', default=[8, 10, 12])
+    parser.add_argument('--count', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'boş':>4} {'düğüm':>10} {'süre':>8} {'düğüm/sn':>10} {'stabil kesme':>13}")
+    for n in args.empties:
+        solver = EndgameSolver()
+        for _ in range(args.count):
+            board, tile = random_endgame(n, rng)
+            solver.solve(board, tile)
+        print(f"{n:>4} {solver.nodes:>10} {solver.elapsed:>7.2f}s {solver.nodes_per_second():>10.0f} "
+              f"{solver.stability_cuts:>13}")
@@ -0,0 +1,83 @@
+# eval_cache.py
+"""
+Sınırlı değerlendirme önbelleği (LRU).
+
+Aynı pozisyon kardeş alt ağaçlarda ve art arda gelen aramalarda tekrar tekrar yaprak olur; pahalı
+heuristic'ler (özellikle evaluate_ultimate) her seferinde baştan hesaplanmaz. Anahtar tahtanın
+Zobrist hash'i ile değerlendirme perspektifidir (heuristic'ler sıradaki taraftan bağımsızdır).
+Önbellek bir oyun boyunca hamleler arasında tutulabilir; heuristic değişirse boşaltılır.
+
+Kullanım:  ai.get_best_move(board, depth, tile, ai.evaluate_ultimate, eval_cache=EvalCache())
+"""
+import sys
+from collections import OrderedDict
+
+from board import WHITE
+from transposition import PERSPECTIVE_WHITE
+
+
+class EvalCache:
+    """
+    En fazla size kayıt; dolunca en uzun süredir kullanılmayan kayıt atılır.
+    Sayaçlar: hits, misses, evictions.
+    """
+
+    def __init__(self, size=1 << 18):
+        if size < 1:
+            raise ValueError(f"Önbellek boyutu pozitif olmalı: {size}")
+        self.size = size
+        self.entries = OrderedDict()
+        self.heuristic_func = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def wrap(self, heuristic_func):
+        """heuristic_func ile aynı imzalı, önbellekten okuyan değerlendirme fonksiyonu."""
+        if heuristic_func is not self.heuristic_func:
+            # Skorlar başka bir heuristic'e ait
+            self.clear()
+            self.heuristic_func = heuristic_func
+
+        entries = self.entries
+        size = self.size
+
+        def cached(board, player_tile):
+            key = board.hash ^ PERSPECTIVE_WHITE if player_tile == WHITE else board.hash
+            score = entries.get(key)
+            if score is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return score
+
+            self.misses += 1
+            score = heuristic_func(board, player_tile)
+            entries[key] = score
+            if len(entries) > size:
+                entries.popitem(last=False)
+                self.evictions += 1
+            return score
+
+        return cached
+
+    def memory_bytes(self):
+        # Tahmini: sözlük + her kayıt için 64 bitlik anahtar ve float skor nesnesi
+        return sys.getsizeof(self.entries) + len(self.entries) * (sys.getsizeof(1 << 63) + sys.getsizeof(0.0))
+
+    def stats(self):
+        probes = self.hits + self.misses
+        return {
+            'size': self.size,
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / probes if probes else 0.0,
+            'memory_bytes': self.memory_bytes(),
+        }
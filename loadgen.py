@@ -0,0 +1,123 @@
+# loadgen.py
+"""
+server.py için yük üreteci: N eşzamanlı oyun, her biri kendi bağlantısında rastgele insan hamleleri
+oynar. Her "move" isteğinin gidiş-dönüş süresi (AI cevabı dahil) ölçülür; sonunda p50 / p99 gecikme,
+ortalama ve saniyedeki hamle sayısı yazdırılır.
+
+Kullanım:  python loadgen.py --games 32 --heuristic ultimate --depth 3
+           python loadgen.py --unix /tmp/othello.sock --games 8 --time 0.2
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+import ai
+from board import WHITE
+from server import DEFAULT_PORT
+
+
+class Client:
+    """Tek bağlantı; istekler sırayla gönderilip cevapları beklenir."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=DEFAULT_PORT, unix_path=None):
+        if unix_path is not None:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, **request):
+        self.writer.write(json.dumps(request).encode() + b'\n')
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("sunucu bağlantıyı kapattı")
+        return json.loads(line)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_game(game_options, rng, latencies, errors, connect_args):
+    """Tek oyunu sonuna kadar oynar; move gecikmeleri latencies'e eklenir."""
+    client = await Client.connect(*connect_args)
+    try:
+        state = await client.request(op='new', **game_options)
+        if not state['ok']:
+            errors.append(state['error'])
+            return
+        while not state['over']:
+            game_id = state['game']
+            start = time.perf_counter()
+            if state['turn'] == game_options['ai']:
+                state = await client.request(op='ai', game=game_id)  # önceki AI araması reddedildi
+            else:
+                state = await client.request(op='move', game=game_id, move=rng.choice(state['moves']))
+            if not state['ok']:
+                errors.append(state['error'])
+                state = await client.request(op='state', game=game_id)
+                continue
+            latencies.append(time.perf_counter() - start)
+        await client.request(op='close', game=state['game'])
+    finally:
+        await client.close()
+
+
+async def run_load(games, game_options, seed=1, connect_args=()):
+    """games oyunu aynı anda oynatır; (gecikmeler, hatalar, toplam süre) döner."""
+    rng = random.Random(seed)
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        play_game(game_options, random.Random(rng.getrandbits(32)), latencies, errors, connect_args)
+        for _ in range(games)
+    ))
+    return latencies, errors, time.perf_counter() - start
+
+
+def percentile(values, p):
+    # statistics.quantiles en az iki değer ister
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method='inclusive')[p - 1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Othello sunucusuna eşzamanlı oyunlarla yük bindirir")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, help="TCP yerine bu Unix soketine bağlan")
+    parser.add_argument('--games', type=int, default=16, help="eşzamanlı oyun sayısı")
+    parser.add_argument('--heuristic', choices=sorted(ai.HEURISTICS), default='ultimate')
+    parser.add_argument('--depth', type=int, default=None)
+    parser.add_argument('--time', type=float, default=None, help="AI hamle süresi (sn)")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    options = {'ai': WHITE, 'heuristic': args.heuristic}
+    if args.depth is not None:
+        options['depth'] = args.depth
+    if args.time is not None:
+        options['time'] = args.time
+
+    latencies, errors, elapsed = asyncio.run(
+        run_load(args.games, options, args.seed, (args.host, args.port, args.unix))
+    )
+    latencies.sort()
+    print(f"{args.games} eşzamanlı oyun, {len(latencies)} hamle, {len(errors)} hata ({elapsed:.1f} sn)")
+    if latencies:
+        print(f"gecikme p50 {1000 * percentile(latencies, 50):.1f} ms | p99 {1000 * percentile(latencies, 99):.1f} ms | "
+              f"ortalama {1000 * statistics.fmean(latencies):.1f} ms | en fazla {1000 * latencies[-1]:.1f} ms")
+        print(f"{len(latencies) / elapsed:.1f} hamle/sn")
+    for error in sorted(set(errors)):
+        print(f"hata: {error} ({errors.count(error)} kez)")
@@ -1,7 +1,15 @@
 # main.py
+import argparse
 import time
-from board import Board, BLACK, WHITE
+from board import Board, BLACK, WHITE, BOARD_SIZE
 import ai
+from transposition import TranspositionTable
+from search_stats import SearchStats
+from book import OpeningBook
+from probcut import ProbCut
+from eval_cache import EvalCache
+from ponder import Ponderer, ALL as PONDER_ALL, MODES as PONDER_MODES
+from parallel import ParallelSearcher
 
 
 def get_user_input(board, current_player):
@@ -30,17 +38,78 @@ def get_user_input(board, current_player):
             print("Geçersiz hamle! (Kurallara uymuyor)")
 
 
-def get_ai_move(board, current_player, depth, heuristic_func):
-    print(f"\nBilgisayar ({current_player}) düşünüyor... (Derinlik: {depth})")
+def get_ai_move(board, current_player, depth, heuristic_func, tt=None, time_limit=None, show_stats=False,
+                book=None, probcut=None, eval_cache=None, ready=None, parallel=None):
+    # time_limit (sn) verilirse depth yerine süreye göre iterative deepening yapılır
+    # show_stats: hamleden sonra arama istatistiklerini yazdır
+    # book: isteğe bağlı açılış kitabı, pozisyon kitaptaysa arama yapılmaz
+    # probcut: isteğe bağlı Multi-ProbCut parametreleri (seçici arama)
+    # eval_cache: isteğe bağlı değerlendirme önbelleği, hamleler arasında tutulur
+    # ready: pondering'in bu pozisyon için hazırladığı (hamle, skor, derinlik, harcanan süre)
+    # parallel: isteğe bağlı ParallelSearcher, sabit derinlikte kök hamleleri süreçlere dağıtılır
+    if time_limit is not None:
+        print(f"\nBilgisayar ({current_player}) düşünüyor... (Süre limiti: {time_limit} sn)")
+    else:
+        print(f"\nBilgisayar ({current_player}) düşünüyor... (Derinlik: {depth})")
+    stats = SearchStats() if show_stats else None
     start_time = time.time()
-
-    move = ai.get_best_move(board, depth, current_player, heuristic_func)
+    black, white = board.get_score()
+    empties = BOARD_SIZE * BOARD_SIZE - black - white
+
+    # Parametreler tek bir heuristic için kalibre edilir; başka heuristic'te tam genişlikte aranır
+    if probcut is not None and ai.HEURISTICS.get(probcut.heuristic) is not heuristic_func:
+        probcut = None
+
+    pondered = False
+    if ready is not None:
+        # Kitap ya da kesin çözüm her zaman yeterli; süre limitinde pondering süresi de sayılır
+        exact = ready[2] == 0 or ready[2] >= empties
+        if time_limit is not None:
+            pondered = exact or ready[3] >= time_limit
+        else:
+            pondered = exact or ready[2] >= depth
+
+    if pondered:
+        move, _, reached, _ = ready
+    elif time_limit is not None:
+        remaining = time_limit - ready[3] if ready is not None else time_limit
+        move, _, reached = ai.iterative_deepening(board, current_player, heuristic_func, depth, remaining, tt,
+                                                  stats=stats, book=book, probcut=probcut, eval_cache=eval_cache)
+        if ready is not None and ready[2] > reached:
+            move, _, reached, _ = ready
+            pondered = True
+    else:
+        book_entry = book.lookup(board, current_player) if book is not None else None
+        if book_entry is not None:
+            move, reached = book_entry[0], 0
+        else:
+            move = ai.get_best_move(board, depth, current_player, heuristic_func, tt=tt, stats=stats,
+                                    probcut=probcut, eval_cache=eval_cache, parallel=parallel)
+            # Son ENDGAME_EMPTIES karede get_best_move derinliğe bakmadan kesin çözer
+            reached = empties if empties <= ai.ENDGAME_EMPTIES else depth
 
     end_time = time.time()
-    if move is not None:
-        print(f"AI Hamlesi: {chr(move[1] + 97)}{move[0] + 1} (Süre: {end_time - start_time:.4f} sn)")
+    # Kalan tüm kareler arandıysa hamle kesin çözümdür
+    if reached >= empties:
+        reached_text = f"Oyun sonu kesin çözüldü: {empties} boş kare"
+    else:
+        reached_text = f"Ulaşılan derinlik: {reached}"
+    if move is not None and reached == 0:
+        print(f"AI Hamlesi: {chr(move[1] + 97)}{move[0] + 1} (açılış kitabından)")
+    elif move is not None and pondered:
+        print(f"AI Hamlesi: {chr(move[1] + 97)}{move[0] + 1} (siz düşünürken hazırlandı; Süre: {end_time - start_time:.4f} sn, {reached_text})")
+    elif move is not None:
+        print(f"AI Hamlesi: {chr(move[1] + 97)}{move[0] + 1} (Süre: {end_time - start_time:.4f} sn, {reached_text})")
     else:
         print(f"AI hamle bulamadı (pas). (Süre: {end_time - start_time:.4f} sn)")
+    if stats is not None:
+        print(stats.summary())
+    if tt is not None:
+        tt_stats = tt.stats()
+        print(f"TT: isabet %{100 * tt_stats['hit_rate']:.1f} | çakışma {tt_stats['collisions']} | doluluk {tt_stats['filled']}/{tt_stats['size']}")
+    if eval_cache is not None:
+        cache_stats = eval_cache.stats()
+        print(f"Değerlendirme önbelleği: isabet %{100 * cache_stats['hit_rate']:.1f} | kayıt {cache_stats['entries']}/{cache_stats['size']} | bellek {cache_stats['memory_bytes'] / 2 ** 20:.1f} MB")
     return move
 
 
@@ -52,7 +121,8 @@ def select_heuristic(prompt_prefix="AI"):
         print("3. h3: Hareketlilik (Hamle Sayısı)")
         print("4. h4: Hybrid (Mobility + Corner + Position + Parity)")
         print("5. Best")
-        h_choice = input("Seçim (1-5): ").strip()
+        print("6. Pattern (eğitilmiş desen tabloları)")
+        h_choice = input("Seçim (1-6): ").strip()
 
         if h_choice == '1':
             return ai.evaluate_h1
@@ -64,6 +134,8 @@ def select_heuristic(prompt_prefix="AI"):
             return ai.evaluate_hybrid
         elif h_choice == '5':
             return ai.evaluate_ultimate
+        elif h_choice == '6':
+            return ai.evaluate_pattern
         else:
             print("Geçersiz seçim. ")
 
@@ -76,6 +148,29 @@ def select_depth(prompt_prefix="AI"):
         print("Geçersiz seçim. ")
 
 
+def select_time_limit(prompt_prefix="AI"):
+    # Boş bırakılırsa sabit derinlik kullanılır
+    while True:
+        t_input = input(f"{prompt_prefix} Süre limiti (sn, sabit derinlik için boş bırakın): ").strip()
+        if not t_input:
+            return None
+        try:
+            time_limit = float(t_input)
+        except ValueError:
+            time_limit = 0
+        if time_limit > 0:
+            return time_limit
+        print("Geçersiz seçim. ")
+
+
+def select_search_limit(prompt_prefix="AI"):
+    # (depth, time_limit): süre verilirse derinlik sınırı yok
+    time_limit = select_time_limit(prompt_prefix)
+    if time_limit is not None:
+        return None, time_limit
+    return select_depth(prompt_prefix), None
+
+
 def select_human_vs_ai_side():
     while True:
         print("\nİnsan vs AI: AI hangi taraf olsun?")
@@ -89,7 +184,13 @@ def select_human_vs_ai_side():
         print("Geçersiz seçim. ")
 
 
-def play_game():
+def play_game(show_stats=False, book=None, probcut=None, eval_cache_size=None, ponder_mode=None, parallel=None):
+    # show_stats: her AI hamlesinden sonra arama istatistikleri (python main.py --stats)
+    # book: açılış kitabı (python main.py --book book.bin)
+    # probcut: seçici arama parametreleri (python main.py --probcut probcut_ultimate.json)
+    # eval_cache_size: her AI için değerlendirme önbelleği kayıt sayısı (python main.py --eval-cache 262144)
+    # ponder_mode: İnsan vs AI'da insan düşünürken AI'ın cevaplarını hazırla (python main.py --ponder [all|predicted])
+    # parallel: sabit derinlikli AI aramaları için süreç havuzu (python main.py --workers 4)
     print("--- Othello ---")
 
     # Oyun Modu Seçimi
@@ -106,6 +207,8 @@ def play_game():
     # AI Varsayılan Ayarları
     ai_depth_black = 3
     ai_depth_white = 3
+    ai_time_black = None
+    ai_time_white = None
     ai_heuristic_black = ai.evaluate_h1
     ai_heuristic_white = ai.evaluate_h1
 
@@ -119,7 +222,7 @@ def play_game():
         if ai_side == BLACK:
             # AI Siyah (X), İnsan Beyaz (O)
             print("\n--- SİYAH AI (X) Ayarları ---")
-            ai_depth_black = select_depth("Siyah AI")
+            ai_depth_black, ai_time_black = select_search_limit("Siyah AI")
             ai_heuristic_black = select_heuristic("Siyah AI")
 
             p1_type, p2_type = 'ai', 'human'
@@ -127,7 +230,7 @@ def play_game():
         else:
             # AI Beyaz (O), İnsan Siyah (X)
             print("\n--- BEYAZ AI (O) Ayarları ---")
-            ai_depth_white = select_depth("Beyaz AI")
+            ai_depth_white, ai_time_white = select_search_limit("Beyaz AI")
             ai_heuristic_white = select_heuristic("Beyaz AI")
 
             p1_type, p2_type = 'human', 'ai'
@@ -135,11 +238,11 @@ def play_game():
     elif mode == '3':
         # AI vs AI: Depth ve heuristic ayrı ayrı seçiliyor
         print("\n--- SİYAH AI (X) Ayarları ---")
-        ai_depth_black = select_depth("Siyah AI")
+        ai_depth_black, ai_time_black = select_search_limit("Siyah AI")
         ai_heuristic_black = select_heuristic("Siyah AI")
 
         print("\n--- BEYAZ AI (O) Ayarları ---")
-        ai_depth_white = select_depth("Beyaz AI")
+        ai_depth_white, ai_time_white = select_search_limit("Beyaz AI")
         ai_heuristic_white = select_heuristic("Beyaz AI")
 
         p1_type, p2_type = 'ai', 'ai'
@@ -152,6 +255,16 @@ def play_game():
     board = Board()
     current_player = BLACK
     player_types = {BLACK: p1_type, WHITE: p2_type}
+    # Her AI kendi heuristic'i ile dolduğu için ayrı transposition table kullanır
+    ai_tables = {BLACK: TranspositionTable(), WHITE: TranspositionTable()}
+    ai_caches = {BLACK: None, WHITE: None}
+    if eval_cache_size:
+        ai_caches = {BLACK: EvalCache(eval_cache_size), WHITE: EvalCache(eval_cache_size)}
+    ai_settings = {
+        BLACK: (ai_depth_black, ai_time_black, ai_heuristic_black),
+        WHITE: (ai_depth_white, ai_time_white, ai_heuristic_white),
+    }
+    ready = None  # pondering'in insanın oynadığı hamleye hazırladığı cevap
 
     # Oyun döngüsü
     while True:
@@ -160,8 +273,10 @@ def play_game():
         b_score, w_score = board.get_score()
         print(f"SKOR: Siyah (X): {b_score} | Beyaz (O): {w_score}")
 
+        black_moves, white_moves = board.get_moves_both()
+
         # Bitiş Kontrolü
-        if not board.has_valid_move(BLACK) and not board.has_valid_move(WHITE):
+        if not black_moves and not white_moves:
             print("\nOYUN BİTTİ!")
             if b_score > w_score:
                 print("KAZANAN: SİYAH (X)")
@@ -172,25 +287,35 @@ def play_game():
             break
 
         # Pas Kontrolü
-        if not board.has_valid_move(current_player):
+        if not (black_moves if current_player == BLACK else white_moves):
             print(f"{current_player} pas geçiyor!")
             current_player = WHITE if current_player == BLACK else BLACK
             continue
 
         # Hamle Al
         if player_types[current_player] == 'human':
+            ai_tile = WHITE if current_player == BLACK else BLACK
+            ponderer = None
+            if ponder_mode is not None and player_types[ai_tile] == 'ai':
+                depth, time_limit, heuristic_func = ai_settings[ai_tile]
+                ponder_probcut = probcut
+                if probcut is not None and ai.HEURISTICS.get(probcut.heuristic) is not heuristic_func:
+                    ponder_probcut = None
+                ponderer = Ponderer(board, ai_tile, heuristic_func, depth, time_limit, ai_tables[ai_tile],
+                                    ai_caches[ai_tile], book, ponder_probcut, ponder_mode).start()
+
             move = get_user_input(board, current_player)
+            if ponderer is not None:
+                # Tablolar tekrar kullanılmadan önce arka plan araması bitmeli
+                ponderer.stop()
+                ready = ponderer.answer(move)
             if move is None:
                 break
         else:
-            if current_player == BLACK:
-                depth = ai_depth_black
-                heuristic_func = ai_heuristic_black
-            else:
-                depth = ai_depth_white
-                heuristic_func = ai_heuristic_white
-
-            move = get_ai_move(board, current_player, depth, heuristic_func)
+            depth, time_limit, heuristic_func = ai_settings[current_player]
+            move = get_ai_move(board, current_player, depth, heuristic_func, ai_tables[current_player], time_limit,
+                               show_stats, book, probcut, ai_caches[current_player], ready, parallel)
+            ready = None
             if move is None:
                 current_player = WHITE if current_player == BLACK else BLACK
                 continue
@@ -200,4 +325,29 @@ def play_game():
 
 
 if __name__ == "__main__":
-    play_game()
+    parser = argparse.ArgumentParser(description="Konsolda Othello: insan ve AI oyuncular")
+    parser.add_argument('--stats', action='store_true', help="her AI hamlesinden sonra arama istatistikleri")
+    parser.add_argument('--book', default=None, metavar='DOSYA', help="açılış kitabı (book.py ile üretilen)")
+    parser.add_argument('--probcut', default=None, metavar='JSON', help="Multi-ProbCut parametre dosyası")
+    parser.add_argument('--eval-cache', type=int, default=None, metavar='N',
+                        help="her AI için değerlendirme önbelleği kayıt sayısı")
+    parser.add_argument('--ponder', nargs='?', const=PONDER_ALL, default=None, choices=PONDER_MODES,
+                        help="İnsan vs AI'da insan düşünürken AI'ın cevaplarını hazırla (varsayılan mod: all)")
+    parser.add_argument('--workers', type=int, default=None, metavar='N',
+                        help="sabit derinlikli aramada kök hamlelerini N sürece dağıt (parallel.py)")
+    args = parser.parse_args()
+
+    if args.eval_cache is not None and args.eval_cache < 1:
+        parser.error("--eval-cache en az 1 olmalı")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers en az 1 olmalı")
+    # Kitap dosyası ilk sorguda açılır
+    book = OpeningBook(args.book) if args.book is not None else None
+    probcut = ProbCut.load(args.probcut) if args.probcut is not None else None
+    parallel = ParallelSearcher(args.workers) if args.workers is not None else None
+    try:
+        play_game(show_stats=args.stats, book=book, probcut=probcut, eval_cache_size=args.eval_cache,
+                  ponder_mode=args.ponder, parallel=parallel)
+    finally:
+        if parallel is not None:
+            parallel.close()
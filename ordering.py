@@ -0,0 +1,143 @@
+# ordering.py
+"""
+minimax için değiştirilebilir hamle sıralama stratejileri.
+Hepsi aynı arayüzü verir:
+  - order(board, moves, tile, depth, ply): hamleleri denenecek sırada döner
+  - cutoff(move, tile, depth, ply): bir hamle beta kesmesi yaptığında çağrılır
+  - new_search(): her kök aramasından önce (iterative deepening'de bir kez, iterasyonlar arasında değil)
+TT hamlesi ve önceki iterasyonun en iyi hamlesi minimax'ta bu sıralamanın da önüne alınır.
+"""
+from ai import INF, minimax, order_moves
+from board import BLACK, WHITE, BOARD_SIZE, SQUARE_WEIGHTS, get_flips_mask, get_moves_mask
+
+
+class StaticOrderer:
+    """Eski davranış: sadece POSITION_WEIGHTS (ai.order_moves)."""
+
+    def order(self, board, moves, tile, depth, ply):
+        return order_moves(board, moves, tile)
+
+    def cutoff(self, move, tile, depth, ply):
+        pass
+
+    def new_search(self):
+        pass
+
+
+class HistoryOrderer(StaticOrderer):
+    """
+    History heuristic: kesme yapan hamlenin karesine depth^2 eklenir, yüksek puanlı kareler önce.
+    Tablo iterasyonlar ve hamleler arasında korunur; her yeni aramada puanlar yarıya iner.
+    """
+
+    def __init__(self):
+        self.table = {BLACK: [0] * (BOARD_SIZE * BOARD_SIZE), WHITE: [0] * (BOARD_SIZE * BOARD_SIZE)}
+
+    def order(self, board, moves, tile, depth, ply):
+        history = self.table[tile]
+        return sorted(
+            moves,
+            key=lambda move: (history[move[0] * BOARD_SIZE + move[1]], SQUARE_WEIGHTS[move[0] * BOARD_SIZE + move[1]]),
+            reverse=True,
+        )
+
+    def cutoff(self, move, tile, depth, ply):
+        self.table[tile][move[0] * BOARD_SIZE + move[1]] += depth * depth
+
+    def new_search(self):
+        for history in self.table.values():
+            for sq in range(len(history)):
+                history[sq] >>= 1
+
+
+class KillerOrderer(StaticOrderer):
+    """Killer moves: her ply'da son kesme yapan iki hamle önce denenir, kalanlar statik sırada."""
+
+    SLOTS = 2
+
+    def __init__(self):
+        self.killers = []
+
+    def order(self, board, moves, tile, depth, ply):
+        ordered = order_moves(board, moves, tile)
+        if ply >= len(self.killers):
+            return ordered
+
+        first = [move for move in self.killers[ply] if move in ordered]
+        return first + [move for move in ordered if move not in first]
+
+    def cutoff(self, move, tile, depth, ply):
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        slots = self.killers[ply]
+        if move in slots:
+            slots.remove(move)
+        slots.insert(0, move)
+        del slots[self.SLOTS:]
+
+    def new_search(self):
+        self.killers = []
+
+
+class ShallowSearchOrderer(StaticOrderer):
+    """
+    Kalan derinlik min_depth ve üstündeyse her hamle (depth - 1 - reduction) derinlikte aranır
+    ve skora göre sıralanır; sığ düğümlerde statik sıralama. Aramadaki heuristic ile kurulmalı.
+    """
+
+    def __init__(self, heuristic_func, min_depth=4, reduction=3):
+        self.heuristic_func = heuristic_func
+        self.min_depth = min_depth
+        self.reduction = reduction
+
+    def order(self, board, moves, tile, depth, ply):
+        if depth < self.min_depth:
+            return order_moves(board, moves, tile)
+
+        shallow = max(0, depth - 1 - self.reduction)
+        scored = []
+        for r, c in moves:
+            flipped = board.apply_move_and_get_flipped(r, c, tile)
+            # Hamleden sonra sıra rakipte; skor hamleyi yapanın açısından
+            score, _ = minimax(board, shallow, -INF, INF, False, tile, self.heuristic_func)
+            board.undo_move(r, c, tile, flipped)
+            scored.append((score, SQUARE_WEIGHTS[r * BOARD_SIZE + c], (r, c)))
+
+        scored.sort(reverse=True)
+        return [move for _, _, move in scored]
+
+
+class FastestFirstOrderer(StaticOrderer):
+    """Fastest-first: rakibe en az cevap bırakan hamle önce (eşitlikte kare ağırlığı)."""
+
+    def order(self, board, moves, tile, depth, ply):
+        own, opp = (board.black, board.white) if tile == BLACK else (board.white, board.black)
+        scored = []
+        for r, c in moves:
+            sq = r * BOARD_SIZE + c
+            flips = get_flips_mask(sq, own, opp)
+            replies = get_moves_mask(opp ^ flips, own | flips | (1 << sq)).bit_count()
+            scored.append((replies, -SQUARE_WEIGHTS[sq], (r, c)))
+
+        scored.sort()
+        return [move for _, _, move in scored]
+
+
+ORDERERS = ('static', 'history', 'killer', 'shallow', 'fastest')
+
+
+def make_orderer(name, heuristic_func=None):
+    """İsimle sıralayıcı; 'shallow' aramadaki heuristic'i ister."""
+    if name == 'static':
+        return StaticOrderer()
+    if name == 'history':
+        return HistoryOrderer()
+    if name == 'killer':
+        return KillerOrderer()
+    if name == 'shallow':
+        if heuristic_func is None:
+            raise ValueError("'shallow' sıralama için heuristic_func gerekli")
+        return ShallowSearchOrderer(heuristic_func)
+    if name == 'fastest':
+        return FastestFirstOrderer()
+    raise ValueError(f"Bilinmeyen sıralama: {name!r} ({', '.join(ORDERERS)})")
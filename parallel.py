@@ -0,0 +1,213 @@
+# parallel.py
+import argparse
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ai
+from ai import INF
+from board import Board, BLACK, WHITE
+from positions import midgame_positions
+from transposition import TranspositionTable
+
+# İşçi süreçte heuristic başına transposition table boyutu
+WORKER_TABLE_SIZE = 1 << 18
+
+# İşçi süreçte paylaşılan alpha (kökteki en iyi skor); initializer ile atanır
+_shared_alpha = None
+# İşçi süreçte heuristic başına transposition table; aramalar arasında tutulur
+_tables = {}
+_search_id = None
+
+
+def _init_worker(shared_alpha):
+    global _shared_alpha
+    _shared_alpha = shared_alpha
+
+
+def _worker_table(heuristic_func, search_id):
+    # Yeni kök aramasında tablolar yaşlandırılır (ai.get_best_move'daki tt.new_search gibi)
+    global _search_id
+    if search_id != _search_id:
+        _search_id = search_id
+        for table in _tables.values():
+            table.new_search()
+    tt = _tables.get(heuristic_func)
+    if tt is None:
+        tt = _tables[heuristic_func] = TranspositionTable(WORKER_TABLE_SIZE)
+    return tt
+
+
+def _search_root_move(black, white, move, player_tile, depth, heuristic_func, probcut, search_id):
+    """
+    İşçide tek kök hamlesi: önce paylaşılan alpha ile boş pencere (PVS), alpha'yı geçerse
+    alpha alt sınırıyla tekrar aranır. (hamle, skor, kullanılan alpha) döner; skor alpha'nın
+    altındaysa sadece üst sınırdır.
+    """
+    tt = _worker_table(heuristic_func, search_id)
+    board = Board.from_bitboards(black, white)
+    board.apply_move(move[0], move[1], player_tile)
+    other = WHITE if player_tile == BLACK else BLACK
+
+    alpha = _shared_alpha.value
+    score, _ = ai.pvs(board, depth - 1, -math.nextafter(alpha, INF), -alpha, other, player_tile, heuristic_func,
+                      tt, ply=1, probcut=probcut)
+    score = -score
+    if score > alpha:
+        # Bu arada başka bir işçi alpha'yı yükseltmiş olabilir; en güncel alt sınırla kesin skor
+        alpha = max(alpha, _shared_alpha.value)
+        score, _ = ai.pvs(board, depth - 1, -INF, -alpha, other, player_tile, heuristic_func, tt,
+                          ply=1, probcut=probcut)
+        score = -score
+
+    # Daha iyi bir skor bulunduysa diğer işçiler sonraki hamlelerde bunu kullanır
+    if score > alpha:
+        with _shared_alpha.get_lock():
+            if score > _shared_alpha.value:
+                _shared_alpha.value = score
+
+    return move, score, alpha
+
+
+class ParallelSearcher:
+    """
+    Kök hamlelerini süreç havuzuna dağıtan PVS (Young Brothers Wait).
+    Kök hamleleri pvs'in sırasıyla dizilir (ai.root_moves); ilk hamle bu süreçte çağıranın
+    tablosuyla tam pencereyle aranır, skoru alpha olarak paylaşılır. Kalan kardeşler işçilerde
+    boş pencereyle aranır; her işçinin heuristic başına kendi transposition table'ı vardır ve bulunan
+    daha iyi skor paylaşılan alpha'yı yükseltir. Sıralamada önce gelen eşit skorlu hamle seçilir
+    (seri pvs gibi).
+    Oyun sonu kesin çözücüsü ve açılış kitabı ai.get_best_move'da aramadan önce kullanılır:
+    get_best_move(..., parallel=searcher) ya da main.py --workers N.
+    Havuz hamleler arasında tekrar kullanılsın diye nesne açık tutulur; iş bitince close().
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.shared_alpha = multiprocessing.Value('d', -INF)
+        self.search_id = 0
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.shared_alpha,),
+        )
+
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def search(self, board, depth, player_tile, heuristic_func=ai.evaluate_h1, tt=None, probcut=None):
+        """(skor, en iyi hamle) döner; tablolar boşken seri ai.pvs'in kökteki sonucu ile aynı."""
+        moves = ai.root_moves(board, player_tile, depth, tt)
+
+        # Pas, tek hamle ya da sığ aramada paralelliğe gerek yok
+        if depth <= 1 or len(moves) <= 1:
+            return ai.pvs(board, depth, -INF, INF, player_tile, player_tile, heuristic_func, tt,
+                          unique_moves=True, probcut=probcut)
+
+        self.search_id += 1
+        # En büyük kardeş: tam pencereyle seri aranır
+        first = moves[0]
+        best_score = self._search_serial(board, first, depth, player_tile, heuristic_func, tt, probcut)
+        best_move = first
+
+        with self.shared_alpha.get_lock():
+            self.shared_alpha.value = best_score
+
+        futures = [
+            self.executor.submit(_search_root_move, board.black, board.white, move, player_tile, depth,
+                                 heuristic_func, probcut, self.search_id)
+            for move in moves[1:]
+        ]
+        results = [future.result() for future in futures]
+
+        for move, score, _ in results:
+            if score > best_score:
+                best_score, best_move = score, move
+
+        # Alpha'nın altında kalan sonuç sadece üst sınırdır. En iyi skora eşitse ve
+        # sırada seçilen hamleden önce geliyorsa seri arama o hamleyi seçmiş olabilir;
+        # bu nadir durumda tam pencereyle tekrar aranır.
+        best_index = moves.index(best_move)
+        for move, score, alpha_used in results:
+            if moves.index(move) >= best_index:
+                break
+            if score == best_score and score <= alpha_used:
+                exact = self._search_serial(board, move, depth, player_tile, heuristic_func, tt, probcut)
+                if exact == best_score:
+                    best_move = move
+                    break
+
+        return best_score, best_move
+
+    def _search_serial(self, board, move, depth, player_tile, heuristic_func, tt, probcut):
+        other = WHITE if player_tile == BLACK else BLACK
+        flipped = board.apply_move_and_get_flipped(move[0], move[1], player_tile)
+        score, _ = ai.pvs(board, depth - 1, -INF, INF, other, player_tile, heuristic_func, tt,
+                          ply=1, probcut=probcut)
+        board.undo_move(move[0], move[1], player_tile, flipped)
+        return -score
+
+
+def parallel_get_best_move(board, depth, player_tile, heuristic_func=ai.evaluate_h1, workers=None):
+    # Tek seferlik kullanım; oyun boyunca ParallelSearcher'ı açık tutmak daha ucuz
+    with ParallelSearcher(workers) as searcher:
+        return ai.get_best_move(board, depth, player_tile, heuristic_func, tt=TranspositionTable(),
+                                parallel=searcher)
+
+
+def measure_speedup(depths=(5, 6, 7, 8), workers=None, heuristic_func=ai.evaluate_h1):
+    """
+    Başlangıç pozisyonu ve sabit orta oyun seti için varsayılan seri arama (ai.get_best_move:
+    PVS + transposition table) ile paralel aramayı karşılaştırır. Her pozisyon iki aramada da boş
+    tabloyla başlar; her derinlik yeni bir havuzla (boş işçi tablolarıyla) ölçülür.
+    Her satır: depth, pozisyon, seri ve paralel süre, hızlanma ve hamlelerin aynı olup olmadığı.
+    """
+    positions = [(Board(), BLACK)] + midgame_positions()
+    rows = []
+
+    for depth in depths:
+        with ParallelSearcher(workers) as searcher:
+            # Süreçler ölçümden önce başlatılır
+            list(searcher.executor.map(abs, range(searcher.workers)))
+            for index, (board, tile) in enumerate(positions):
+                start = time.perf_counter()
+                serial_move = ai.get_best_move(board.copy(), depth, tile, heuristic_func, tt=TranspositionTable())
+                serial_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                parallel_move = ai.get_best_move(board.copy(), depth, tile, heuristic_func, tt=TranspositionTable(),
+                                                 parallel=searcher)
+                parallel_time = time.perf_counter() - start
+
+                rows.append({
+                    'depth': depth,
+                    'position': 'start' if index == 0 else f'midgame-{index}',
+                    'serial_time': serial_time,
+                    'parallel_time': parallel_time,
+                    'speedup': serial_time / parallel_time if parallel_time > 0 else 0.0,
+                    'same_move': serial_move == parallel_move,
+                })
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paralel kök aramasının varsayılan aramaya göre hızlanmasını ölçer")
+    parser.add_argument('--depths', type=int, nargs='+', default=[5, 6, 7, 8])
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--heuristic', choices=sorted(ai.HEURISTICS), default='h1')
+    args = parser.parse_args()
+
+    rows = measure_speedup(args.depths, args.workers, ai.HEURISTICS[args.heuristic])
+    print(f"{'depth':>5} {'pozisyon':<11} {'seri':>9} {'paralel':>9} {'hızlanma':>8}  aynı")
+    for row in rows:
+        print(f"{row['depth']:>5} {row['position']:<11} {row['serial_time']:>8.2f}s "
+              f"{row['parallel_time']:>8.2f}s {row['speedup']:>7.2f}x  {row['same_move']}")
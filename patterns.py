@@ -0,0 +1,217 @@
+# patterns.py
+"""
+Logistello tarzı desen değerlendirmesi.
+
+Her desen birkaç karelik bir şablondur (kenar+2X, köşe 3x3 ve 2x5, köşegenler, satır/sütunlar).
+Şablonun tahtadaki her simetrik yerleşimi bir örnektir ve hepsi aynı ağırlık tablosunu paylaşır.
+Her örneğin kareleri 3 tabanında bir indekse çevrilir (0 boş, 1 benim, 2 rakibin taşı) ve skor,
+oyun evresine ait tablodan okunan ağırlıkların toplamıdır (tahmini son taş farkı).
+
+Örnekler kare kare gezilmez: tüm örneklerin indeksleri tek bir büyük tamsayıda 32 bitlik
+şeritler halinde tutulur. Her satırın (satır, byte) değeri için tüm şeritlere katkısı önceden
+hesaplanmıştır (ROW_LANES), böylece indeksler 16 tablo okuması ve toplamayla bulunur, sonra
+struct ile tek seferde açılır.
+
+Simetrik örnekler (kenar, satırlar, köşegenler, köşe 3x3) aynı kare kümesine iki sırayla oturabilir;
+tahtada tek örnek olarak tutulurlar. Skorun 8 simetri altında değişmemesi için bu desenlerin tabloları
+şablonun kendi simetrilerine göre simetriktir: kare sırası simetriyle değişen indeksler aynı ağırlığı
+paylaşır (canonical_indices; eğitim kanonik indekslerle yapılır, tablo sonra açılır).
+
+Ağırlıklar train_patterns.py ile eğitilir ve pattern_weights.bin dosyasından ilk çağrıda yüklenir.
+"""
+import array
+import os
+import struct
+import zlib
+
+from board import BLACK, BOARD_SIZE, SYMMETRY_SQUARES
+
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pattern_weights.bin')
+
+MAGIC = b'OTHPAT1\0'
+HEADER = struct.Struct('<8sII')  # magic, evre sayısı, evre başına ağırlık sayısı
+
+# Evreler boş kare sayısına göre: 1-10, 11-20, ..., 51-60
+PHASE_COUNT = 6
+
+
+def phase_of(empties):
+    return min(PHASE_COUNT - 1, max(0, empties - 1) // 10)
+
+
+# (isim, şablon kareleri); kare sırası 3 tabanındaki basamak sırasıdır
+PATTERNS = (
+    ('edge2x', (0, 1, 2, 3, 4, 5, 6, 7, 9, 14)),
+    ('corner3x3', (0, 1, 2, 8, 9, 10, 16, 17, 18)),
+    ('corner2x5', (0, 1, 2, 3, 4, 8, 9, 10, 11, 12)),
+    ('line2', tuple(range(8, 16))),
+    ('line3', tuple(range(16, 24))),
+    ('line4', tuple(range(24, 32))),
+    ('diag8', (0, 9, 18, 27, 36, 45, 54, 63)),
+    ('diag7', (1, 10, 19, 28, 37, 46, 55)),
+    ('diag6', (2, 11, 20, 29, 38, 47)),
+    ('diag5', (3, 12, 21, 30, 39)),
+    ('diag4', (4, 13, 22, 31)),
+)
+
+LANE_BITS = 32
+
+
+def pattern_instances(squares):
+    # Şablonun 8 simetri altındaki farklı yerleşimleri (aynı kare kümesine düşenler bir kez)
+    seen = set()
+    instances = []
+    for perm in SYMMETRY_SQUARES:
+        placed = tuple(perm[sq] for sq in squares)
+        if frozenset(placed) not in seen:
+            seen.add(frozenset(placed))
+            instances.append(placed)
+    return instances
+
+
+def _layout():
+    # Şerit 0 evre sabiti; her örnek bir şerit, değeri tablodaki başlangıcı + 3 tabanlı indeks
+    offsets = {}
+    base = 0
+    square_lanes = [0] * (BOARD_SIZE * BOARD_SIZE)
+    lane = 1
+    size = 1
+    for name, squares in PATTERNS:
+        offsets[name] = size
+        for placed in pattern_instances(squares):
+            base |= size << (LANE_BITS * lane)
+            for digit, sq in enumerate(placed):
+                square_lanes[sq] += 3 ** digit << (LANE_BITS * lane)
+            lane += 1
+        size += 3 ** len(squares)
+
+    # ROW_LANES[satır][byte]: o satırda byte'taki benim taşlarımın tüm şeritlere katkısı (rakip için 2 katı)
+    row_lanes = []
+    for row in range(BOARD_SIZE):
+        lanes = [0] * 256
+        for byte in range(1, 256):
+            low = byte & -byte
+            lanes[byte] = lanes[byte ^ low] + square_lanes[row * BOARD_SIZE + low.bit_length() - 1]
+        row_lanes.append(lanes)
+    return offsets, base, row_lanes, lane, size
+
+
+PATTERN_OFFSETS, BASE_LANES, ROW_LANES, LANE_COUNT, WEIGHT_COUNT = _layout()
+INSTANCE_COUNT = LANE_COUNT - 1
+LANES = struct.Struct(f'<{LANE_COUNT}I')
+
+
+def pattern_self_symmetries(squares):
+    """
+    Şablonu kendi kare kümesine eşleyen simetrilerin basamak permütasyonları: p[d], d. basamağın
+    simetriden sonra okunduğu basamak. Özdeşlik hariç, tekrarsız.
+    """
+    position = {sq: digit for digit, sq in enumerate(squares)}
+    perms = set()
+    for perm in SYMMETRY_SQUARES:
+        placed = [perm[sq] for sq in squares]
+        if set(placed) == set(squares):
+            perms.add(tuple(position[sq] for sq in placed))
+    perms.discard(tuple(range(len(squares))))
+    return sorted(perms)
+
+
+_canonical = None
+
+
+def canonical_indices():
+    """
+    Her ağırlık indeksinin, desenin kendi simetrileri altındaki en küçük eşdeğer indeksi (liste).
+    Sadece eğitimde gerekir; ilk çağrıda hesaplanır.
+    """
+    global _canonical
+    if _canonical is not None:
+        return _canonical
+    canonical = list(range(WEIGHT_COUNT))
+    for name, squares in PATTERNS:
+        offset = PATTERN_OFFSETS[name]
+        for perm in pattern_self_symmetries(squares):
+            # index'in d. basamağı simetriden sonra perm[d]. basamağa gider
+            images = [0]
+            for digit in reversed(range(len(squares))):
+                step = 3 ** perm[digit]
+                images = [image + value * step for image in images for value in range(3)]
+            for index, image in enumerate(images):
+                if image < index:
+                    canonical[offset + index] = min(canonical[offset + index], offset + image)
+        # Birden çok simetrisi olan desenlerde zincir en küçük indekse kadar izlenir
+        for index in range(offset, offset + 3 ** len(squares)):
+            canonical[index] = canonical[canonical[index]]
+    _canonical = canonical
+    return canonical
+
+
+def pattern_features(own, opp):
+    """Pozisyonun ağırlık indeksleri (evre içinde): sabit terim + her desen örneği için bir indeks."""
+    packed = BASE_LANES
+    for lanes, a, b in zip(ROW_LANES, own.to_bytes(8, 'little'), opp.to_bytes(8, 'little')):
+        packed += lanes[a] + (lanes[b] << 1)
+    return LANES.unpack(packed.to_bytes(LANES.size, 'little'))
+
+
+class PatternWeights:
+    """
+    Evre başına düz ağırlık listeleri; dosyada zlib ile sıkıştırılmış float32.
+    Bellekte liste tutulur: array('f') her okumada yeni float ürettiği için toplamda iki kat yavaş.
+    """
+
+    def __init__(self, tables=None):
+        if tables is None:
+            tables = [[0.0] * WEIGHT_COUNT for _ in range(PHASE_COUNT)]
+        self.tables = tables
+
+    @classmethod
+    def load(cls, path=WEIGHTS_PATH):
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, phases, count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or phases != PHASE_COUNT or count != WEIGHT_COUNT:
+            raise ValueError(f"Desen ağırlık dosyası bu sürümle uyumsuz: {path}")
+
+        raw = zlib.decompress(data[HEADER.size:])
+        tables = []
+        for phase in range(phases):
+            table = array.array('f')
+            table.frombytes(raw[phase * 4 * count:(phase + 1) * 4 * count])
+            # Görülmemiş desenlerin sıfırları tek nesneyi paylaşır
+            tables.append([value or 0.0 for value in table])
+        return cls(tables)
+
+    def symmetrize(self):
+        # Her indekse kanonik eşdeğerinin ağırlığı yazılır (eğitim sadece kanonik indeksleri günceller)
+        canonical = canonical_indices()
+        for table in self.tables:
+            table[:] = [table[index] for index in canonical]
+
+    def save(self, path=WEIGHTS_PATH):
+        raw = b''.join(array.array('f', table).tobytes() for table in self.tables)
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, PHASE_COUNT, WEIGHT_COUNT))
+            f.write(zlib.compress(raw, 9))
+
+
+_weights = None
+
+
+def get_weights():
+    # İlk değerlendirmede yüklenir
+    global _weights
+    if _weights is None:
+        _weights = PatternWeights.load()
+    return _weights
+
+
+def evaluate_pattern(board, player_tile):
+    """player_tile açısından tahmini son taş farkı."""
+    if player_tile == BLACK:
+        own, opp = board.black, board.white
+    else:
+        own, opp = board.white, board.black
+
+    table = get_weights().tables[phase_of(BOARD_SIZE * BOARD_SIZE - (own | opp).bit_count())]
+    return sum(map(table.__getitem__, pattern_features(own, opp)))
@@ -0,0 +1,150 @@
+# ponder.py
+"""
+Pondering: insan düşünürken AI'ın cevaplarını arka planda hazırlaması.
+
+AI hamlesini yaptıktan sonra bir iş parçacığı insanın olası hamlelerini tek tek oynayıp AI'ın
+cevabını arar. Arama AI'ın kendi transposition table'ını ve değerlendirme önbelleğini kullanır,
+böylece hazır cevabı olmayan hamlelerde de sonraki arama ısınmış tablolarla başlar.
+Hamleler derinlik derinlik sırayla aranır (önce tahmin edilen hamle): her turda her cevap sadece bir
+sonraki derinlikte aranır (ai.search_depth), önceki derinlikler tekrarlanmaz ve tablo yaşlandırılmaz.
+Her hamle için tamamlanan en derin sonuç saklanır. Oyun sonunda cevaplar kesin çözülür.
+İnsan hamlesini girince arama stop() ile kesilir.
+
+Kullanım:
+    ponderer = Ponderer(board, ai_tile, heuristic_func, depth, time_limit, tt).start()
+    move = get_user_input(...)
+    ponderer.stop()
+    ready = ponderer.answer(move)  # (AI hamlesi, skor, derinlik, düşünme süresi) ya da None
+"""
+import threading
+import time
+
+import ai
+from board import BLACK, WHITE, BOARD_SIZE, INVERSE_SYMMETRY, transform_move
+from endgame import EndgameSolver
+
+# Hangi insan hamleleri aranır
+PREDICTED = 'predicted'  # sadece tahmin edilen
+ALL = 'all'              # hepsi, tahmin edilen önce
+MODES = (PREDICTED, ALL)
+
+# Tabloda tahmin yoksa insanın hamlesi bu derinlikte AI'ın heuristic'iyle tahmin edilir
+PREDICT_DEPTH = 2
+
+
+class Ponderer:
+    """
+    Tek bir insan sırası için arka plan araması. depth verilirse en fazla o derinliğe kadar,
+    verilmezse (süre limitli oyun) durdurulana kadar derinleşir.
+    answers[insan hamlesi] = (AI hamlesi, skor, ulaşılan derinlik, o hamleye harcanan süre)
+    """
+
+    def __init__(self, board, ai_tile, heuristic_func, depth=None, time_limit=None, tt=None, eval_cache=None,
+                 book=None, probcut=None, mode=ALL):
+        if mode not in MODES:
+            raise ValueError(f"Bilinmeyen ponder modu: {mode!r} ({', '.join(MODES)})")
+        self.board = board.copy()
+        self.ai_tile = ai_tile
+        self.human_tile = WHITE if ai_tile == BLACK else BLACK
+        self.heuristic_func = heuristic_func
+        self.depth = depth if time_limit is None else None
+        self.tt = tt
+        self.eval_cache = eval_cache
+        self.book = book
+        self.probcut = probcut
+        self.mode = mode
+        self.predicted = None
+        self.answers = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        # Arama en geç bir düğüm (kesin çözücüde STOP_CHECK_NODES düğüm) sonra durur
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def answer(self, move):
+        """İnsan move oynadıysa hazır cevap: (AI hamlesi, skor, derinlik, harcanan süre) ya da None."""
+        return self.answers.get(move)
+
+    def predict(self):
+        """
+        İnsanın en olası hamlesi: AI'ın son araması bu pozisyonu insan sırasıyla tabloya yazdıysa
+        oradaki en iyi hamle, yoksa PREDICT_DEPTH derinliğinde insan açısından arama.
+        """
+        if self.tt is not None:
+            key, sym = self.tt.key(self.board, self.human_tile, self.ai_tile)
+            entry = self.tt.probe(key)
+            if entry is not None and entry[4] is not None:
+                return transform_move(entry[4], INVERSE_SYMMETRY[sym])
+        return ai.get_best_move(self.board.copy(), PREDICT_DEPTH, self.human_tile, self.heuristic_func,
+                                endgame_empties=None)
+
+    def _replies(self):
+        moves = self.board.get_valid_moves(self.human_tile)
+        if not moves:
+            return []
+        self.predicted = self.predict()
+        if self.predicted not in moves:
+            self.predicted = moves[0]
+        if self.mode == PREDICTED:
+            return [self.predicted]
+        return [self.predicted] + [move for move in moves if move != self.predicted]
+
+    def _run(self):
+        cancel = self._stop.is_set
+        heuristic_func = self.heuristic_func
+        if self.eval_cache is not None:
+            heuristic_func = self.eval_cache.wrap(heuristic_func)
+
+        # Aranacak cevaplar: insanın hamlesinden sonraki tahta (kitapta olanlar ve AI'ın pas geçeceği
+        # hamleler aranmaz)
+        boards = {}
+        for move in self._replies():
+            board = self.board.copy()
+            board.apply_move(move[0], move[1], self.human_tile)
+            if not board.has_valid_move(self.ai_tile):
+                continue
+            book_entry = self.book.lookup(board, self.ai_tile) if self.book is not None else None
+            if book_entry is not None:
+                self.answers[move] = (book_entry[0], book_entry[1], 0, 0.0)
+                continue
+            boards[move] = board
+
+        black, white = self.board.get_score()
+        empties = BOARD_SIZE * BOARD_SIZE - black - white - 1
+        spent = dict.fromkeys(boards, 0.0)
+
+        if empties <= ai.ENDGAME_EMPTIES:
+            # AI'ın araması da bu pozisyonları kesin çözer: sırayla çözülür, yarıda kalan atılır
+            for move, board in boards.items():
+                start = time.monotonic()
+                score, best_move = EndgameSolver().solve(board, self.ai_tile, stop=cancel)
+                if score is None:
+                    return
+                self.answers[move] = (best_move, score, empties, time.monotonic() - start)
+            return
+
+        limit = empties if self.depth is None else min(empties, self.depth)
+        # Her turda her cevap sadece bir sonraki derinlikte aranır; önceki derinliğin hamlesi önce denenir
+        for depth in range(1, limit + 1):
+            for move, board in boards.items():
+                previous = self.answers.get(move)
+                start = time.monotonic()
+                try:
+                    score, best_move = ai.search_depth(
+                        board, depth, self.ai_tile, heuristic_func, self.tt, stop=cancel,
+                        first_move=previous[0] if previous is not None else None, probcut=self.probcut,
+                    )
+                except ai.SearchTimeout:
+                    return
+                finally:
+                    spent[move] += time.monotonic() - start
+                self.answers[move] = (best_move, score, depth, spent[move])
@@ -0,0 +1,107 @@
+# position.py
+from board import (
+    Board, BLACK, WHITE, EMPTY, BOARD_SIZE, ZOBRIST_WHITE_TO_MOVE,
+    get_flips_mask, get_moves_mask, iter_squares, zobrist_hash,
+)
+
+
+class Position:
+    """
+    Değiştirilemez, hash'lenebilir pozisyon: iki 64 bitlik bitboard + sıradaki taraf.
+    __slots__ sayesinde örnek başına ~140 byte (int'ler dahil); açılış kitabı, transposition table ve
+    oyun kayıtlarında milyonlarca pozisyon tutmak için. Arama için to_board() ile Board'a çevrilir.
+    """
+
+    __slots__ = ('black', 'white', 'turn')
+
+    def __init__(self, black, white, turn=BLACK):
+        object.__setattr__(self, 'black', black)
+        object.__setattr__(self, 'white', white)
+        object.__setattr__(self, 'turn', turn)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position değiştirilemez")
+
+    def __delattr__(self, name):
+        raise AttributeError("Position değiştirilemez")
+
+    def __reduce__(self):
+        # __setattr__ kapalı olduğu için pickle yapıcıyı kullanır
+        return (Position, (self.black, self.white, self.turn))
+
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.black == other.black and self.white == other.white and self.turn == other.turn
+
+    def __hash__(self):
+        return hash((self.black, self.white, self.turn))
+
+    def __repr__(self):
+        return f"Position({self.to_text()!r})"
+
+    @classmethod
+    def from_board(cls, board, turn=BLACK):
+        return cls(board.black, board.white, turn)
+
+    def to_board(self):
+        return Board.from_bitboards(self.black, self.white)
+
+    def zobrist(self):
+        # Board.hash ile aynı anahtarlar, sıra beyazdaysa ZOBRIST_WHITE_TO_MOVE eklenir
+        h = zobrist_hash(self.black, self.white)
+        if self.turn == WHITE:
+            h ^= ZOBRIST_WHITE_TO_MOVE
+        return h
+
+    def valid_moves(self):
+        own, opp = (self.black, self.white) if self.turn == BLACK else (self.white, self.black)
+        return [(sq >> 3, sq & 7) for sq in iter_squares(get_moves_mask(own, opp))]
+
+    def play(self, row, col):
+        """Hamleden sonraki yeni Position; geçersizse ValueError. Pas için pass_turn()."""
+        if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+            raise ValueError(f"Tahta dışında: {(row, col)}")
+        sq = row * BOARD_SIZE + col
+        if self.turn == BLACK:
+            flips = get_flips_mask(sq, self.black, self.white)
+            if not flips or (self.black | self.white) >> sq & 1:
+                raise ValueError(f"Geçersiz hamle: {(row, col)}")
+            return Position(self.black | flips | (1 << sq), self.white ^ flips, WHITE)
+
+        flips = get_flips_mask(sq, self.white, self.black)
+        if not flips or (self.black | self.white) >> sq & 1:
+            raise ValueError(f"Geçersiz hamle: {(row, col)}")
+        return Position(self.black ^ flips, self.white | flips | (1 << sq), BLACK)
+
+    def pass_turn(self):
+        return Position(self.black, self.white, WHITE if self.turn == BLACK else BLACK)
+
+    def to_text(self):
+        # 64 karakter (satır satır X/O/.) + boşluk + sıradaki taraf
+        cells = []
+        for sq in range(BOARD_SIZE * BOARD_SIZE):
+            if self.black >> sq & 1:
+                cells.append(BLACK)
+            elif self.white >> sq & 1:
+                cells.append(WHITE)
+            else:
+                cells.append(EMPTY)
+        return ''.join(cells) + ' ' + self.turn
+
+    @classmethod
+    def from_text(cls, text):
+        cells, _, turn = text.strip().partition(' ')
+        turn = turn.strip() or BLACK
+        if len(cells) != BOARD_SIZE * BOARD_SIZE or turn not in (BLACK, WHITE):
+            raise ValueError(f"Hatalı pozisyon: {text!r}")
+
+        black = white = 0
+        for sq, cell in enumerate(cells):
+            if cell == BLACK:
+                black |= 1 << sq
+            elif cell == WHITE:
+                white |= 1 << sq
+            elif cell != EMPTY:
+                raise ValueError(f"Hatalı kare: {cell!r}")
+        return cls(black, white, turn)
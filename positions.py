@@ -0,0 +1,55 @@
+# positions.py
+from board import Board, BLACK, WHITE
+
+# Sabit pozisyon seti: paralel hız ölçümü, benchmark ve regresyon kontrolleri aynı pozisyonları kullanır.
+# Her satır başlangıçtan oynanan hamle dizisi ("e6f6..."); pas olan yerde hamle yazılmaz.
+MIDGAME_LINES = [
+    'e6f6g6d6c6g7g8b6c4h8f7e3f2e7f5c3d3h5b2g5',
+    'e6d6c7f7d3c6c5b8g8d2c2b2e3f4d7c3f5f6g4d8f2b6',
+    'c4c5d6e7b5c3f5b6c6b4a4a5d7f4g4g5b2c2f7b3f6a3a6g7',
+    'd3c3b3d2e3b2c4b4a4d6c1f5e2f3g4e1c2h3a1a3f1g1h5d1b1a2',
+    'e6d6c4f6g7d3f7g6c3e3g5h8c6b3f3d7e2e1c2e7f8g2g8b1a2a4c5b4',
+    'd3c3c4c5b6d2c6e6b4b7e1b2e2f3b8e3c2a7g4g2c7b5a2d6d7e8e7a3a4f2',
+    'c4e3f3c5d3g2f4g3f6f2b5g7g4c3h2h3g1h1b2a6b4b3h8g5a3f5h6h5d6d2e1f7',
+    'd3c3c4c5f6f5g6f4b2g5h4e2c2c1e3g3b4f2b1a1a2a4g4b3f1h5g2h3c6h2a3d1e6b6',
+]
+
+
+def parse_move(text):
+    # 'd3' -> (row, col) = (2, 3)
+    text = text.strip().lower()
+    if len(text) != 2 or not ('a' <= text[0] <= 'h' and '1' <= text[1] <= '8'):
+        raise ValueError(f"Hatalı hamle: {text!r}")
+    return int(text[1]) - 1, ord(text[0]) - ord('a')
+
+
+def format_move(move):
+    if move is None:
+        return 'pas'
+    return f"{chr(move[1] + 97)}{move[0] + 1}"
+
+
+def play_line(line):
+    """
+    Hamle dizisini başlangıç pozisyonundan oynar: (board, sıradaki taş).
+    Hamlesi olmayan taraf otomatik pas geçer; geçersiz hamlede ValueError.
+    """
+    board = Board()
+    tile = BLACK
+    line = line.strip()
+
+    for i in range(0, len(line), 2):
+        row, col = parse_move(line[i:i + 2])
+        if not board.has_valid_move(tile):
+            tile = WHITE if tile == BLACK else BLACK
+        if not board.apply_move(row, col, tile):
+            raise ValueError(f"Geçersiz hamle: {line[i:i + 2]} ({i // 2 + 1}. hamle)")
+        tile = WHITE if tile == BLACK else BLACK
+
+    if not board.has_valid_move(tile) and board.has_valid_move(WHITE if tile == BLACK else BLACK):
+        tile = WHITE if tile == BLACK else BLACK
+    return board, tile
+
+
+def midgame_positions():
+    return [play_line(line) for line in MIDGAME_LINES]
@@ -0,0 +1,247 @@
+# probcut.py
+"""
+Multi-ProbCut: seçici arama için sığ/derin skor regresyonları.
+
+Derin arama skoru sığ aramadan tahmin edilir: v_derin ≈ a * v_sığ + b, hata standart sapması sigma.
+Bir düğümde sığ arama, derin skorun t * sigma güvenle beta'nın üstünde (ya da alpha'nın altında)
+olacağını söylüyorsa alt ağaç aranmadan kesilir. Parametreler oyun evresine (boş kare sayısı)
+ve derinlik çiftine göre ayrı ayrı self-play pozisyonlarından kalibre edilir ve JSON dosyada tutulur.
+
+Kalibrasyon:  python probcut.py --heuristic ultimate --games 20 --output probcut_ultimate.json
+Kullanım:     ai.iterative_deepening(..., probcut=ProbCut.load('probcut_ultimate.json'))
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+
+import ai
+from ai import INF
+from board import Board, BLACK, WHITE, BOARD_SIZE
+from tournament import random_opening
+from transposition import TranspositionTable
+
+# Evreler boş kare sayısına göre (evaluate_ultimate ile aynı sınırlar): (en az, en çok) dahil
+PHASES = ((45, 60), (20, 44), (0, 19))
+
+# (sığ, derin) derinlik çiftleri
+DEFAULT_PAIRS = ((1, 3), (1, 4), (2, 5), (2, 6))
+
+# Kesme güveni: tahmin edilen skor sınırı t * sigma kadar aşmalı
+DEFAULT_THRESHOLD = 1.5
+
+# Bu derinliğin altında kesme denenmez; sığ arama kazandırmaz
+MIN_DEPTH = 3
+
+
+def phase_of(empties):
+    for index, (low, high) in enumerate(PHASES):
+        if low <= empties <= high:
+            return index
+    return len(PHASES) - 1
+
+
+class ProbCut:
+    """
+    Kalibre edilmiş parametreler. cuts[(derinlik, evre)] = [(sığ derinlik, a, b, sigma), ...].
+    Kalibre edilmemiş daha büyük derinliklerde en derin çift, derinlik farkı korunarak kullanılır.
+    """
+
+    def __init__(self, params, threshold=None):
+        self.params = params
+        self.heuristic = params.get('heuristic')
+        self.threshold = params.get('threshold', DEFAULT_THRESHOLD) if threshold is None else threshold
+        self.cuts = {}
+        for pair in params['pairs']:
+            if pair['a'] <= 0:
+                continue  # sığ skor derin skoru tahmin etmiyor
+            key = (pair['depth'], pair['phase'])
+            self.cuts.setdefault(key, []).append((pair['shallow'], pair['a'], pair['b'], pair['sigma']))
+        self.max_depth = max((depth for depth, _ in self.cuts), default=0)
+
+    @classmethod
+    def load(cls, path, threshold=None):
+        with open(path) as f:
+            return cls(json.load(f), threshold)
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.params, f, indent=2)
+            f.write('\n')
+
+    def cuts_for(self, depth, empties):
+        # Bu düğümde denenecek (sığ derinlik, a, b, sigma) listesi
+        if depth < MIN_DEPTH:
+            return ()
+        phase = phase_of(empties)
+        if depth <= self.max_depth:
+            return self.cuts.get((depth, phase), ())
+        # Kalibrasyondan derin: en derin çift, aynı derinlik farkıyla
+        return [(depth - (self.max_depth - shallow), a, b, sigma)
+                for shallow, a, b, sigma in self.cuts.get((self.max_depth, phase), ())]
+
+    def cut(self, board, depth, alpha, beta, current_tile, player_tile, heuristic_func, stop=None, stats=None):
+        """
+        pvs içinden çağrılır. Kesme olursa sınır skoru (beta ya da alpha), yoksa None döner.
+        Her çift için tek sığ arama yapılır, penceresi iki sınırın sığ skordaki karşılığıdır:
+          a * v_sığ + b >= beta + t * sigma  ->  derin skor büyük olasılıkla >= beta
+          a * v_sığ + b <= alpha - t * sigma ->  derin skor büyük olasılıkla <= alpha
+        Sığ aramalar da ProbCut kullanır (daha sığ çiftlerle); skorlar pvs gibi sıradaki tarafın açısından.
+        Sınırlardan biri sonsuzsa (tam pencere) kesme denenmez: pencere anlamsız, sığ arama boşa gider.
+        """
+        if alpha == -INF or beta == INF:
+            return None
+
+        black, white = board.get_score()
+        empties = BOARD_SIZE * BOARD_SIZE - black - white
+
+        for shallow, a, b, sigma in self.cuts_for(depth, empties):
+            margin = self.threshold * sigma
+            high = (beta + margin - b) / a
+            low = (alpha - margin - b) / a
+            score, _ = ai.pvs(board, shallow, low, high, current_tile, player_tile, heuristic_func,
+                              stop=stop, stats=stats, ply=1, probcut=self)
+            if score >= high:
+                if stats is not None:
+                    stats.probcuts += 1
+                return beta
+            if score <= low:
+                if stats is not None:
+                    stats.probcuts += 1
+                return alpha
+        return None
+
+
+def collect_positions(games, heuristic_func, depth=2, opening_plies=4, sample_every=3, seed=1):
+    """Rastgele açılışlardan self-play; her oyundan sample_every hamlede bir (tahta, sıra) örneklenir."""
+    rng = random.Random(seed)
+    positions = []
+    for _ in range(games):
+        board = Board()
+        tile = BLACK
+        for row, col in random_opening(opening_plies, rng):
+            board.apply_move(row, col, tile)
+            tile = WHITE if tile == BLACK else BLACK
+
+        ply = 0
+        while True:
+            black_moves, white_moves = board.get_moves_both()
+            if not black_moves and not white_moves:
+                break
+            if not (black_moves if tile == BLACK else white_moves):
+                tile = WHITE if tile == BLACK else BLACK
+                continue
+            if ply % sample_every == 0:
+                positions.append((board.copy(), tile))
+            move = ai.get_best_move(board, depth, tile, heuristic_func, endgame_empties=None)
+            board.apply_move(move[0], move[1], tile)
+            tile = WHITE if tile == BLACK else BLACK
+            ply += 1
+    return positions
+
+
+def calibrate(positions, heuristic_func, pairs=DEFAULT_PAIRS, threshold=DEFAULT_THRESHOLD, progress=None):
+    """
+    Her pozisyon ve derinlik için pvs skoru (sıradaki tarafın açısından), sonra her (çift, evre)
+    için en küçük kareler: derin = a * sığ + b, sigma = artıkların standart sapması.
+    """
+    depths = sorted({depth for pair in pairs for depth in pair})
+    samples = {}  # (sığ, derin, evre) -> [(x, y)]
+
+    for index, (board, tile) in enumerate(positions):
+        black, white = board.get_score()
+        phase = phase_of(BOARD_SIZE * BOARD_SIZE - black - white)
+
+        # Her derinlik ayrı tabloyla: daha derin bir kayıt sığ aramanın skorunu değiştirmesin
+        scores = {}
+        for depth in depths:
+            scores[depth], _ = ai.pvs(board, depth, -INF, INF, tile, tile, heuristic_func,
+                                      TranspositionTable(1 << 14))
+        for shallow, deep in pairs:
+            samples.setdefault((shallow, deep, phase), []).append((scores[shallow], scores[deep]))
+
+        if progress is not None:
+            progress(index + 1, len(positions))
+
+    fitted = []
+    for (shallow, deep, phase), points in sorted(samples.items()):
+        if len(points) < 3:
+            continue
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        if len(set(xs)) < 2:
+            continue
+        a, b = statistics.linear_regression(xs, ys)
+        sigma = statistics.pstdev([y - (a * x + b) for x, y in points])
+        fitted.append({
+            'shallow': shallow,
+            'depth': deep,
+            'phase': phase,
+            'a': a,
+            'b': b,
+            'sigma': sigma,
+            'samples': len(points),
+        })
+
+    return {
+        'heuristic': next((name for name, func in ai.HEURISTICS.items() if func is heuristic_func), None),
+        'threshold': threshold,
+        'phases': [list(phase) for phase in PHASES],
+        'pairs': fitted,
+    }
+
+
+def compare_reach(positions, heuristic_func, probcut, time_limit):
+    """Aynı süre limitinde ProbCut'lı ve ProbCut'sız iterative deepening'in ulaştığı derinlikler."""
+    rows = []
+    for board, tile in positions:
+        row = {}
+        for name, pc in (('full', None), ('probcut', probcut)):
+            _, _, reached = ai.iterative_deepening(board, tile, heuristic_func, time_limit=time_limit,
+                                                   tt=TranspositionTable(1 << 16), endgame_empties=None,
+                                                   probcut=pc)
+            row[name] = reached
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-ProbCut parametrelerini self-play ile kalibre eder")
+    parser.add_argument('--heuristic', choices=sorted(ai.HEURISTICS), default='ultimate')
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--play-depth', type=int, default=2, help="self-play oyunlarının arama derinliği")
+    parser.add_argument('--pairs', nargs='+', default=[f"{s}:{d}" for s, d in DEFAULT_PAIRS],
+                        help="sığ:derin derinlik çiftleri, örn: 1:3 1:4 2:5 2:6")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default=None, help="JSON dosyası (varsayılan probcut_<heuristic>.json)")
+    parser.add_argument('--compare', type=float, default=None,
+                        help="kalibrasyondan sonra bu süre limitiyle (sn) ulaşılan derinlikleri karşılaştır")
+    args = parser.parse_args()
+
+    heuristic_func = ai.HEURISTICS[args.heuristic]
+    pairs = [tuple(int(x) for x in pair.split(':')) for pair in args.pairs]
+    start = time.perf_counter()
+
+    positions = collect_positions(args.games, heuristic_func, args.play_depth, seed=args.seed)
+    print(f"{len(positions)} pozisyon toplandı ({time.perf_counter() - start:.1f} sn)")
+
+    params = calibrate(
+        positions, heuristic_func, pairs, args.threshold,
+        progress=lambda done, total: print(f"\r{done}/{total} pozisyon", end='', flush=True),
+    )
+    print()
+    probcut = ProbCut(params)
+    output = args.output or f"probcut_{args.heuristic}.json"
+    probcut.save(output)
+
+    for pair in params['pairs']:
+        print(f"evre {pair['phase']} {pair['shallow']}->{pair['depth']}: a={pair['a']:.3f} b={pair['b']:.1f} "
+              f"sigma={pair['sigma']:.1f} ({pair['samples']} örnek)")
+    print(f"{output} yazıldı ({time.perf_counter() - start:.1f} sn)")
+
+    if args.compare:
+        rows = compare_reach(positions[::max(1, len(positions) // 10)], heuristic_func, probcut, args.compare)
+        for row in rows:
+            print(f"tam: {row['full']}  probcut: {row['probcut']}")
@@ -0,0 +1,79 @@
+# search_stats.py
+
+
+class SearchStats:
+    """
+    minimax için isteğe bağlı sayaçlar. Aramaya stats=None verilirse hiçbir şey sayılmaz.
+
+    - nodes: ziyaret edilen düğüm (yapraklar dahil), leaves: heuristic çağrısı
+    - cutoffs: beta kesmeleri, cutoff_index[i]: kesmenin i. sıradaki hamlede olduğu sayı
+    - pass_nodes: pas düğümleri
+    - researches: PVS tekrar aramaları (boş pencere alpha'yı geçti ya da aspiration penceresi tutmadı)
+    - probcuts: Multi-ProbCut kesmeleri
+    - eval_time / movegen_time: heuristic ve hamle üretimi + sıralamada geçen süre (sn)
+    - iteration_nodes: iterative deepening'de her derinliğin düğüm sayısı
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.nodes = 0
+        self.leaves = 0
+        self.cutoffs = 0
+        self.cutoff_index = []
+        self.pass_nodes = 0
+        self.researches = 0
+        self.probcuts = 0
+        self.eval_time = 0.0
+        self.movegen_time = 0.0
+        self.depth = 0
+        self.iteration_nodes = []
+
+    def record_cutoff(self, index):
+        self.cutoffs += 1
+        while len(self.cutoff_index) <= index:
+            self.cutoff_index.append(0)
+        self.cutoff_index[index] += 1
+
+    def first_move_cutoff_rate(self):
+        # Sıralama kalitesi: kesmelerin ne kadarı ilk denenen hamlede oldu
+        if not self.cutoffs:
+            return 0.0
+        return self.cutoff_index[0] / self.cutoffs
+
+    def effective_branching_factor(self):
+        # Iterative deepening varsa son iki iterasyonun oranı, yoksa nodes ** (1 / depth)
+        if len(self.iteration_nodes) >= 2 and self.iteration_nodes[-2]:
+            return self.iteration_nodes[-1] / self.iteration_nodes[-2]
+        if self.depth <= 0 or self.nodes <= 1:
+            return 0.0
+        return self.nodes ** (1.0 / self.depth)
+
+    def as_dict(self):
+        return {
+            'nodes': self.nodes,
+            'leaves': self.leaves,
+            'cutoffs': self.cutoffs,
+            'cutoff_index': list(self.cutoff_index),
+            'first_move_cutoff_rate': self.first_move_cutoff_rate(),
+            'pass_nodes': self.pass_nodes,
+            'researches': self.researches,
+            'probcuts': self.probcuts,
+            'effective_branching_factor': self.effective_branching_factor(),
+            'eval_time': self.eval_time,
+            'movegen_time': self.movegen_time,
+            'depth': self.depth,
+        }
+
+    def summary(self):
+        total = self.eval_time + self.movegen_time
+        eval_share = 100 * self.eval_time / total if total else 0.0
+        cut_positions = ', '.join(f"{i + 1}.:{n}" for i, n in enumerate(self.cutoff_index[:4]) if n)
+        return (
+            f"Düğüm: {self.nodes} | Yaprak: {self.leaves} | Pas: {self.pass_nodes} | "
+            f"Tekrar arama: {self.researches} | ProbCut: {self.probcuts} | "
+            f"EBF: {self.effective_branching_factor():.2f}\n"
+            f"Kesme: {self.cutoffs} (ilk hamlede %{100 * self.first_move_cutoff_rate():.1f}; {cut_positions})\n"
+            f"Süre: heuristic {self.eval_time:.3f} sn (%{eval_share:.0f}) | hamle üretimi {self.movegen_time:.3f} sn"
+        )
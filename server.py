@@ -0,0 +1,364 @@
+# server.py
+"""
+Aynı anda çok oyun oynatan asyncio oyun sunucusu.
+
+Protokol: TCP ya da Unix soketi üzerinden satır başına bir JSON nesnesi. Her isteğe tek satır cevap
+döner; isteğin "id" alanı varsa cevaba aynen kopyalanır. Hata: {"ok": false, "error": "..."}; hatalı
+istek (beklenmeyen bir hata dahil) bağlantıyı kapatmaz.
+
+  {"op": "new", "ai": "O", "heuristic": "ultimate", "depth": 4}   -> yeni oyun (ya da "time": 0.5)
+  {"op": "move", "game": 1, "move": "d3"}                          -> insan hamlesi + AI cevabı
+                                                                      ("time" verilirse bu istekte o süre)
+  {"op": "ai", "game": 1}                                          -> sıra AI'daysa oynat ("busy" sonrası)
+  {"op": "state", "game": 1}
+  {"op": "close", "game": 1}                                       -> sadece oyunu açan bağlantı kapatabilir
+  {"op": "stats"}                                                  -> oyun, arama ve reddedilen istek sayıları
+
+Oyun cevapları: game, board (Position.to_text), turn, moves (sıradakinin geçerli hamleleri),
+ai_moves (bu istekte AI'ın oynadıkları), over, score [siyah, beyaz]. Hamlesi olmayan taraf
+otomatik pas geçer.
+
+İnsan hamlesi olay döngüsünde doğrulanıp oynanır; AI araması sınırlı bir süreç havuzunda yapılır.
+Her aramanın süre bütçesi vardır (isteğin ya da oyunun süre limiti, en fazla --max-time); sabit
+derinlikli oyunlar da bu bütçeyle iterative deepening yapar. Havuzdaki arama sayısı --max-pending ile
+sınırlıdır: dolunca yeni istekler --queue-timeout kadar yer bekler, yer açılmazsa "busy" hatası alır. Her bağlantının
+istekleri sırayla işlendiği için yavaşlayan sunucu istemcinin gönderdiklerini de okumayı bırakır.
+
+Kullanım:  python server.py --port 7777 --workers 4
+           python server.py --unix /tmp/othello.sock
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import ai
+from board import Board, BLACK, WHITE
+from position import Position
+from positions import parse_move, format_move
+from transposition import TranspositionTable
+
+DEFAULT_PORT = 7777
+DEFAULT_TIME = 1.0     # süre ya da derinlik verilmeyen oyunların hamle süresi (sn)
+MAX_TIME = 10.0        # bir aramaya verilebilecek en uzun süre (sn)
+GRACE = 5.0            # bütçeyi aşan aramaya (örn. kesin çözücü) tanınan ek süre (sn)
+QUEUE_TIMEOUT = 5.0    # havuz doluyken bir aramanın yer bekleme süresi (sn)
+MAX_LINE = 1 << 16     # bir istek satırının en fazla uzunluğu (byte)
+
+# İşçi süreçte heuristic başına transposition table; oyunlar arasında paylaşılır
+_tables = {}
+
+
+def _search_task(black, white, tile, heuristic_name, depth, time_limit):
+    # Süreç havuzunda çalışır: sadece bitboard'lar gönderilir, hamle döner
+    tt = _tables.get(heuristic_name)
+    if tt is None:
+        tt = _tables[heuristic_name] = TranspositionTable(1 << 16)
+    board = Board.from_bitboards(black, white)
+    return ai.get_best_move(board, depth, tile, ai.HEURISTICS[heuristic_name], tt=tt, time_limit=time_limit)
+
+
+class ProtocolError(Exception):
+    """İstemciye hata cevabı olarak dönen geçersiz istek."""
+
+
+def _is_int(value):
+    # JSON true/false Python'da int alt sınıfıdır; oyun numarası ya da derinlik olarak kabul edilmez
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value):
+    return (_is_int(value) or isinstance(value, float)) and math.isfinite(value)
+
+
+class GameSession:
+    """Tek oyunun durumu: tahta, sıra, AI tarafı ve arama ayarları."""
+
+    def __init__(self, game_id, ai_tile, heuristic_name, depth, time_limit):
+        self.game_id = game_id
+        self.board = Board()
+        self.turn = BLACK
+        self.ai_tile = ai_tile
+        self.heuristic_name = heuristic_name
+        self.depth = depth
+        self.time_limit = time_limit
+        self.history = []
+        # Aynı oyuna gelen istekler sırayla işlenir
+        self.lock = asyncio.Lock()
+
+    def over(self):
+        black_moves, white_moves = self.board.get_moves_both()
+        return not black_moves and not white_moves
+
+    def play(self, move):
+        self.board.apply_move(move[0], move[1], self.turn)
+        self.history.append(move)
+        self.turn = WHITE if self.turn == BLACK else BLACK
+        # Hamlesi olmayan taraf pas geçer (oyun bittiyse sıra olduğu gibi kalır)
+        if not self.board.has_valid_move(self.turn) and not self.over():
+            self.history.append(None)
+            self.turn = WHITE if self.turn == BLACK else BLACK
+
+    def state(self):
+        black, white = self.board.get_score()
+        return {
+            'game': self.game_id,
+            'board': Position.from_board(self.board, self.turn).to_text(),
+            'turn': self.turn,
+            'moves': [format_move(move) for move in self.board.get_valid_moves(self.turn)],
+            'over': self.over(),
+            'score': [black, white],
+        }
+
+
+class GameServer:
+    """
+    Oturumlar ve süreç havuzu. max_pending: havuza gönderilmiş (çalışan + kuyrukta) en fazla arama.
+    max_time: bir aramanın süre bütçesi üst sınırı. queue_timeout: havuz doluyken bekleme sınırı.
+    """
+
+    def __init__(self, workers=None, max_pending=None, max_time=MAX_TIME, queue_timeout=QUEUE_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.workers
+        self.max_time = max_time
+        self.queue_timeout = queue_timeout
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.pending = asyncio.Semaphore(self.max_pending)
+        self.sessions = {}
+        self.game_ids = itertools.count(1)
+        self.searches = 0
+        self.rejected = 0
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    async def handle_client(self, reader, writer):
+        # Bağlantı kapanınca o bağlantıda açılan oyunlar silinir
+        owned = set()
+        try:
+            while True:
+                line = await self._read_line(reader)
+                if line is None:
+                    error = f"istek satırı çok uzun (en fazla {MAX_LINE} byte)"
+                    await self._send(writer, {'ok': False, 'error': error})
+                    continue
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await self._send(writer, await self.handle_line(line, owned))
+        except ConnectionError:
+            pass
+        finally:
+            for game_id in owned:
+                self.sessions.pop(game_id, None)
+            writer.close()
+
+    async def _read_line(self, reader):
+        # Satır (EOF'ta b'') döner; sınırı aşan satırın kalanı sonraki isteğe karışmasın diye
+        # satır sonuna kadar okunup atılır ve None döner
+        try:
+            return await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+        while True:
+            try:
+                await reader.readexactly(consumed)
+                await reader.readuntil(b'\n')
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
+
+    async def _send(self, writer, response):
+        writer.write(json.dumps(response, ensure_ascii=False).encode() + b'\n')
+        await writer.drain()
+
+    async def handle_line(self, line, owned):
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ProtocolError("istek bir JSON nesnesi olmalı")
+            request_id = request.get('id')
+            response = await self.handle(request, owned)
+            response['ok'] = True
+        except ProtocolError as e:
+            response = {'ok': False, 'error': str(e)}
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            response = {'ok': False, 'error': f"geçersiz JSON: {e}"}
+        except Exception as e:
+            # Tek isteğin hatası bağlantıyı ve bağlantının oyunlarını düşürmesin
+            response = {'ok': False, 'error': f"iç hata: {type(e).__name__}: {e}"}
+        if request_id is not None:
+            response['id'] = request_id
+        return response
+
+    async def handle(self, request, owned):
+        op = request.get('op')
+        if op == 'new':
+            session = self._new_session(request)
+            owned.add(session.game_id)
+            async with session.lock:
+                ai_moves = await self._play_ai(session)
+            return dict(session.state(), ai_moves=ai_moves)
+
+        if op == 'stats':
+            return {'games': len(self.sessions), 'workers': self.workers, 'max_pending': self.max_pending,
+                    'searches': self.searches, 'rejected': self.rejected}
+
+        game_id = request.get('game')
+        session = self.sessions.get(game_id) if _is_int(game_id) else None
+        if session is None:
+            raise ProtocolError(f"oyun yok: {request.get('game')!r}")
+
+        if op == 'state':
+            return session.state()
+        if op == 'close':
+            if session.game_id not in owned:
+                raise ProtocolError(f"oyun bu bağlantının değil: {session.game_id}")
+            # Süren bir hamle (AI araması) bitmeden oyun silinmez
+            async with session.lock:
+                self.sessions.pop(session.game_id, None)
+                owned.discard(session.game_id)
+            return {'game': session.game_id}
+        if op == 'move':
+            time_limit = self._time_limit(request)
+            async with session.lock:
+                move = self._human_move(session, request.get('move'))
+                session.play(move)
+                ai_moves = await self._play_ai(session, time_limit)
+            return dict(session.state(), ai_moves=ai_moves)
+        if op == 'ai':
+            time_limit = self._time_limit(request)
+            async with session.lock:
+                ai_moves = await self._play_ai(session, time_limit)
+            return dict(session.state(), ai_moves=ai_moves)
+
+        raise ProtocolError(f"bilinmeyen op: {op!r} (new, move, ai, state, close, stats)")
+
+    def _new_session(self, request):
+        ai_tile = request.get('ai', WHITE)
+        if ai_tile not in (BLACK, WHITE):
+            raise ProtocolError(f"ai {BLACK!r} ya da {WHITE!r} olmalı")
+        heuristic_name = request.get('heuristic', 'ultimate')
+        if not isinstance(heuristic_name, str) or heuristic_name not in ai.HEURISTICS:
+            raise ProtocolError(f"bilinmeyen heuristic: {heuristic_name!r} ({', '.join(sorted(ai.HEURISTICS))})")
+
+        depth = request.get('depth')
+        time_limit = self._time_limit(request)
+        if depth is not None and (not _is_int(depth) or depth < 1):
+            raise ProtocolError("depth pozitif tamsayı olmalı")
+        if depth is None and time_limit is None:
+            time_limit = DEFAULT_TIME
+
+        session = GameSession(next(self.game_ids), ai_tile, heuristic_name, depth, time_limit)
+        self.sessions[session.game_id] = session
+        return session
+
+    def _time_limit(self, request):
+        time_limit = request.get('time')
+        if time_limit is not None and (not _is_number(time_limit) or time_limit <= 0):
+            raise ProtocolError("time pozitif sayı olmalı")
+        return time_limit
+
+    def _human_move(self, session, text):
+        # Olay döngüsünde: doğrulama ucuz, havuza gitmeye gerek yok
+        if session.over():
+            raise ProtocolError("oyun bitti")
+        if session.turn == session.ai_tile:
+            raise ProtocolError("sıra AI'da")
+        if not isinstance(text, str):
+            raise ProtocolError("move 'd3' gibi bir kare olmalı")
+        try:
+            move = parse_move(text)
+        except ValueError as e:
+            raise ProtocolError(str(e)) from None
+        if not session.board.is_valid_move(move[0], move[1], session.turn):
+            raise ProtocolError(f"geçersiz hamle: {text}")
+        return move
+
+    async def _play_ai(self, session, time_limit=None):
+        # İnsan pas geçiyorsa AI art arda oynar
+        ai_moves = []
+        while session.turn == session.ai_tile and not session.over():
+            move = await self._search(session, time_limit or session.time_limit)
+            session.play(move)
+            ai_moves.append(format_move(move))
+        return ai_moves
+
+    async def _search(self, session, time_limit):
+        budget = min(time_limit or self.max_time, self.max_time)
+        # Geri basınç: havuz doluysa queue_timeout kadar yer beklenir
+        try:
+            await asyncio.wait_for(self.pending.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise ProtocolError("busy: arama kuyruğu dolu") from None
+
+        loop = asyncio.get_running_loop()
+        try:
+            job = self.executor.submit(
+                _search_task, session.board.black, session.board.white, session.turn,
+                session.heuristic_name, session.depth, budget,
+            )
+        except BaseException:
+            self.pending.release()
+            raise
+        self.searches += 1
+        # Yer arama gerçekten bitince açılır: süre aşımında cevap beklenmez ama işçi süreç hâlâ
+        # meşguldür, yer hemen bırakılsaydı havuza max_pending'den fazla arama girerdi
+        job.add_done_callback(lambda _: self._release(loop))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), budget + GRACE)
+        except asyncio.TimeoutError:
+            raise ProtocolError("arama süre bütçesini aştı") from None
+
+    def _release(self, loop):
+        # Havuzun iş parçacığından çağrılır; semafor olay döngüsünde bırakılır
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self.pending.release)
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, unix_path=None, workers=None, max_pending=None,
+                max_time=MAX_TIME, queue_timeout=QUEUE_TIMEOUT):
+    game_server = GameServer(workers, max_pending, max_time, queue_timeout)
+    try:
+        if unix_path is not None:
+            server = await asyncio.start_unix_server(game_server.handle_client, unix_path, limit=MAX_LINE)
+            where = unix_path
+        else:
+            server = await asyncio.start_server(game_server.handle_client, host, port, limit=MAX_LINE)
+            where = f"{host}:{port}"
+        print(f"Othello sunucusu: {where} ({game_server.workers} işçi, en fazla {game_server.max_pending} "
+              f"bekleyen arama)", flush=True)
+        async with server:
+            await server.serve_forever()
+    finally:
+        game_server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Satır başına JSON protokolüyle çok oyunlu Othello sunucusu")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', default=None, help="TCP yerine bu Unix soketini dinle")
+    parser.add_argument('--workers', type=int, default=None, help="arama süreci sayısı (varsayılan CPU sayısı)")
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help="havuzdaki en fazla arama (varsayılan 2 * işçi); dolunca istekler bekler")
+    parser.add_argument('--max-time', type=float, default=MAX_TIME, help="arama başına en uzun süre (sn)")
+    parser.add_argument('--queue-timeout', type=float, default=QUEUE_TIMEOUT,
+                        help="havuz doluyken aramanın yer bekleme süresi (sn); aşılırsa 'busy'")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.max_pending, args.max_time,
+                          args.queue_timeout))
+    except KeyboardInterrupt:
+        pass
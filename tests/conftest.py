@@ -0,0 +1,29 @@
+# tests/conftest.py
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board import Board, BLACK, WHITE  # noqa: E402
+
+
+def random_game(seed, plies=60):
+    """Rastgele oynanan bir oyunun pozisyonları: [(board, sıradaki taş)] (her hamleden önce)."""
+    rng = random.Random(seed)
+    board = Board()
+    tile = BLACK
+    positions = []
+    while len(positions) < plies:
+        moves = board.get_valid_moves(tile)
+        other = WHITE if tile == BLACK else BLACK
+        if not moves:
+            if not board.has_valid_move(other):
+                break
+            tile = other
+            continue
+        positions.append((board.copy(), tile))
+        row, col = rng.choice(moves)
+        board.apply_move(row, col, tile)
+        tile = other
+    return positions
@@ -0,0 +1,68 @@
+# tests/test_analyze.py
+import json
+import os
+import subprocess
+import sys
+
+import ai
+from analyze import analyze_line, analyze_stream, parse_position
+from board import Board, BLACK
+from position import Position
+from positions import MIDGAME_LINES, play_line
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LINES = (
+    ['# yorum', ''] + MIDGAME_LINES[:3] + ['z9', Position.from_board(Board()).to_text()] + MIDGAME_LINES[3:6]
+)
+
+
+def test_stream_preserves_input_order():
+    results = list(analyze_stream(LINES, depth=2, heuristic_name='h2', workers=2, window=2))
+    numbers = [number for number, text in enumerate(LINES, 1) if text and not text.startswith('#')]
+    assert [result['line'] for result in results] == numbers
+    # Sonuçlar işçi sayısından bağımsız: seri analizle aynı
+    for result in results:
+        assert result == analyze_line(result['line'], LINES[result['line'] - 1], 2, 'h2')
+    assert 'error' in results[3]
+
+
+def test_stream_reads_input_lazily():
+    consumed = []
+
+    def lines():
+        for text in MIDGAME_LINES:
+            consumed.append(text)
+            yield text
+
+    stream = analyze_stream(lines(), depth=1, heuristic_name='h1', workers=1, window=2)
+    first = next(stream)
+    assert first['line'] == 1 and len(consumed) <= 3
+    assert len(list(stream)) == len(MIDGAME_LINES) - 1
+
+
+def test_scores_and_principal_variation():
+    result = analyze_line(1, MIDGAME_LINES[0], 3, 'ultimate')
+    board, tile = play_line(MIDGAME_LINES[0])
+    assert result['turn'] == tile
+    assert len(result['moves']) == len(board.get_valid_moves(tile))
+    scores = [move['score'] for move in result['moves']]
+    assert scores == sorted(scores, reverse=True)
+    expected = ai.minimax(board.copy(), 3, -ai.INF, ai.INF, True, tile, ai.evaluate_ultimate)[0]
+    assert result['score'] == scores[0] == expected
+    assert result['pv'][0] == result['best'] and len(result['pv']) >= 3
+
+
+def test_parse_position_formats():
+    board, tile = parse_position(Position.from_board(Board()).to_text())
+    assert tile == BLACK and board.get_score() == (2, 2)
+    assert parse_position('f5')[0].get_score() == (4, 1)
+
+
+def test_cli_streams_jsonl_from_stdin():
+    completed = subprocess.run(
+        [sys.executable, 'analyze.py', '--depth', '1', '--heuristic', 'h1', '--workers', '1'],
+        input='\n'.join(MIDGAME_LINES[:3]) + '\n', capture_output=True, text=True, cwd=ROOT, check=True,
+    )
+    results = [json.loads(line) for line in completed.stdout.splitlines()]
+    assert [result['line'] for result in results] == [1, 2, 3]
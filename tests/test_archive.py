@@ -0,0 +1,65 @@
+# tests/test_archive.py
+import random
+
+from archive import ArchiveWriter, GameArchive, import_lines
+from board import Board, BLACK, WHITE, BOARD_SIZE
+from positions import format_move
+
+
+def random_moves(seed):
+    """Rastgele bir oyun: (hamleler, her hamleden önceki (siyah, beyaz, sıradaki taş), siyah - beyaz)."""
+    rng = random.Random(seed)
+    board = Board()
+    tile = BLACK
+    moves, positions = [], []
+    while True:
+        valid = board.get_valid_moves(tile)
+        other = WHITE if tile == BLACK else BLACK
+        if not valid:
+            if not board.has_valid_move(other):
+                break
+            tile = other
+            continue
+        positions.append((board.black, board.white, tile))
+        move = rng.choice(valid)
+        moves.append(move)
+        board.apply_move(move[0], move[1], tile)
+        tile = other
+    black, white = board.get_score()
+    return moves, positions, black - white
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'games.oar'
+    games = [random_moves(seed) for seed in range(30)]
+    with ArchiveWriter(path) as writer:
+        for moves, _, _ in games:
+            writer.add_game(moves)
+
+    with GameArchive(path) as archive:
+        assert len(archive) == len(games)
+        for n, (moves, positions, result) in enumerate(games):
+            assert archive.moves(n) == moves
+            assert archive.result(n) == result
+            assert list(archive.positions(n)) == positions
+            board, tile = archive.board(n, 10)
+            assert (board.black, board.white, tile) == positions[10]
+        assert archive.verify_all() == []
+
+        samples = list(archive.iter_samples())
+        expected = [(position, result) for _, positions, result in games for position in positions]
+        assert len(samples) == len(expected)
+        for (own, opp, empties, label), ((black, white, tile), result) in zip(samples, expected):
+            assert (own, opp) == ((black, white) if tile == BLACK else (white, black))
+            assert empties == BOARD_SIZE * BOARD_SIZE - (black | white).bit_count()
+            assert label == (result if tile == BLACK else -result)
+
+
+def test_import_skips_invalid_lines(tmp_path):
+    path = tmp_path / 'games.oar'
+    moves, _, result = random_moves(1)
+    lines = ['# yorum', ''.join(format_move(move) for move in moves), 'a1a1', '']
+    assert import_lines(lines, path) == (1, 1)
+    with GameArchive(path) as archive:
+        assert archive.moves(0) == moves
+        assert archive.result(0) == result
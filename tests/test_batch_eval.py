@@ -0,0 +1,30 @@
+# tests/test_batch_eval.py
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import ai  # noqa: E402
+import batch_eval  # noqa: E402
+from board import BLACK, WHITE  # noqa: E402
+from conftest import random_game  # noqa: E402
+
+BOARDS = [board for seed in range(5) for board, _ in random_game(seed)]
+
+
+@pytest.mark.parametrize('tile', [BLACK, WHITE])
+def test_batch_matches_single_board(tile):
+    results = batch_eval.evaluate_all(batch_eval.from_boards(BOARDS), tile)
+    for index, board in enumerate(BOARDS):
+        assert results['disc_parity'][index] == pytest.approx(ai.coin_parity(board, tile))
+        assert results['positional'][index] == ai.positional_score(board, tile)
+        assert tuple(results['corners'][index]) == tuple(ai.count_corners(board, tile))
+        assert tuple(results['frontier'][index]) == tuple(ai.frontier_counts(board, tile))
+        assert results['mobility'][index] == pytest.approx(ai.mobility(board, tile))
+
+
+def test_grid_input_matches_bitboards():
+    grids = np.array([[[1 if cell == BLACK else -1 if cell == WHITE else 0 for cell in row]
+                       for row in board.grid] for board in BOARDS], dtype=np.int8)
+    black, white = batch_eval.to_bitboards(grids)
+    assert black.tolist() == [board.black for board in BOARDS]
+    assert white.tolist() == [board.white for board in BOARDS]
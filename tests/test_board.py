@@ -0,0 +1,86 @@
+# tests/test_board.py
+import random
+
+import pytest
+
+from board import Board, GridBoard, BLACK, WHITE, BOARD_SIZE
+
+
+def grid_of(reference):
+    # GridBoard.grid değiştirilebilir liste; Board.grid sadece okunur tuple
+    return tuple(tuple(row) for row in reference.grid)
+
+
+def test_bitboard_matches_grid_board():
+    for seed in range(20):
+        rng = random.Random(seed)
+        board, reference = Board(), GridBoard()
+        tile = BLACK
+        while True:
+            moves = board.get_valid_moves(tile)
+            assert moves == reference.get_valid_moves(tile)
+            assert board.get_moves_both() == reference.get_moves_both()
+            other = WHITE if tile == BLACK else BLACK
+            if not moves:
+                if not board.has_valid_move(other):
+                    break
+                tile = other
+                continue
+
+            for row, col in moves:
+                assert (sorted(board.get_tiles_to_flip(row, col, tile))
+                        == sorted(reference.get_tiles_to_flip(row, col, tile)))
+            row, col = rng.choice(moves)
+            assert board.apply_move(row, col, tile) and reference.apply_move(row, col, tile)
+            assert board.grid == grid_of(reference)
+            assert board.get_score() == reference.get_score()
+            assert board.get_positional_sums() == reference.get_positional_sums()
+            assert board.get_corner_counts() == reference.get_corner_counts()
+            tile = other
+
+
+def test_invalid_moves_rejected():
+    board, reference = Board(), GridBoard()
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            assert board.is_valid_move(row, col, BLACK) == reference.is_valid_move(row, col, BLACK)
+    assert not board.apply_move(0, 0, BLACK)
+    assert not board.apply_move(3, 3, BLACK)
+    assert board.grid == grid_of(reference)
+
+
+def test_make_unmake_restores_board():
+    rng = random.Random(7)
+    board = Board()
+    tile = BLACK
+    for _ in range(40):
+        moves = board.get_valid_moves(tile)
+        if not moves:
+            tile = WHITE if tile == BLACK else BLACK
+            continue
+        for row, col in moves:
+            before = (board.black, board.white, board.get_positional_sums(), board.get_corner_counts())
+            flips = board.make_move(row * BOARD_SIZE + col, tile)
+            board.unmake_move(row * BOARD_SIZE + col, tile, flips)
+            assert (board.black, board.white, board.get_positional_sums(), board.get_corner_counts()) == before
+        row, col = rng.choice(moves)
+        board.apply_move(row, col, tile)
+        tile = WHITE if tile == BLACK else BLACK
+
+
+def test_grid_is_read_only():
+    board = Board()
+    with pytest.raises(TypeError):
+        board.grid[0][0] = BLACK
+    with pytest.raises(AttributeError):
+        board.grid = GridBoard().grid
+    assert Board.from_grid(GridBoard().grid).grid == board.grid
+
+
+def test_invalidate_moves_recomputes():
+    board = Board()
+    moves = board.get_moves_both()
+    assert board.get_moves_both() is moves
+    board.invalidate_moves()
+    assert board.get_moves_both() is not moves
+    assert board.get_moves_both() == moves
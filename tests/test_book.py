@@ -0,0 +1,88 @@
+# tests/test_book.py
+import random
+
+import pytest
+
+import ai
+from board import Board, BLACK, WHITE, transform_mask, transform_move
+from book import OpeningBook, build_book, write_book
+
+
+def transformed(board, k):
+    return Board.from_bitboards(transform_mask(board.black, k), transform_mask(board.white, k))
+
+
+@pytest.fixture(scope='module')
+def book_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp('book') / 'book.bin'
+    entries = build_book(plies=3, depth=2, heuristic_func=ai.evaluate_h1, width=4)
+    write_book(str(path), entries, 3)
+    return str(path)
+
+
+def book_positions():
+    # Kitaptaki ilk iki hamlenin tüm dalları
+    positions = [(Board(), BLACK)]
+    for move in Board().get_valid_moves(BLACK):
+        board = Board()
+        board.apply_move(move[0], move[1], BLACK)
+        positions.append((board, WHITE))
+    return positions
+
+
+def test_lookup_under_symmetry(book_path):
+    with OpeningBook(book_path) as book:
+        for board, tile in book_positions():
+            moves = book.moves(board, tile)
+            assert moves
+            assert sorted(move for move, _ in moves) == sorted(board.get_valid_moves(tile))
+            for k in range(8):
+                expected = sorted((transform_move(move, k), score) for move, score in moves)
+                assert sorted(book.moves(transformed(board, k), tile)) == expected
+
+
+def test_book_scores_match_search(book_path):
+    with OpeningBook(book_path) as book:
+        for board, tile in book_positions():
+            move, score = book.lookup(board, tile)
+            assert score == book.moves(board, tile)[0][1]
+            expected = ai.minimax(board.copy(), 2, -ai.INF, ai.INF, True, tile, ai.evaluate_h1)[0]
+            assert score == pytest.approx(expected, rel=1e-6)
+
+
+def test_max_ply_and_unknown_positions(book_path):
+    with OpeningBook(book_path, max_ply=1) as book:
+        board, tile = book_positions()[1]
+        assert book.lookup(board, tile) is None
+        assert book.lookup(Board(), BLACK) is not None
+    with OpeningBook(book_path) as book:
+        # Kitap derinliğinden sonraki pozisyonlar kitapta yok
+        board = Board()
+        tile = BLACK
+        for _ in range(4):
+            row, col = board.get_valid_moves(tile)[0]
+            board.apply_move(row, col, tile)
+            tile = WHITE if tile == BLACK else BLACK
+        assert book.lookup(board, tile) is None
+
+
+def test_variation_picks_near_best(book_path):
+    with OpeningBook(book_path, variation=1e9, rng=random.Random(1)) as book:
+        board, tile = book_positions()[1]
+        picks = {book.lookup(board, tile)[0] for _ in range(50)}
+        assert picks == set(board.get_valid_moves(tile))
+
+
+def test_get_best_move_uses_book(book_path):
+    with OpeningBook(book_path) as book:
+        board, tile = book_positions()[2]
+        moves = book.moves(board, tile)
+        best = [move for move, score in moves if score == moves[0][1]]
+        assert ai.get_best_move(board, 6, tile, book=book) in best
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'bad.bin'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        len(OpeningBook(str(path)))
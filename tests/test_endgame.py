@@ -0,0 +1,53 @@
+# tests/test_endgame.py
+import random
+
+import ai
+from ai import INF
+from board import BLACK
+from endgame import STOP_CHECK_NODES, EndgameSolver, random_endgame
+
+
+def disc_difference(board, player_tile):
+    black, white = board.get_score()
+    return black - white if player_tile == BLACK else white - black
+
+
+def test_solver_matches_minimax():
+    rng = random.Random(1)
+    for empties in (4, 6, 8, 9):
+        for _ in range(4):
+            board, tile = random_endgame(empties, rng)
+            score, move = EndgameSolver().solve(board, tile)
+            expected, _ = ai.minimax(board.copy(), empties, -INF, INF, True, tile, disc_difference)
+            assert score == expected
+
+            # Bulunan hamle de aynı skoru vermeli
+            child = board.copy()
+            child.apply_move(move[0], move[1], tile)
+            reply, _ = ai.minimax(child, empties - 1, -INF, INF, False, tile, disc_difference)
+            assert reply == score
+
+
+def test_solver_win_loss_window():
+    rng = random.Random(2)
+    for _ in range(5):
+        board, tile = random_endgame(9, rng)
+        score, _ = EndgameSolver().solve(board, tile)
+        result, _ = EndgameSolver().solve_win_loss(board, tile)
+        assert result == (score > 0) - (score < 0)
+
+
+def test_solver_stop_polled_inside_search():
+    board, tile = random_endgame(16, random.Random(3))
+    solver = EndgameSolver()
+    limit = 3 * STOP_CHECK_NODES
+    assert solver.solve(board, tile, stop=lambda: solver.nodes >= limit) == (None, None)
+    assert solver.nodes < limit + 2 * STOP_CHECK_NODES
+
+
+def test_iterative_deepening_honours_time_limit_in_endgame():
+    board, tile = random_endgame(16, random.Random(4))
+    move, score, reached = ai.iterative_deepening(board, tile, ai.evaluate_ultimate, time_limit=0.05,
+                                                  endgame_empties=16)
+    assert move in board.get_valid_moves(tile)
+    assert 1 <= reached <= ai.ENDGAME_FALLBACK_DEPTH
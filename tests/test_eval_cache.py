@@ -0,0 +1,51 @@
+# tests/test_eval_cache.py
+import pytest
+
+import ai
+from board import BLACK, WHITE
+from conftest import random_game
+from eval_cache import EvalCache
+from positions import midgame_positions
+
+
+@pytest.mark.parametrize('name', sorted(ai.HEURISTICS))
+def test_cached_values_match(name):
+    heuristic_func = ai.HEURISTICS[name]
+    cache = EvalCache(64)
+    cached = cache.wrap(heuristic_func)
+    positions = random_game(1) + random_game(2)
+    # Her pozisyon iki kez: ilki hesaplanır, ikincisi önbellekten; 64 kaydı aşınca eskiler atılır
+    for board, _ in positions:
+        for tile in (BLACK, WHITE):
+            expected = heuristic_func(board, tile)
+            assert cached(board, tile) == expected
+            assert cached(board, tile) == expected
+    assert cache.hits == cache.misses == 2 * len(positions)
+    assert cache.evictions == 2 * len(positions) - 64
+    assert len(cache.entries) == 64
+
+
+def test_search_with_cache_matches_uncached():
+    cache = EvalCache()
+    for board, tile in midgame_positions():
+        for depth in (2, 3):
+            expected = ai.get_best_move(board.copy(), depth, tile, ai.evaluate_ultimate, endgame_empties=None)
+            move = ai.get_best_move(board.copy(), depth, tile, ai.evaluate_ultimate, endgame_empties=None,
+                                    eval_cache=cache)
+            assert move == expected
+    # Önbellek hamleler arasında tutulur; derinlik 3 araması derinlik 2'nin yapraklarını tekrar kullanır
+    assert cache.hits > 0
+
+
+def test_heuristic_change_clears_cache():
+    cache = EvalCache()
+    board, tile = midgame_positions()[0]
+    cache.wrap(ai.evaluate_h1)(board, tile)
+    assert len(cache.entries) == 1
+    assert cache.wrap(ai.evaluate_h2)(board, tile) == ai.evaluate_h2(board, tile)
+    assert cache.misses == 1 and len(cache.entries) == 1
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        EvalCache(0)
@@ -0,0 +1,59 @@
+# tests/test_iterative_deepening.py
+import threading
+import time
+
+import pytest
+
+import ai
+from board import Board, BLACK
+from positions import midgame_positions
+from search_stats import SearchStats
+from transposition import TranspositionTable
+
+
+def test_requires_depth_or_time():
+    with pytest.raises(ValueError):
+        ai.iterative_deepening(Board(), BLACK)
+
+
+def test_fixed_depth_matches_get_best_move():
+    board, tile = midgame_positions()[1]
+    stats = SearchStats()
+    move, score, reached = ai.iterative_deepening(board, tile, ai.evaluate_ultimate, max_depth=4, stats=stats)
+    assert reached == 4 and len(stats.iteration_nodes) == 4
+    assert move == ai.get_best_move(board.copy(), 4, tile, ai.evaluate_ultimate)
+
+
+@pytest.mark.parametrize('time_limit', [0.05, 0.3])
+def test_time_limit(time_limit):
+    board, tile = midgame_positions()[2]
+    before = board.copy()
+    start = time.perf_counter()
+    move, _, reached = ai.iterative_deepening(board, tile, ai.evaluate_ultimate, time_limit=time_limit,
+                                              tt=TranspositionTable(1 << 16))
+    elapsed = time.perf_counter() - start
+    # Süre düğüm başına kontrol edilir; kesilen iterasyon en fazla bir düğüm kadar taşar
+    assert elapsed < time_limit + 0.1
+    assert reached >= 1 and move in board.get_valid_moves(tile)
+    # Kesilen arama kopya üzerinde yapılır
+    assert (board.black, board.white) == (before.black, before.white)
+
+
+def test_cancel_stops_search():
+    board, tile = midgame_positions()[3]
+    event = threading.Event()
+    timer = threading.Timer(0.1, event.set)
+    timer.start()
+    start = time.perf_counter()
+    try:
+        move, _, reached = ai.iterative_deepening(board, tile, ai.evaluate_ultimate, max_depth=60,
+                                                  cancel=event.is_set)
+    finally:
+        timer.cancel()
+    assert time.perf_counter() - start < 0.3
+    assert 1 <= reached < 60 and move in board.get_valid_moves(tile)
+
+
+def test_cancel_before_start_returns_nothing():
+    board, tile = midgame_positions()[0]
+    assert ai.iterative_deepening(board, tile, max_depth=3, cancel=lambda: True) == (None, None, 0)
@@ -0,0 +1,25 @@
+# tests/test_parallel.py
+import ai
+from ai import INF
+from board import Board, BLACK
+from parallel import ParallelSearcher
+from positions import midgame_positions
+
+
+def test_parallel_matches_serial_pvs():
+    positions = [(Board(), BLACK)] + midgame_positions()
+    with ParallelSearcher(2) as searcher:
+        for depth in (2, 3):
+            for board, tile in positions:
+                expected = ai.pvs(board.copy(), depth, -INF, INF, tile, tile, ai.evaluate_ultimate,
+                                  unique_moves=True)
+                # İşçi tabloları her pozisyonda boş değil; skor ve hamle yine aynı olmalı
+                assert searcher.search(board.copy(), depth, tile, ai.evaluate_ultimate) == expected
+
+
+def test_get_best_move_uses_parallel_searcher():
+    board, tile = midgame_positions()[0]
+    with ParallelSearcher(2) as searcher:
+        move = ai.get_best_move(board.copy(), 3, tile, ai.evaluate_ultimate, parallel=searcher)
+        assert searcher.search_id == 1
+    assert move == ai.get_best_move(board.copy(), 3, tile, ai.evaluate_ultimate)
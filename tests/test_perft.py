@@ -0,0 +1,10 @@
+# tests/test_perft.py
+import pytest
+
+from bench import PERFT_EXPECTED, perft
+from board import Board, BLACK
+
+
+@pytest.mark.parametrize('depth', range(1, 7))
+def test_perft_start_position(depth):
+    assert perft(Board(), depth, BLACK) == PERFT_EXPECTED[depth]
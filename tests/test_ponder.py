@@ -0,0 +1,87 @@
+# tests/test_ponder.py
+import random
+import time
+
+import ai
+from ai import INF
+from board import BLACK, WHITE
+from endgame import EndgameSolver, random_endgame
+from main import get_ai_move
+from ponder import Ponderer, PREDICTED
+from positions import midgame_positions
+
+
+def wait_for(ponderer, replies, depth, timeout=30.0):
+    # Pondering derinliğe ulaşınca kendiliğinden biter; test bunu bekler
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if all(ponderer.answer(move) is not None and ponderer.answer(move)[2] >= depth for move in replies):
+            break
+        time.sleep(0.01)
+    ponderer.stop()
+
+
+def after(board, move, tile):
+    board = board.copy()
+    board.apply_move(move[0], move[1], tile)
+    return board
+
+
+def test_ponder_prepares_every_reply():
+    board, human = midgame_positions()[4]
+    ai_tile = WHITE if human == BLACK else BLACK
+    replies = [move for move in board.get_valid_moves(human) if after(board, move, human).has_valid_move(ai_tile)]
+    assert replies
+    ponderer = Ponderer(board, ai_tile, ai.evaluate_ultimate, depth=3).start()
+    wait_for(ponderer, replies, 3)
+
+    for move in replies:
+        reply, score, depth, _ = ponderer.answer(move)
+        child = after(board, move, human)
+        assert depth == 3 and reply in child.get_valid_moves(ai_tile)
+        assert score == ai.pvs(child, 3, -INF, INF, ai_tile, ai_tile, ai.evaluate_ultimate)[0]
+
+
+def test_ponder_hit_returns_prepared_move(capsys):
+    board, human = midgame_positions()[1]
+    ai_tile = WHITE if human == BLACK else BLACK
+    ponderer = Ponderer(board, ai_tile, ai.evaluate_ultimate, depth=3, mode=PREDICTED).start()
+    predicted = None
+    deadline = time.monotonic() + 30.0
+    while predicted is None and time.monotonic() < deadline:
+        predicted = ponderer.predicted
+        time.sleep(0.01)
+    wait_for(ponderer, [predicted], 3)
+    assert set(ponderer.answers) == {predicted}
+
+    ready = ponderer.answer(predicted)
+    start = time.perf_counter()
+    move = get_ai_move(after(board, predicted, human), ai_tile, 3, ai.evaluate_ultimate, ready=ready)
+    assert time.perf_counter() - start < 0.05
+    assert move == ready[0]
+    assert "siz düşünürken hazırlandı" in capsys.readouterr().out
+
+
+def test_stop_cancels_unbounded_pondering():
+    board, human = midgame_positions()[2]
+    ai_tile = WHITE if human == BLACK else BLACK
+    ponderer = Ponderer(board, ai_tile, ai.evaluate_ultimate, time_limit=1.0).start()
+    time.sleep(0.2)
+    start = time.perf_counter()
+    ponderer.stop()
+    assert time.perf_counter() - start < 0.2
+    assert ponderer.answer(ponderer.predicted) is not None
+
+
+def test_endgame_replies_are_solved():
+    board, human = random_endgame(11, random.Random(3))
+    ai_tile = WHITE if human == BLACK else BLACK
+    replies = [move for move in board.get_valid_moves(human) if after(board, move, human).has_valid_move(ai_tile)]
+    assert replies
+    ponderer = Ponderer(board, ai_tile, ai.evaluate_ultimate, depth=2).start()
+    wait_for(ponderer, replies, 10)
+
+    for move in replies:
+        reply, score, depth, _ = ponderer.answer(move)
+        assert depth == 10
+        assert score == EndgameSolver().solve(after(board, move, human), ai_tile)[0]
@@ -0,0 +1,64 @@
+# tests/test_position.py
+import pickle
+
+import pytest
+
+from board import Board, BLACK, WHITE
+from conftest import random_game
+from position import Position
+
+
+def test_play_matches_board():
+    for seed in range(20):
+        for board, tile in random_game(seed):
+            position = Position.from_board(board, tile)
+            assert position.valid_moves() == board.get_valid_moves(tile)
+            for row, col in position.valid_moves():
+                after = position.play(row, col)
+                child = board.copy()
+                child.apply_move(row, col, tile)
+                assert (after.black, after.white) == (child.black, child.white)
+                assert after.turn == (WHITE if tile == BLACK else BLACK)
+                # Hamle orijinal pozisyonu değiştirmez; geri almak eski değeri kullanmaktır
+                assert position == Position.from_board(board, tile)
+
+
+def test_round_trips():
+    for board, tile in random_game(3):
+        position = Position.from_board(board, tile)
+        back = position.to_board()
+        assert (back.black, back.white) == (board.black, board.white)
+        assert Position.from_text(position.to_text()) == position
+        assert pickle.loads(pickle.dumps(position)) == position
+        assert position.pass_turn().pass_turn() == position
+        assert position.zobrist() == Position.from_board(back, tile).zobrist()
+
+
+def test_hash_and_equality():
+    start = Position.from_board(Board())
+    assert start == Position.from_board(Board(), BLACK)
+    assert start != start.pass_turn()
+    assert len({start, Position.from_board(Board()), start.pass_turn()}) == 2
+
+
+def test_immutable():
+    position = Position.from_board(Board())
+    with pytest.raises(AttributeError):
+        position.turn = WHITE
+    with pytest.raises(AttributeError):
+        del position.black
+
+
+@pytest.mark.parametrize('move', [(2, 2), (3, 3), (8, 0), (0, 8), (-1, 3), (2, -1)])
+def test_play_rejects_invalid_moves(move):
+    with pytest.raises(ValueError):
+        Position.from_board(Board()).play(*move)
+
+
+def test_from_text_rejects_bad_input():
+    with pytest.raises(ValueError):
+        Position.from_text('X' * 63)
+    with pytest.raises(ValueError):
+        Position.from_text('Z' * 64 + ' X')
+    with pytest.raises(ValueError):
+        Position.from_text('.' * 64 + ' Q')
@@ -0,0 +1,40 @@
+# tests/test_probcut.py
+import os
+
+import ai
+from ai import INF
+from positions import midgame_positions
+from probcut import ProbCut
+from search_stats import SearchStats
+
+PARAMS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'probcut_ultimate.json')
+
+# Varsayılan eşik (1.5 sigma) bilerek risk alır ve bu sette bir hamleyi değiştirir;
+# kesmenin doğruluğu daha temkinli bir eşikle sınanır
+SAFE_THRESHOLD = 2.0
+
+
+def test_probcut_keeps_move_and_saves_nodes():
+    probcut = ProbCut.load(PARAMS, SAFE_THRESHOLD)
+    full_nodes = cut_nodes = 0
+    for depth in (4, 5):
+        for board, tile in midgame_positions():
+            full = SearchStats()
+            selective = SearchStats()
+            expected = ai.get_best_move(board.copy(), depth, tile, ai.evaluate_ultimate, stats=full,
+                                        endgame_empties=None)
+            move = ai.get_best_move(board.copy(), depth, tile, ai.evaluate_ultimate, stats=selective,
+                                    endgame_empties=None, probcut=probcut)
+            assert move == expected
+            full_nodes += full.nodes
+            cut_nodes += selective.nodes
+    assert cut_nodes < full_nodes
+
+
+def test_cut_skips_full_window():
+    probcut = ProbCut.load(PARAMS)
+    board, tile = midgame_positions()[0]
+    stats = SearchStats()
+    assert probcut.cut(board, 4, -INF, INF, tile, tile, ai.evaluate_ultimate, stats=stats) is None
+    assert probcut.cut(board, 4, 0, INF, tile, tile, ai.evaluate_ultimate, stats=stats) is None
+    assert stats.nodes == 0
@@ -0,0 +1,23 @@
+# tests/test_pvs.py
+import pytest
+
+import ai
+from ai import INF
+from board import Board, BLACK
+from positions import midgame_positions
+from transposition import TranspositionTable
+
+POSITIONS = [(Board(), BLACK)] + midgame_positions()
+
+
+@pytest.mark.parametrize('name', sorted(ai.HEURISTICS))
+@pytest.mark.parametrize('use_tt', [False, True])
+def test_pvs_matches_minimax(name, use_tt):
+    heuristic_func = ai.HEURISTICS[name]
+    for depth in (3, 4):
+        for board, tile in POSITIONS:
+            minimax_tt = TranspositionTable(1 << 16) if use_tt else None
+            pvs_tt = TranspositionTable(1 << 16) if use_tt else None
+            expected = ai.minimax(board.copy(), depth, -INF, INF, True, tile, heuristic_func, minimax_tt)
+            # Kökte sıradaki taraf oyuncunun kendisi: pvs skoru da oyuncunun açısından
+            assert ai.pvs(board.copy(), depth, -INF, INF, tile, tile, heuristic_func, pvs_tt) == expected
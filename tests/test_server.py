@@ -0,0 +1,169 @@
+# tests/test_server.py
+import asyncio
+import json
+
+from board import BLACK, WHITE
+from server import GameServer, MAX_LINE
+
+
+def run_server(scenario, **options):
+    """Sunucuyu rastgele bir portta açar, scenario(connect) bitince kapatır."""
+    async def main():
+        game_server = GameServer(workers=1, **options)
+        server = await asyncio.start_server(game_server.handle_client, '127.0.0.1', 0, limit=MAX_LINE)
+        port = server.sockets[0].getsockname()[1]
+        clients = []
+
+        async def connect():
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            clients.append(writer)
+            return Client(reader, writer)
+
+        try:
+            await scenario(connect)
+        finally:
+            for writer in clients:
+                writer.close()
+                await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
+            # Bağlantı görevleri EOF'u görüp bitsin
+            await asyncio.sleep(0.05)
+            game_server.close()
+
+    asyncio.run(main())
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send_raw(self, data):
+        self.writer.write(data)
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def request(self, **request):
+        return await self.send_raw(json.dumps(request).encode() + b'\n')
+
+
+def test_game_lifecycle():
+    async def scenario(connect):
+        client = await connect()
+        game = await client.request(op='new', ai=WHITE, heuristic='h1', depth=2, id=7)
+        assert game['ok'] and game['id'] == 7
+        assert game['turn'] == BLACK and game['ai_moves'] == []
+        assert game['score'] == [2, 2]
+
+        reply = await client.request(op='move', game=game['game'], move='d3')
+        assert reply['ok'] and len(reply['ai_moves']) == 1
+        assert reply['turn'] == BLACK and sum(reply['score']) == 6
+
+        # Sıra insandayken 'ai' hamle yapmaz
+        reply = await client.request(op='ai', game=game['game'])
+        assert reply['ok'] and reply['ai_moves'] == []
+
+        state = await client.request(op='state', game=game['game'])
+        assert state['board'] == reply['board']
+
+        assert (await client.request(op='close', game=game['game']))['ok']
+        assert not (await client.request(op='state', game=game['game']))['ok']
+
+    run_server(scenario)
+
+
+def test_ai_plays_first_as_black():
+    async def scenario(connect):
+        client = await connect()
+        game = await client.request(op='new', ai=BLACK, depth=1)
+        assert game['ok'] and len(game['ai_moves']) == 1 and game['turn'] == WHITE
+
+    run_server(scenario)
+
+
+def test_malformed_json_keeps_connection():
+    async def scenario(connect):
+        client = await connect()
+        reply = await client.send_raw(b'{"op": "new",\n')
+        assert not reply['ok'] and 'JSON' in reply['error']
+        reply = await client.send_raw(b'[1, 2]\n')
+        assert not reply['ok']
+        reply = await client.send_raw(b'\xff\xfe\n')
+        assert not reply['ok']
+        assert (await client.request(op='stats'))['ok']
+
+    run_server(scenario)
+
+
+def test_invalid_fields():
+    async def scenario(connect):
+        client = await connect()
+        invalid = [
+            dict(op='new', ai='Z'),
+            dict(op='new', heuristic='nope'),
+            dict(op='new', heuristic=['h1']),
+            dict(op='new', depth=0),
+            dict(op='new', depth=True),
+            dict(op='new', depth=2.5),
+            dict(op='new', time=-1),
+            dict(op='new', time='1'),
+            dict(op='state', game='1'),
+            dict(op='state', game=True),
+            dict(op='state', game=99),
+            dict(op='fly'),
+        ]
+        for request in invalid:
+            reply = await client.request(id=1, **request)
+            assert not reply['ok'] and reply['id'] == 1, request
+
+        game = await client.request(op='new', ai=WHITE, depth=1)
+        for move in ('z9', 'a1', 5, None):
+            reply = await client.request(op='move', game=game['game'], move=move)
+            assert not reply['ok'], move
+        reply = await client.request(op='move', game=game['game'], move='d3', time=0)
+        assert not reply['ok']
+        # Hatalı istekler oyunu değiştirmez
+        assert (await client.request(op='state', game=game['game']))['score'] == [2, 2]
+
+    run_server(scenario)
+
+
+def test_over_long_line_keeps_connection():
+    async def scenario(connect):
+        client = await connect()
+        reply = await client.send_raw(b'x' * (3 * MAX_LINE) + b'\n')
+        assert not reply['ok'] and 'uzun' in reply['error']
+        # Uzun satırın kalanı bir sonraki isteğe karışmaz
+        reply = await client.request(op='stats', id=2)
+        assert reply['ok'] and reply['id'] == 2
+
+    run_server(scenario)
+
+
+def test_close_requires_owner():
+    async def scenario(connect):
+        owner = await connect()
+        other = await connect()
+        game = await owner.request(op='new', ai=WHITE, depth=1)
+        assert not (await other.request(op='close', game=game['game']))['ok']
+        assert (await owner.request(op='state', game=game['game']))['ok']
+        assert (await owner.request(op='close', game=game['game']))['ok']
+
+    run_server(scenario)
+
+
+def test_busy_when_search_queue_is_full():
+    async def scenario(connect):
+        slow = await connect()
+        fast = await connect()
+        # İlk arama tek yeri süre limiti boyunca tutar; ikinci queue_timeout içinde yer bulamaz
+        first = asyncio.ensure_future(slow.request(op='new', ai=BLACK, time=1.0))
+        await asyncio.sleep(0.2)
+        reply = await fast.request(op='new', ai=BLACK, time=1.0)
+        assert not reply['ok'] and reply['error'].startswith('busy')
+        assert (await first)['ok']
+        stats = await fast.request(op='stats')
+        assert stats['rejected'] == 1 and stats['searches'] == 1
+
+    run_server(scenario, max_pending=1, queue_timeout=0.1)
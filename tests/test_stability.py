@@ -0,0 +1,47 @@
+# tests/test_stability.py
+import random
+
+from board import Board, BLACK, WHITE, stable_discs, score_upper_bound
+from endgame import EndgameSolver, random_endgame
+
+
+def test_stable_discs_never_flip():
+    for seed in range(100):
+        rng = random.Random(seed)
+        board = Board()
+        tile = BLACK
+        # Şimdiye kadar stabil bulunan taşlar: oyunun sonuna kadar renk değiştirmemeliler
+        stable_black = stable_white = 0
+        while True:
+            stable_black |= stable_discs(board.black, board.white)
+            stable_white |= stable_discs(board.white, board.black)
+            assert stable_black & ~board.black == 0
+            assert stable_white & ~board.white == 0
+
+            moves = board.get_valid_moves(tile)
+            other = WHITE if tile == BLACK else BLACK
+            if not moves:
+                if not board.has_valid_move(other):
+                    break
+                tile = other
+                continue
+            row, col = rng.choice(moves)
+            board.apply_move(row, col, tile)
+            tile = other
+
+
+def test_full_board_is_stable():
+    board = Board.from_bitboards(0x00000000FFFFFFFF, 0xFFFFFFFF00000000)
+    assert stable_discs(board.black, board.white) == board.black
+    assert stable_discs(board.white, board.black) == board.white
+
+
+def test_score_upper_bound_not_below_exact_result():
+    rng = random.Random(1)
+    for empties in (10, 11, 12, 13, 14):
+        for _ in range(2):
+            board, tile = random_endgame(empties, rng)
+            own, opp = (board.black, board.white) if tile == BLACK else (board.white, board.black)
+            score, _ = EndgameSolver().solve(board, tile)
+            assert score_upper_bound(own, opp) >= score
+            assert -score_upper_bound(opp, own) <= score
@@ -0,0 +1,53 @@
+# tests/test_symmetry.py
+import pytest
+
+import ai
+from board import Board, BLACK, WHITE, canonical, transform_mask
+from conftest import random_game
+from patterns import PATTERN_OFFSETS, PATTERNS, canonical_indices, pattern_self_symmetries
+from transposition import TranspositionTable
+
+POSITIONS = [position for seed in range(3) for position in random_game(seed)[::3]]
+
+SYMMETRIC_HEURISTICS = ['h1', 'h2', 'h3', 'hybrid', 'ultimate', 'pattern']
+
+
+def transformed(board, k):
+    return Board.from_bitboards(transform_mask(board.black, k), transform_mask(board.white, k))
+
+
+@pytest.mark.parametrize('name', SYMMETRIC_HEURISTICS)
+def test_heuristic_symmetry_invariant(name):
+    heuristic_func = ai.HEURISTICS[name]
+    for board, _ in POSITIONS:
+        for tile in (BLACK, WHITE):
+            score = heuristic_func(board, tile)
+            for k in range(1, 8):
+                assert heuristic_func(transformed(board, k), tile) == pytest.approx(score)
+
+
+def test_canonical_same_for_all_symmetries():
+    for board, _ in POSITIONS:
+        black, white, _ = canonical(board.black, board.white)
+        for k in range(8):
+            assert canonical(transform_mask(board.black, k), transform_mask(board.white, k))[:2] == (black, white)
+
+
+def test_symmetric_table_key():
+    tt = TranspositionTable(1 << 10, symmetric=True)
+    for board, tile in POSITIONS:
+        key, _ = tt.key(board, tile, BLACK)
+        for k in range(1, 8):
+            assert tt.key(transformed(board, k), tile, BLACK)[0] == key
+
+
+def test_pattern_canonical_indices_cover_self_symmetries():
+    canonical = canonical_indices()
+    for name, squares in PATTERNS:
+        offset = PATTERN_OFFSETS[name]
+        for perm in pattern_self_symmetries(squares):
+            for index in range(0, 3 ** len(squares), 7):
+                digits = [index // 3 ** digit % 3 for digit in range(len(squares))]
+                image = sum(value * 3 ** perm[digit] for digit, value in enumerate(digits))
+                assert canonical[offset + index] == canonical[offset + image]
+                assert canonical[offset + index] <= offset + min(index, image)
@@ -0,0 +1,68 @@
+# tests/test_transposition.py
+import pytest
+
+from board import Board, BLACK, WHITE
+from transposition import TranspositionTable, EXACT, LOWER, UPPER, REPLACE_ALWAYS
+
+
+def test_store_and_probe():
+    tt = TranspositionTable(1 << 10)
+    key, _ = tt.key(Board(), BLACK, BLACK)
+    assert tt.probe(key) is None
+    tt.store(key, 3, EXACT, 12.5, (2, 3))
+    assert tt.probe(key)[:5] == (key, 3, EXACT, 12.5, (2, 3))
+    assert tt.stats()['hits'] == 1 and tt.stats()['misses'] == 1
+
+
+def test_key_depends_on_side_and_perspective():
+    tt = TranspositionTable()
+    board = Board()
+    keys = {tt.key(board, current, player)[0] for current in (BLACK, WHITE) for player in (BLACK, WHITE)}
+    assert len(keys) == 4
+
+
+def test_other_position_in_slot_is_a_collision():
+    tt = TranspositionTable(16)
+    tt.store(5, 2, EXACT, 1.0, None)
+    assert tt.probe(5 + tt.size) is None
+    assert tt.stats()['collisions'] == 1
+
+
+def test_depth_replacement_within_search():
+    tt = TranspositionTable(16)
+    # Aynı aramada daha derin başka pozisyon korunur
+    tt.store(1, 5, EXACT, 1.0, None)
+    tt.store(1 + tt.size, 3, LOWER, 2.0, None)
+    assert tt.probe(1)[3] == 1.0
+    # Daha derin ya da eşit derinlikteki kayıt yazılır
+    tt.store(1 + tt.size, 5, UPPER, 3.0, None)
+    assert tt.probe(1 + tt.size)[3] == 3.0
+    # Aynı pozisyonun derin sonucu sığ sonuçla ezilmez
+    tt.store(1 + tt.size, 2, EXACT, 4.0, None)
+    assert tt.probe(1 + tt.size)[1:4] == (5, UPPER, 3.0)
+
+
+def test_old_generation_is_replaced():
+    tt = TranspositionTable(16)
+    tt.store(1, 8, EXACT, 1.0, None)
+    tt.new_search()
+    # Önceki aramanın derin kaydı sığ kayıtla değiştirilebilir
+    tt.store(1 + tt.size, 1, EXACT, 2.0, None)
+    entry = tt.probe(1 + tt.size)
+    assert entry[3] == 2.0 and entry[5] == tt.generation
+    assert tt.stats()['overwrites'] == 1
+
+
+def test_always_replacement():
+    tt = TranspositionTable(16, replacement=REPLACE_ALWAYS)
+    tt.store(1, 8, EXACT, 1.0, None)
+    tt.store(1 + tt.size, 1, EXACT, 2.0, None)
+    assert tt.probe(1 + tt.size)[3] == 2.0
+    tt.store(1 + tt.size, 0, LOWER, 3.0, None)
+    assert tt.probe(1 + tt.size)[1:4] == (0, LOWER, 3.0)
+
+
+def test_size_and_replacement_validation():
+    assert TranspositionTable(1000).size == 1024
+    with pytest.raises(ValueError):
+        TranspositionTable(replacement='never')
@@ -0,0 +1,223 @@
+# tournament.py
+import argparse
+import itertools
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ai
+from board import Board, BLACK, WHITE
+from positions import format_move
+from transposition import TranspositionTable
+
+
+def parse_player(spec):
+    """
+    'h1:3' -> derinlik 3, 'ultimate:0.5s' -> hamle başına 0.5 sn.
+    İsteğe bağlı kesin çözücü: 'ultimate:3:e12' -> 12 ya da daha az boş karede oyun sonu kesin çözülür.
+    Verilmezse kapalıdır: oyuncular sona kadar kendi heuristic'leriyle oynar (aksi halde herkes son
+    ENDGAME_EMPTIES kareyi aynı mükemmellikte oynar ve heuristic farkları sonuca daha az yansır).
+    İsteğe bağlı isim: 'hizli=ultimate:0.5s'.
+    """
+    name, _, rest = spec.rpartition('=')
+    heuristic, _, limit = rest.partition(':')
+    limit, _, endgame = limit.partition(':')
+    if heuristic not in ai.HEURISTICS or not limit or (endgame and not endgame.startswith('e')):
+        raise ValueError(f"Hatalı oyuncu tanımı: {spec!r} (örn: h1:3, ultimate:0.5s veya ultimate:3:e12)")
+
+    if limit.endswith('s'):
+        depth, time_limit = None, float(limit[:-1])
+    else:
+        depth, time_limit = int(limit), None
+
+    return {
+        'name': name or rest,
+        'heuristic': heuristic,
+        'depth': depth,
+        'time_limit': time_limit,
+        'endgame_empties': int(endgame[1:]) if endgame else None,
+    }
+
+
+def random_opening(plies, rng):
+    # Başlangıçtan rastgele plies hamle; oyun erken biterse baştan denenir
+    while True:
+        board = Board()
+        tile = BLACK
+        moves = []
+        for _ in range(plies):
+            valid = board.get_valid_moves(tile)
+            if not valid:
+                break
+            move = rng.choice(valid)
+            board.apply_move(move[0], move[1], tile)
+            moves.append(move)
+            tile = WHITE if tile == BLACK else BLACK
+        else:
+            return moves
+
+
+def play_headless(black_player, white_player, opening=()):
+    """
+    Ekrana yazmadan tek oyun oynar; (siyah taş, beyaz taş) döner.
+    Her oyuncu oyun boyunca kendi transposition table'ını kullanır. Oyuncunun 'endgame_empties' değeri
+    (yoksa None: kapalı) kesin çözücüye geçilen boş kare sayısıdır.
+    """
+    board = Board()
+    tile = BLACK
+    for row, col in opening:
+        board.apply_move(row, col, tile)
+        tile = WHITE if tile == BLACK else BLACK
+
+    players = {BLACK: black_player, WHITE: white_player}
+    tables = {BLACK: TranspositionTable(1 << 16), WHITE: TranspositionTable(1 << 16)}
+
+    while True:
+        black_moves, white_moves = board.get_moves_both()
+        if not black_moves and not white_moves:
+            return board.get_score()
+
+        if not (black_moves if tile == BLACK else white_moves):
+            tile = WHITE if tile == BLACK else BLACK
+            continue
+
+        player = players[tile]
+        move = ai.get_best_move(
+            board, player['depth'], tile, ai.HEURISTICS[player['heuristic']],
+            tt=tables[tile], time_limit=player['time_limit'], endgame_empties=player.get('endgame_empties'),
+        )
+        board.apply_move(move[0], move[1], tile)
+        tile = WHITE if tile == BLACK else BLACK
+
+
+def _play_task(task):
+    black_index, white_index, black_player, white_player, opening = task
+    black, white = play_headless(black_player, white_player, opening)
+    return black_index, white_index, black, white, opening
+
+
+def elo_ratings(players_count, results, iterations=200):
+    """
+    results: (i, j, i'nin skoru) listesi (1 galibiyet, 0.5 beraberlik, 0 mağlubiyet).
+    Bradley-Terry en çok olabilirlik tahmini; ortalama 0 olacak şekilde kaydırılır.
+    Hep kazanan/kaybeden oyuncu sonsuza gitmesin diye her oyuncuya 0 puanlı bir rakiple
+    sanal bir beraberlik eklenir.
+    """
+    ratings = [0.0] * players_count
+    scale = 400 / math.log(10)
+
+    for _ in range(iterations):
+        for i in range(players_count):
+            # Sanal beraberlik
+            p = 1 / (1 + 10 ** (-ratings[i] / 400))
+            score, expected, variance = 0.5, p, p * (1 - p)
+
+            for a, b, s in results:
+                if i not in (a, b):
+                    continue
+                opponent = b if a == i else a
+                my_score = s if a == i else 1 - s
+                p = 1 / (1 + 10 ** ((ratings[opponent] - ratings[i]) / 400))
+                score += my_score
+                expected += p
+                variance += p * (1 - p)
+
+            step = scale * (score - expected) / variance
+            ratings[i] += max(-100.0, min(100.0, step))
+
+        mean = sum(ratings) / players_count
+        ratings = [r - mean for r in ratings]
+
+    return ratings
+
+
+def run_tournament(players, openings=10, opening_plies=4, workers=None, seed=1):
+    """
+    Round-robin: her çift, her rastgele açılışı renkler değişerek iki kez oynar.
+    Dönen sözlük: wdl[i][j] = (galibiyet, beraberlik, mağlubiyet), elo, games_per_second.
+    """
+    rng = random.Random(seed)
+    opening_lines = [random_opening(opening_plies, rng) for _ in range(openings)]
+
+    tasks = []
+    for i, j in itertools.combinations(range(len(players)), 2):
+        for opening in opening_lines:
+            tasks.append((i, j, players[i], players[j], opening))
+            tasks.append((j, i, players[j], players[i], opening))
+
+    n = len(players)
+    wdl = [[[0, 0, 0] for _ in range(n)] for _ in range(n)]
+    games = []
+    elo_input = []
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for black_index, white_index, black, white, opening in executor.map(_play_task, tasks):
+            if black > white:
+                black_score = 1.0
+            elif black < white:
+                black_score = 0.0
+            else:
+                black_score = 0.5
+
+            for me, opp, score in ((black_index, white_index, black_score),
+                                   (white_index, black_index, 1 - black_score)):
+                wdl[me][opp][0 if score == 1 else 1 if score == 0.5 else 2] += 1
+
+            elo_input.append((black_index, white_index, black_score))
+            games.append({
+                'black': players[black_index]['name'],
+                'white': players[white_index]['name'],
+                'opening': ''.join(format_move(move) for move in opening),
+                'score': [black, white],
+            })
+    elapsed = time.perf_counter() - start
+
+    return {
+        'players': [player['name'] for player in players],
+        'wdl': wdl,
+        'elo': elo_ratings(n, elo_input),
+        'games': games,
+        'seconds': elapsed,
+        'games_per_second': len(games) / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def print_report(result):
+    names = result['players']
+    width = max(8, max(len(name) for name in names) + 1)
+
+    print("Galibiyet-Beraberlik-Mağlubiyet (satırdaki oyuncunun gözünden):")
+    print(' ' * width + ''.join(f"{name:>{width}}" for name in names))
+    for i, name in enumerate(names):
+        cells = []
+        for j in range(len(names)):
+            if i == j:
+                cells.append(f"{'-':>{width}}")
+            else:
+                w, d, l = result['wdl'][i][j]
+                cells.append(f"{f'{w}-{d}-{l}':>{width}}")
+        print(f"{name:<{width}}" + ''.join(cells))
+
+    print("\nElo tahmini:")
+    for name, rating in sorted(zip(names, result['elo']), key=lambda item: -item[1]):
+        print(f"  {name:<{width}} {rating:+7.0f}")
+
+    print(f"\n{len(result['games'])} oyun, {result['seconds']:.1f} sn, {result['games_per_second']:.2f} oyun/sn")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="AI yapılandırmaları arasında ekransız round-robin turnuva")
+    parser.add_argument('players', nargs='+',
+                        help="heuristic:derinlik ya da heuristic:süre(s), isteğe bağlı :e<boş kare> kesin çözücü "
+                             "(varsayılan kapalı), örn: h1:3 ultimate:0.5s ultimate:3:e12")
+    parser.add_argument('--openings', type=int, default=10, help="rastgele açılış sayısı (her biri renk değişerek 2 oyun)")
+    parser.add_argument('--opening-plies', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    players = [parse_player(spec) for spec in args.players]
+    print_report(run_tournament(players, args.openings, args.opening_plies, args.workers, args.seed))
@@ -0,0 +1,267 @@
+# train_patterns.py
+"""
+patterns.py ağırlıklarının çevrimdışı eğitimi.
+
+1. Rastgele açılışlardan self-play oyunları (varsayılan ultimate, derinlik 2; son ENDGAME_EMPTIES
+   kare kesin çözülür). Her pozisyon, oyunun son taş farkıyla etiketlenir ve iki tarafın açısından da
+   (taşlar yer değiştirip etiketin işareti çevrilerek) eğitime girer.
+2. Her evre için ayrı, seyrek en küçük kareler: ||A w - y||^2 + reg * ||w||^2, CGLS (normal denklemlerde
+   eşlenik gradyan) ile çözülür. A'nın her satırında pozisyonun desen indeksleri 1'dir; hiç görülmeyen
+   desenler 0 kalır, az görülenler reg ile sıfıra doğru çekilir.
+
+Çıktı varsayılan olarak pattern_weights.new.bin'e yazılır; depodaki pattern_weights.bin'in üzerine
+sadece açıkça --output ile yazılır.
+
+Kullanım:  python train_patterns.py --games 6000 --samples samples.bin --output pattern_weights.bin
+           python train_patterns.py --archive games.oar   (self-play yerine archive.py oyun arşivi)
+"""
+import argparse
+import os
+import random
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ai
+from archive import GameArchive
+from board import Board, BLACK, WHITE, BOARD_SIZE
+from patterns import PHASE_COUNT, WEIGHTS_PATH, PatternWeights, canonical_indices, pattern_features, phase_of
+from tournament import random_opening
+from transposition import TranspositionTable
+
+# Ridge katsayısı: az görülen desenleri sıfıra çeker; küçük değerlerde ağırlıklar self-play
+# pozisyonlarına aşırı uyar ve aramada görülen farklı pozisyonlarda kötü oynar
+DEFAULT_REG = 500.0
+
+# Evre sınırına bu kadar boş kare yakın pozisyonlar komşu evrenin eğitimine de girer
+DEFAULT_OVERLAP = 15
+
+# Eğitilen ağırlıkların varsayılan dosyası (değerlendirmenin okuduğu WEIGHTS_PATH değil)
+DEFAULT_OUTPUT = 'pattern_weights.new.bin'
+
+# Örnek dosyası kaydı: benim, rakip, boş kare, etiket
+SAMPLE = struct.Struct('<QQBb')
+
+
+def play_game(heuristic_name, depth, opening, epsilon, seed):
+    """
+    Tek self-play oyunu; [(benim, rakip, boş kare, etiket)] döner.
+    Oyunun rastgele seçilen bir anına kadar epsilon olasılıkla rastgele hamle oynanır ve pozisyonlar
+    kaydedilmez; sonrası normal arama (son ENDGAME_EMPTIES kare kesin çözülür) ve her pozisyon kaydedilir.
+    Böylece aramanın yapraklarında görülen kötü hamle sonrası pozisyonlar da veriye girer, etiket de
+    pozisyonun rastgele hamlelerle değil iyi oyunla sonucunu ölçer.
+    """
+    rng = random.Random(seed)
+    last_random = rng.randint(ai.ENDGAME_EMPTIES + 1, BOARD_SIZE * BOARD_SIZE - 4 - len(opening))
+    heuristic_func = ai.HEURISTICS[heuristic_name]
+    tt = TranspositionTable(1 << 16)
+
+    board = Board()
+    tile = BLACK
+    for row, col in opening:
+        board.apply_move(row, col, tile)
+        tile = WHITE if tile == BLACK else BLACK
+
+    seen = []
+    while True:
+        black_moves, white_moves = board.get_moves_both()
+        if not black_moves and not white_moves:
+            break
+        if not (black_moves if tile == BLACK else white_moves):
+            tile = WHITE if tile == BLACK else BLACK
+            continue
+
+        black, white = board.get_score()
+        empties = BOARD_SIZE * BOARD_SIZE - black - white
+        if empties <= last_random:
+            if tile == BLACK:
+                seen.append((board.black, board.white, empties, tile))
+            else:
+                seen.append((board.white, board.black, empties, tile))
+
+        if empties > last_random and rng.random() < epsilon:
+            move = rng.choice(board.get_valid_moves(tile))
+        else:
+            move = ai.get_best_move(board, depth, tile, heuristic_func, tt=tt)
+        board.apply_move(move[0], move[1], tile)
+        tile = WHITE if tile == BLACK else BLACK
+
+    black, white = board.get_score()
+    return [(own, opp, empties, black - white if tile == BLACK else white - black)
+            for own, opp, empties, tile in seen]
+
+
+def _play_task(task):
+    return play_game(*task)
+
+
+def generate_samples(games, heuristic_name='ultimate', depth=2, opening_plies=4, epsilon=0.3, seed=1,
+                     workers=None, progress=None):
+    """Self-play pozisyonları: [(benim, rakip, boş kare, etiket)]."""
+    rng = random.Random(seed)
+    tasks = [(heuristic_name, depth, random_opening(opening_plies, rng), epsilon, rng.getrandbits(32))
+             for _ in range(games)]
+
+    samples = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for index, game in enumerate(executor.map(_play_task, tasks)):
+            samples.extend(game)
+            if progress is not None:
+                progress(index + 1, games)
+    return samples
+
+
+def save_samples(path, samples):
+    with open(path, 'wb') as f:
+        for sample in samples:
+            f.write(SAMPLE.pack(*sample))
+
+
+def load_samples(path):
+    with open(path, 'rb') as f:
+        return list(SAMPLE.iter_unpack(f.read()))
+
+
+def fit_phase(rows, labels, reg=DEFAULT_REG, iterations=40):
+    """
+    CGLS: satırları seyrek (indeks listesi) A için (A^T A + reg * I) w = A^T y çözümü.
+    Sadece en az bir satırda görülen ağırlıklar tutulur: {indeks: ağırlık}.
+    """
+    used = {f for row in rows for f in row}
+    w = dict.fromkeys(used, 0.0)
+    r = list(labels)
+
+    def transpose_times(residuals):
+        s = dict.fromkeys(used, 0.0)
+        for row, value in zip(rows, residuals):
+            for f in row:
+                s[f] += value
+        return s
+
+    s = transpose_times(r)
+    p = dict(s)
+    gamma = sum(v * v for v in s.values())
+
+    for _ in range(iterations):
+        if gamma < 1e-9:
+            break
+        q = [sum(p[f] for f in row) for row in rows]
+        delta = sum(v * v for v in q) + reg * sum(v * v for v in p.values())
+        alpha = gamma / delta
+
+        for f in used:
+            w[f] += alpha * p[f]
+        r = [value - alpha * qv for value, qv in zip(r, q)]
+
+        s = transpose_times(r)
+        for f in used:
+            s[f] -= reg * w[f]
+        gamma_new = sum(v * v for v in s.values())
+        beta = gamma_new / gamma
+        gamma = gamma_new
+        for f in used:
+            p[f] = s[f] + beta * p[f]
+
+    return w
+
+
+def _mean_error(table, rows, labels):
+    if not rows:
+        return 0.0
+    return sum(abs(label - sum(table[f] for f in row)) for row, label in zip(rows, labels)) / len(rows)
+
+
+def _by_phase(samples, overlap=0):
+    """
+    Evre başına (desen indeksleri listesi, etiketler). Bir pozisyon, boş kare sayısı evrenin sınırlarına
+    overlap kadar yakın olan komşu evrelere de girer; her tablo daha çok veri görür ve evre geçişlerinde
+    skor sıçramaz. Her pozisyon iki taraftan da eklenir: heuristic'ler sırası kimde olursa olsun
+    player_tile açısından çağrılır. İndeksler kanoniktir: desenin kendi simetrisiyle eşleşen indeksler
+    tek ağırlık olarak eğitilir (PatternWeights.symmetrize ile açılır).
+    """
+    canonical = canonical_indices()
+    by_phase = [([], []) for _ in range(PHASE_COUNT)]
+    for own, opp, empties, label in samples:
+        features = [canonical[f] for f in pattern_features(own, opp)]
+        swapped = [canonical[f] for f in pattern_features(opp, own)]
+        for phase in range(PHASE_COUNT):
+            if phase_of(empties - overlap) <= phase <= phase_of(empties + overlap):
+                rows, labels = by_phase[phase]
+                rows.append(features)
+                labels.append(label)
+                rows.append(swapped)
+                labels.append(-label)
+    return by_phase
+
+
+def validate(weights, samples):
+    """Eğitimde kullanılmamış pozisyonlarda evre başına (örnek, ortalama mutlak hata)."""
+    return [(len(rows), _mean_error(weights.tables[phase], rows, labels))
+            for phase, (rows, labels) in enumerate(_by_phase(samples))]
+
+
+def train(samples, reg=DEFAULT_REG, iterations=40, overlap=DEFAULT_OVERLAP, progress=None):
+    """Evre başına fit_phase; PatternWeights ve evre başına (örnek, ortalama mutlak hata) döner."""
+    weights = PatternWeights()
+    report = []
+    for phase, (rows, labels) in enumerate(_by_phase(samples, overlap)):
+        table = weights.tables[phase]
+        if rows:
+            for f, value in fit_phase(rows, labels, reg, iterations).items():
+                table[f] = value
+        report.append((len(rows), _mean_error(table, rows, labels)))
+        if progress is not None:
+            progress(phase + 1, PHASE_COUNT)
+    weights.symmetrize()
+    return weights, report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Desen ağırlıklarını self-play pozisyonlarından eğitir")
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--heuristic', choices=sorted(ai.HEURISTICS), default='ultimate',
+                        help="self-play oyuncusunun heuristic'i")
+    parser.add_argument('--depth', type=int, default=2, help="self-play arama derinliği")
+    parser.add_argument('--opening-plies', type=int, default=4)
+    parser.add_argument('--epsilon', type=float, default=0.3, help="kayıttan önceki rastgele hamle olasılığı")
+    parser.add_argument('--reg', type=float, default=DEFAULT_REG, help="ridge düzenlileştirme katsayısı")
+    parser.add_argument('--overlap', type=int, default=DEFAULT_OVERLAP,
+                        help="komşu evrelerin eğitimine de giren boş kare payı")
+    parser.add_argument('--iterations', type=int, default=40, help="evre başına CGLS iterasyonu")
+    parser.add_argument('--holdout', type=float, default=0.1,
+                        help="doğrulama için ayrılan son oyunların oranı (örnekler oyun sırasıyla)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--samples', default=None,
+                        help="örnek dosyası: varsa self-play yerine okunur, yoksa üretilen örnekler yazılır")
+    parser.add_argument('--archive', default=None,
+                        help="archive.py oyun arşivi: self-play yerine arşivdeki oyunların tüm pozisyonları")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+                        help=f"ağırlık dosyası (varsayılan {DEFAULT_OUTPUT}); evaluate_pattern {WEIGHTS_PATH} okur")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.archive:
+        with GameArchive(args.archive) as archive:
+            samples = list(archive.iter_samples())
+    elif args.samples and os.path.exists(args.samples):
+        samples = load_samples(args.samples)
+    else:
+        samples = generate_samples(
+            args.games, args.heuristic, args.depth, args.opening_plies, args.epsilon, args.seed, args.workers,
+            progress=lambda done, total: print(f"\r{done}/{total} oyun", end='', flush=True),
+        )
+        print()
+        if args.samples:
+            save_samples(args.samples, samples)
+    print(f"{len(samples)} pozisyon ({time.perf_counter() - start:.1f} sn)")
+
+    split = int(len(samples) * (1 - args.holdout))
+    weights, report = train(samples[:split], args.reg, args.iterations, args.overlap)
+    weights.save(args.output)
+
+    held_out = validate(weights, samples[split:])
+    for phase, ((count, error), (_, held_error)) in enumerate(zip(report, held_out)):
+        print(f"evre {phase} (boş {10 * phase + 1}-{10 * phase + 10}): {count} örnek, "
+              f"ortalama hata {error:.2f} (doğrulama {held_error:.2f})")
+    print(f"{args.output} yazıldı ({time.perf_counter() - start:.1f} sn)")
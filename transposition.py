@@ -0,0 +1,135 @@
+# transposition.py
+from board import WHITE, FULL_MASK, ZOBRIST_WHITE_TO_MOVE, canonical
+
+# Bound tipleri
+EXACT = 0
+LOWER = 1  # skor en az bu kadar (beta kesmesi)
+UPPER = 2  # skor en fazla bu kadar (hiçbir hamle alpha'yı geçemedi)
+
+# Skorun kimin açısından tutulduğunu anahtara katar (minimax skorları player_tile'a göre)
+PERSPECTIVE_WHITE = 0x5BD1E9955BD1E995
+
+REPLACE_ALWAYS = 'always'
+REPLACE_DEPTH = 'depth'
+
+
+def search_key(board, current_tile, player_tile):
+    """Pozisyon + sıradaki taraf + değerlendirme perspektifi için tablo anahtarı."""
+    key = board.hash
+    if current_tile == WHITE:
+        key ^= ZOBRIST_WHITE_TO_MOVE
+    if player_tile == WHITE:
+        key ^= PERSPECTIVE_WHITE
+    return key
+
+
+def symmetric_search_key(board, current_tile, player_tile):
+    """
+    search_key'in simetriden bağımsız hali: (anahtar, k).
+    Anahtar tahtanın kanonik halinden hesaplanır, k tahtayı kanonik hale getiren simetridir;
+    tabloya yazılan hamleler kanonik yöndedir. Zobrist hash'i artımlı tutulamadığı için
+    kanonik bitboard çiftinin Python hash'i kullanılır (int'ler için süreçten bağımsız).
+    """
+    black, white, k = canonical(board.black, board.white)
+    key = hash((black, white)) & FULL_MASK
+    if current_tile == WHITE:
+        key ^= ZOBRIST_WHITE_TO_MOVE
+    if player_tile == WHITE:
+        key ^= PERSPECTIVE_WHITE
+    return key, k
+
+
+class TranspositionTable:
+    """
+    Sabit boyutlu transposition table.
+    Her slotta (key, depth, flag, score, move, generation) tuple'ı durur.
+    Skorlar heuristic fonksiyonuna bağlı olduğu için her heuristic/AI kendi tablosunu kullanmalı.
+
+    replacement:
+      - 'depth'  : slot bu aramadan ve daha derinse korunur, aksi halde üzerine yazılır
+      - 'always' : her zaman son yazılan kalır
+
+    symmetric: True ise simetrik pozisyonlar tek kaydı paylaşır (symmetric_search_key).
+    Anahtar her düğümde 8 simetri denenerek hesaplandığı için düğüm başına maliyeti artar;
+    simetrik pozisyonların sık olduğu açılışta işe yarar.
+    """
+
+    def __init__(self, size=1 << 18, replacement=REPLACE_DEPTH, symmetric=False):
+        if replacement not in (REPLACE_DEPTH, REPLACE_ALWAYS):
+            raise ValueError(f"Bilinmeyen replacement: {replacement}")
+
+        # Boyut 2'nin kuvvetine yuvarlanır, indeks = key & mask
+        bits = max(1, (size - 1).bit_length())
+        self.size = 1 << bits
+        self.mask = self.size - 1
+        self.replacement = replacement
+        self.symmetric = symmetric
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0  # slot dolu ama başka bir pozisyona ait
+        self.stores = 0
+        self.overwrites = 0  # başka pozisyonun kaydı silindi
+
+    def clear(self):
+        self.entries = [None] * self.size
+        self.generation = 0
+        self.reset_stats()
+
+    def new_search(self):
+        # Eski aramaların kayıtları depth'e bakılmadan değiştirilebilir hale gelir
+        self.generation += 1
+
+    def key(self, board, current_tile, player_tile):
+        # (anahtar, k); k simetri kapalıysa hep 0
+        if self.symmetric:
+            return symmetric_search_key(board, current_tile, player_tile)
+        return search_key(board, current_tile, player_tile), 0
+
+    def probe(self, key):
+        entry = self.entries[key & self.mask]
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] != key:
+            self.collisions += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(self, key, depth, flag, score, move):
+        index = key & self.mask
+        old = self.entries[index]
+
+        if old is not None and self.replacement == REPLACE_DEPTH:
+            # Aynı aramadan gelen daha derin başka bir pozisyonu koru
+            if old[0] != key and old[5] == self.generation and old[1] > depth:
+                return
+            # Aynı pozisyonun daha derin sonucunu sığ sonuçla ezme
+            if old[0] == key and old[1] > depth:
+                return
+
+        if old is not None and old[0] != key:
+            self.overwrites += 1
+        self.stores += 1
+        self.entries[index] = (key, depth, flag, score, move, self.generation)
+
+    def filled(self):
+        return sum(1 for entry in self.entries if entry is not None)
+
+    def stats(self):
+        probes = self.hits + self.misses + self.collisions
+        return {
+            'size': self.size,
+            'filled': self.filled(),
+            'hits': self.hits,
+            'misses': self.misses,
+            'collisions': self.collisions,
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+            'hit_rate': self.hits / probes if probes else 0.0,
+        }